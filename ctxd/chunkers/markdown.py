@@ -12,6 +12,10 @@ from .base import ChunkStrategy
 
 logger = logging.getLogger(__name__)
 
+# ATX header (# through ######) on its own line. Compiled once and run over the
+# whole document in a single pass; [^\S\n] keeps matches within one line.
+_HEADER_RE = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+
 
 class MarkdownChunker(ChunkStrategy):
     """
@@ -39,32 +43,23 @@ class MarkdownChunker(ChunkStrategy):
         lines = content.split("\n")
         chunks = []
 
-        current_chunk = []
-        current_start = 1
-        header_name = None
-
-        for i, line in enumerate(lines, 1):
-            # Check if line is a header (ATX style: # Header)
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-
-            if header_match:
-                # Save previous chunk
-                if current_chunk:
-                    chunks.append(self._make_chunk(
-                        current_chunk, current_start, i - 1, header_name
-                    ))
-
-                # Start new chunk
-                header_name = header_match.group(2).strip()
-                current_chunk = [line]
-                current_start = i
-            else:
-                current_chunk.append(line)
-
-        # Add final chunk
-        if current_chunk:
+        # Find header lines with one regex scan instead of a match per line
+        header_names: dict[int, str] = {}
+        line_no, pos = 1, 0
+        for header_match in _HEADER_RE.finditer(content):
+            line_no += content.count("\n", pos, header_match.start())
+            pos = header_match.start()
+            header_names[line_no] = header_match.group(2).strip()
+
+        # Each header starts a section; lines before the first header form
+        # their own unnamed section
+        bounds = sorted(header_names)
+        if not bounds or bounds[0] > 1:
+            bounds.insert(0, 1)
+        bounds.append(len(lines) + 1)
+        for start, next_start in zip(bounds, bounds[1:]):
             chunks.append(self._make_chunk(
-                current_chunk, current_start, len(lines), header_name
+                lines[start - 1:next_start - 1], start, next_start - 1, header_names.get(start)
             ))
 
         if chunks:
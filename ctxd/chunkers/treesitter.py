@@ -6,6 +6,7 @@ Supports Python, JavaScript, TypeScript, and Go.
 """
 
 import logging
+import threading
 from typing import Any, Optional, Callable
 from tree_sitter import Language, Parser, Node
 
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 # Fix 2: Lazy tree-sitter imports
 # Language modules are imported on-demand in _get_language() instead of at module load time
 
+# One parser per (thread, language). Parsers are not thread-safe, and the indexer
+# shares a single chunker per language across its worker threads.
+_parser_tls = threading.local()
+
 
 class TreeSitterChunker(ChunkStrategy):
     """
@@ -131,10 +136,6 @@ class TreeSitterChunker(ChunkStrategy):
                 f"Supported: {list(self.LANGUAGE_CONFIGS.keys())}"
             )
 
-        # Lazy-load language and initialize parser (Fix 2: Performance optimization)
-        self.language = self._get_language(language)
-        self.parser = Parser(self.language)
-
         # Get language-specific extractors
         self.name_extractor: Callable = getattr(self, self.config["name_extractor"])
         self.decorator_finder: Optional[Callable] = (
@@ -149,6 +150,30 @@ class TreeSitterChunker(ChunkStrategy):
             chunk_overlap=50
         )
 
+    @property
+    def language(self) -> Language:
+        """Tree-sitter language, loaded on first parse rather than at construction."""
+        return self._get_language(self.language_name)
+
+    @property
+    def parser(self) -> Parser:
+        """
+        Get this thread's parser for the chunker's language, reset for a new parse.
+
+        Returns:
+            Parser instance owned by the calling thread
+        """
+        parsers = getattr(_parser_tls, "parsers", None)
+        if parsers is None:
+            parsers = _parser_tls.parsers = {}
+
+        parser = parsers.get(self.language_name)
+        if parser is None:
+            parser = parsers[self.language_name] = Parser(self.language)
+        else:
+            parser.reset()
+        return parser
+
     def chunk(self, content: str, path: str) -> list[tuple[str, dict[str, Any]]]:
         """
         Split code into function/class chunks based on language.
@@ -6,13 +6,17 @@ Orchestrates file discovery, chunking, embedding generation, and storage.
 
 import hashlib
 import logging
+import mmap
+import multiprocessing
 import os
+import queue
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+import numpy as np
 import pathspec
 import concurrent.futures
-from threading import Lock
+from threading import Lock, Thread
 
 from .config import Config
 from .embeddings import EmbeddingModel
@@ -22,8 +26,124 @@ from .chunkers import TreeSitterChunker, MarkdownChunker, FallbackChunker, Chunk
 from .git_utils import GitUtils
 from .progress import ProgressReporter
 
+try:
+    import xxhash  # Optional: ~40x faster than cryptographic hashes
+except ImportError:
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
+# Block size for streaming file hashing
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+# 64-bit hashers for change detection by algorithm tag. Collision resistance
+# does not matter here; the hash only answers "did this file change since
+# last index?".
+_FILE_HASHERS = {"blake2b": lambda: hashlib.blake2b(digest_size=8)}
+if xxhash is not None:
+    _FILE_HASHERS["xxh3"] = xxhash.xxh3_64
+
+# Algorithm for new file hashes: xxh3 when xxhash is installed, else BLAKE2b
+_FILE_HASH_ALGORITHM = "xxh3" if xxhash is not None else "blake2b"
+
+
+def _new_file_hasher(algorithm: str = _FILE_HASH_ALGORITHM):
+    """Create a hasher for file change detection."""
+    return _FILE_HASHERS[algorithm]()
+
+
+def _file_digest(hasher, algorithm: str = _FILE_HASH_ALGORITHM) -> str:
+    """
+    Format a stored file hash as "<algorithm>:<hex digest>".
+
+    The tag records which algorithm produced the hash, so installing or
+    removing xxhash does not make every stored hash look changed.
+    """
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def _hash_text(text: str) -> str:
+    """Hash chunk text so unchanged chunks can reuse their stored embedding."""
+    hasher = _new_file_hasher()
+    hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _read_and_hash(file_path: str) -> tuple[str, str]:
+    """
+    Read a file's text and content hash from a single memory map.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (content decoded as UTF-8 with errors ignored, file_hash)
+    """
+    hasher = _new_file_hasher()
+    with open(file_path, "rb") as f:
+        # mmap cannot map zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return "", _file_digest(hasher)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                hasher.update(view)
+                content = str(view, "utf-8", errors="ignore")
+            finally:
+                view.release()
+
+    return content, _file_digest(hasher)
+
+
+# Per-process chunker cache for worker processes (tree-sitter parsers are not picklable)
+_worker_chunkers: dict[str, ChunkStrategy] = {}
+
+
+def _chunk_file_in_worker(
+    file_path: str,
+    language: str,
+    small_file_threshold: int,
+    max_chunk_size: int,
+    chunk_overlap: int,
+) -> tuple[str, list[tuple[str, dict[str, Any]]]]:
+    """
+    Read, hash, and chunk a single file inside a worker process.
+
+    Runs at module level so it can be pickled by ProcessPoolExecutor. Only
+    plain data (hash string and chunk tuples) is returned to the parent.
+
+    Args:
+        file_path: Absolute path to the file
+        language: Detected language name
+        small_file_threshold: Tree-sitter small file threshold
+        max_chunk_size: Maximum chunk size for fallback chunking
+        chunk_overlap: Overlap for fallback chunking
+
+    Returns:
+        Tuple of (file_hash, chunks_data); chunks_data is empty for empty files
+    """
+    content, file_hash = _read_and_hash(file_path)
+    if not content.strip():
+        return file_hash, []
+
+    chunker = _worker_chunkers.get(language)
+    if chunker is None:
+        if language == "markdown":
+            chunker = MarkdownChunker()
+        elif language in ("python", "javascript", "typescript", "go"):
+            chunker = TreeSitterChunker(
+                language,
+                small_file_threshold=small_file_threshold,
+                max_chunk_size=max_chunk_size
+            )
+        else:
+            chunker = FallbackChunker(max_chunk_size=max_chunk_size, chunk_overlap=chunk_overlap)
+        _worker_chunkers[language] = chunker
+
+    return file_hash, chunker.chunk(content, file_path)
+
 
 class Indexer:
     """
@@ -70,6 +190,7 @@ class Indexer:
         self._language_chunkers: dict[str, ChunkStrategy] = {}
         self._small_file_threshold = config.get("indexer", "small_file_threshold", default=50)
         self._max_chunk_size = config.get("indexer", "max_chunk_size", default=500)
+        self._chunk_overlap = config.get("indexer", "chunk_overlap", default=50)
 
         # Parallel processing configuration
         # Use fewer workers by default to reduce overhead (4-8 is usually optimal)
@@ -80,15 +201,45 @@ class Indexer:
         )
         self.parallel_enabled = config.get("performance", "parallel_enabled", default=True)
 
+        # Chunk files in worker processes so tree-sitter parsing escapes the GIL.
+        # Off by default: spawning workers costs more than it saves on small repos.
+        self.process_pool_enabled = config.get("performance", "process_pool", default=False)
+
         # Batch embedding configuration
         self.embedding_batch_size = config.get("embeddings", "batch_size", default=64)
         self.enable_batch_embedding = config.get("performance", "batch_embedding", default=True)
 
         # Thread-safe locks and queues for parallel processing
         self._stats_lock = Lock()
-        self._embedding_queue: list[tuple[str, dict, str, str]] = []  # (text, metadata, rel_path, file_hash)
+        # (text, metadata, rel_path, file_hash, language, chunk_hash, reusable vector or None)
+        self._embedding_queue: list[tuple] = []
         self._embedding_lock = Lock()
-        self._in_parallel_mode = False  # Flag to enable batch embedding in parallel mode
+        self._batch_mode = False  # Queue chunks and defer deletes during index_path
+
+        # Paths whose old chunks are deleted together with the next batch write,
+        # so a batch costs one delete commit instead of one per file
+        self._pending_deletes: set[str] = set()
+        self._pending_deletes_lock = Lock()
+
+        # Hash algorithms of stored hashes already warned about (see file_unchanged)
+        self._unavailable_hash_algorithms: set[str] = set()
+
+        # Embed/write pipeline: chunking threads hand full batches to an embedding
+        # thread, which hands CodeChunks to a writer thread. Bounded queues apply
+        # backpressure so chunking can't run arbitrarily far ahead.
+        self.pipeline_depth = config.get("performance", "pipeline_depth", default=4)
+
+        # Upper bound on chunks the writer merges into one add_chunks call when
+        # several embedded batches are waiting; fewer, larger Lance commits
+        self.max_write_batch = config.get("performance", "max_write_batch", default=4096)
+
+        # Minimum seconds between progress callbacks; per-file callbacks (e.g. a
+        # rich progress bar redraw) otherwise dominate on large repositories
+        self.progress_interval = config.get("performance", "progress_interval", default=0.1)
+        self._pipeline_active = False
+        self._embed_stage_queue: Optional[queue.Queue] = None
+        self._write_stage_queue: Optional[queue.Queue] = None
+        self._pipeline_threads: list[Thread] = []
 
     def _get_chunker(self, language: str) -> ChunkStrategy:
         """
@@ -171,11 +322,19 @@ class Indexer:
         # Create progress reporter if callback provided
         reporter = None
         if progress_callback:
-            reporter = ProgressReporter(len(files), callback=progress_callback)
+            reporter = ProgressReporter(
+                len(files),
+                callback=progress_callback,
+                min_interval_s=self.progress_interval,
+            )
 
         # Use parallel or serial processing based on configuration
         start_time = time.time()
-        if self.parallel_enabled and len(files) > 1:
+        if self.parallel_enabled and self.process_pool_enabled and len(files) > 1:
+            indexed_files, total_chunks, skipped_files = self._index_files_multiprocess(
+                files, base_path, force, reporter
+            )
+        elif self.parallel_enabled and len(files) > 1:
             indexed_files, total_chunks, skipped_files = self._index_files_parallel(
                 files, base_path, force, reporter
             )
@@ -193,9 +352,15 @@ class Indexer:
                 flush_time = time.time() - flush_start
                 logger.info(f"Flushed {flushed_chunks} remaining chunks from embedding queue ({flush_time:.2f}s)")
 
+        # Old chunks of files that produced no new chunks are still pending
+        self._apply_pending_deletes()
+
         # Clean up deleted files
         deleted_chunks = self._cleanup_deleted_files(base_path, files)
 
+        # Merge the fragments left behind by this run's writes
+        self.store.compact_if_fragmented()
+
         total_time = time.time() - start_time
         logger.info(
             f"Indexing complete: {indexed_files} files indexed, "
@@ -214,7 +379,7 @@ class Indexer:
         reporter: Optional[ProgressReporter]
     ) -> tuple[int, int, int]:
         """
-        Index files serially (original implementation).
+        Index files serially in the calling thread.
 
         Args:
             files: List of files to index
@@ -229,38 +394,48 @@ class Indexer:
         total_chunks = 0
         skipped_files = 0
 
-        for file_path in files:
-            try:
-                # Update progress
-                if reporter:
-                    reporter.update(str(file_path))
-
-                # Check if file should be indexed
-                if not self.should_index_file(file_path):
-                    skipped_files += 1
-                    continue
+        # Batch writes through the pipeline like the parallel path: one delete
+        # and one add per batch instead of per file
+        self._batch_mode = True
+        self._start_pipeline()
 
-                # Check if file changed (incremental indexing)
-                if not force:
-                    file_hash = self.compute_file_hash(file_path)
-                    stored_hash = self.store.get_file_hash(str(file_path.relative_to(base_path)))
-
-                    if stored_hash == file_hash:
-                        logger.debug(f"Skipping unchanged file: {file_path}")
+        try:
+            for file_path in files:
+                try:
+                    # Update progress
+                    if reporter:
+                        reporter.update(str(file_path))
+
+                    # Check if file should be indexed
+                    if not self.should_index_file(file_path):
                         skipped_files += 1
                         continue
 
-                # Index the file
-                chunks_added = self._index_file(file_path, base_path=base_path)
-                if chunks_added > 0:
-                    indexed_files += 1
-                    total_chunks += chunks_added
+                    # Check if file changed (incremental indexing)
+                    if not force:
+                        # Files with no stored hash are new: skip hashing them here
+                        stored_hash = self.store.get_file_hash(str(file_path.relative_to(base_path)))
 
-            except Exception as e:
-                logger.error(f"Failed to index {file_path}: {e}")
-                continue
+                        if self.file_unchanged(file_path, stored_hash):
+                            logger.debug(f"Skipping unchanged file: {file_path}")
+                            skipped_files += 1
+                            continue
 
-        return indexed_files, total_chunks, skipped_files
+                    # Index the file
+                    chunks_added = self._index_file(file_path, base_path=base_path, reuse_vectors=not force)
+                    if chunks_added > 0:
+                        indexed_files += 1
+                        total_chunks += chunks_added
+
+                except Exception as e:
+                    logger.error(f"Failed to index {file_path}: {e}")
+                    continue
+
+            return indexed_files, total_chunks, skipped_files
+
+        finally:
+            self._batch_mode = False
+            self._stop_pipeline()
 
     def _index_files_parallel(
         self,
@@ -289,7 +464,8 @@ class Indexer:
         logger.info(f"Using parallel indexing with {self.max_workers} workers")
 
         # Enable batch embedding mode for parallel processing
-        self._in_parallel_mode = True
+        self._batch_mode = True
+        self._start_pipeline()
 
         try:
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -329,8 +505,115 @@ class Indexer:
             return indexed_files, total_chunks, skipped_files
 
         finally:
-            # Disable batch embedding mode
-            self._in_parallel_mode = False
+            # Disable batch embedding mode and drain the pipeline
+            self._batch_mode = False
+            self._stop_pipeline()
+
+    def _index_files_multiprocess(
+        self,
+        files: list[Path],
+        base_path: Path,
+        force: bool,
+        reporter: Optional[ProgressReporter]
+    ) -> tuple[int, int, int]:
+        """
+        Index files with parsing and chunking spread across worker processes.
+
+        Change detection, embedding, and storage stay in the main process;
+        only the CPU-bound read/hash/chunk step runs in the pool.
+
+        Args:
+            files: List of files to index
+            base_path: Base path for relative path computation
+            force: Force re-indexing of unchanged files
+            reporter: Optional progress reporter
+
+        Returns:
+            Tuple of (indexed_files, total_chunks, skipped_files)
+        """
+        indexed_files = 0
+        total_chunks = 0
+        skipped_files = 0
+
+        # Filter unchanged/unindexable files before paying for IPC
+        changed_files = []
+        for file_path in files:
+            if not self.should_index_file(file_path):
+                skipped_files += 1
+                if reporter:
+                    reporter.update(str(file_path))
+                continue
+
+            if not force:
+                # Files with no stored hash are new: skip hashing them here
+                stored_hash = self.store.get_file_hash(str(file_path.relative_to(base_path)))
+                if self.file_unchanged(file_path, stored_hash):
+                    logger.debug(f"Skipping unchanged file: {file_path}")
+                    skipped_files += 1
+                    if reporter:
+                        reporter.update(str(file_path))
+                    continue
+
+            changed_files.append(file_path)
+
+        if not changed_files:
+            return indexed_files, total_chunks, skipped_files
+
+        logger.info(f"Using process pool chunking with {self.max_workers} workers")
+        languages = [self.detect_language(f) for f in changed_files]
+
+        self._start_pipeline()
+        try:
+            # Spawn rather than fork: the parent may already hold torch/OpenMP threads
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _chunk_file_in_worker,
+                        str(file_path),
+                        language,
+                        self._small_file_threshold,
+                        self._max_chunk_size,
+                        self._chunk_overlap,
+                    )
+                    for file_path, language in zip(changed_files, languages)
+                ]
+
+                for file_path, language, future in zip(changed_files, languages, futures):
+                    if reporter:
+                        reporter.update(str(file_path))
+
+                    try:
+                        file_hash, chunks_data = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to chunk {file_path}: {e}")
+                        continue
+
+                    rel_path = str(file_path.relative_to(base_path))
+                    if not chunks_data:
+                        # Emptied or comments-only: drop the old chunks, as the serial path does
+                        self._defer_delete(rel_path)
+                        skipped_files += 1
+                        continue
+
+                    reusable = {} if force else self.store.get_chunk_vectors(rel_path)
+                    self._defer_delete(rel_path)
+                    for text, metadata in chunks_data:
+                        chunk_hash = _hash_text(text)
+                        self._batch_embed_and_store(
+                            text, metadata, rel_path, file_hash, language,
+                            chunk_hash, reusable.get(chunk_hash)
+                        )
+
+                    indexed_files += 1
+                    total_chunks += len(chunks_data)
+        finally:
+            # Embeds and writes whatever is left over, even if batch embedding is disabled
+            self._stop_pipeline()
+
+        return indexed_files, total_chunks, skipped_files
 
     def _process_single_file(
         self,
@@ -356,15 +639,15 @@ class Indexer:
 
             # Check if file changed (incremental indexing)
             if not force:
-                file_hash = self.compute_file_hash(file_path)
+                # Files with no stored hash are new: skip hashing them here
                 stored_hash = self.store.get_file_hash(str(file_path.relative_to(base_path)))
 
-                if stored_hash == file_hash:
+                if self.file_unchanged(file_path, stored_hash):
                     logger.debug(f"Skipping unchanged file: {file_path}")
                     return {"status": "skipped", "reason": "unchanged"}
 
             # Index the file
-            chunks_added = self._index_file(file_path, base_path=base_path)
+            chunks_added = self._index_file(file_path, base_path=base_path, reuse_vectors=not force)
 
             if chunks_added > 0:
                 return {"status": "indexed", "chunks": chunks_added}
@@ -375,7 +658,16 @@ class Indexer:
             logger.error(f"Error processing {file_path}: {e}")
             return {"status": "error", "error": str(e)}
 
-    def _batch_embed_and_store(self, text: str, metadata: dict, rel_path: str, file_hash: str, language: str):
+    def _batch_embed_and_store(
+        self,
+        text: str,
+        metadata: dict,
+        rel_path: str,
+        file_hash: str,
+        language: str,
+        chunk_hash: str,
+        vector: Optional[list[float]] = None,
+    ):
         """
         Add a chunk to the embedding queue for batch processing.
 
@@ -385,10 +677,14 @@ class Indexer:
             rel_path: Relative file path
             file_hash: File hash
             language: Programming language
+            chunk_hash: Hash of the chunk text
+            vector: Previously stored embedding for identical text, if any
         """
         should_flush = False
         with self._embedding_lock:
-            self._embedding_queue.append((text, metadata, rel_path, file_hash, language))
+            self._embedding_queue.append(
+                (text, metadata, rel_path, file_hash, language, chunk_hash, vector)
+            )
 
             # Check if queue should be flushed
             if len(self._embedding_queue) >= self.embedding_batch_size:
@@ -396,7 +692,20 @@ class Indexer:
 
         # Flush queue outside the lock to avoid deadlock
         if should_flush:
-            self._flush_embedding_queue()
+            if self._pipeline_active:
+                # Hand the batch to the embedding thread; blocks when it falls behind
+                items = self._drain_embedding_queue()
+                if items:
+                    self._embed_stage_queue.put(items)
+            else:
+                self._flush_embedding_queue()
+
+    def _drain_embedding_queue(self) -> list[tuple]:
+        """Atomically take all queued chunks."""
+        with self._embedding_lock:
+            items = self._embedding_queue[:]
+            self._embedding_queue.clear()
+        return items
 
     def _flush_embedding_queue(self) -> int:
         """
@@ -405,37 +714,148 @@ class Indexer:
         Returns:
             Number of chunks processed
         """
-        with self._embedding_lock:
-            if not self._embedding_queue:
-                return 0
+        queue_copy = self._drain_embedding_queue()
+        if not queue_copy:
+            return 0
 
-            # Extract data from queue
-            queue_copy = self._embedding_queue[:]
-            self._embedding_queue.clear()
+        chunks = self._embed_queued_chunks(queue_copy)
+        if not chunks:
+            return 0
+
+        # Store chunks
+        try:
+            self._apply_pending_deletes()
+            self.store.add_chunks(chunks)
+            logger.debug(f"Flushed and stored {len(chunks)} chunks from embedding queue")
+        except Exception as e:
+            logger.error(f"Failed to store chunks: {e}")
+            return 0
+
+        return len(chunks)
+
+    def _defer_delete(self, rel_path: str) -> None:
+        """Schedule a file's old chunks for deletion before the next batch write."""
+        with self._pending_deletes_lock:
+            self._pending_deletes.add(rel_path)
+
+    def _apply_pending_deletes(self) -> int:
+        """
+        Delete old chunks of all files scheduled with _defer_delete.
+
+        Must run before writing a batch, because the batch may contain the new
+        chunks of those files.
+
+        Returns:
+            Number of chunks deleted
+        """
+        with self._pending_deletes_lock:
+            paths = sorted(self._pending_deletes)
+            self._pending_deletes.clear()
+
+        return self.store.delete_by_paths(paths)
+
+    def _start_pipeline(self) -> None:
+        """Start the embedding and writer threads."""
+        self._embed_stage_queue = queue.Queue(maxsize=self.pipeline_depth)
+        self._write_stage_queue = queue.Queue(maxsize=self.pipeline_depth)
+        self._pipeline_threads = [
+            Thread(target=self._embedding_stage, name="ctxd-embed", daemon=True),
+            Thread(target=self._write_stage, name="ctxd-write", daemon=True),
+        ]
+        for thread in self._pipeline_threads:
+            thread.start()
+        self._pipeline_active = True
+
+    def _stop_pipeline(self) -> None:
+        """Send any partial batch through the pipeline and wait for it to drain."""
+        if not self._pipeline_active:
+            return
+
+        self._pipeline_active = False
+        items = self._drain_embedding_queue()
+        if items:
+            self._embed_stage_queue.put(items)
+
+        # Sentinel propagates from the embedding stage to the writer stage
+        self._embed_stage_queue.put(None)
+        for thread in self._pipeline_threads:
+            thread.join()
+        self._pipeline_threads = []
+
+    def _embedding_stage(self) -> None:
+        """Pipeline stage: embed queued batches and pass chunks to the writer."""
+        while True:
+            items = self._embed_stage_queue.get()
+            if items is None:
+                self._write_stage_queue.put(None)
+                return
+            chunks = self._embed_queued_chunks(items)
+            if chunks:
+                self._write_stage_queue.put(chunks)
+
+    def _write_stage(self) -> None:
+        """
+        Pipeline stage: write embedded chunks to the store.
+
+        Batches that queued up while the previous write was running are
+        merged (up to max_write_batch chunks) into a single add_chunks call.
+        """
+        done = False
+        while not done:
+            chunks = self._write_stage_queue.get()
+            if chunks is None:
+                return
+
+            while len(chunks) < self.max_write_batch:
+                try:
+                    more = self._write_stage_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    done = True
+                    break
+                chunks = chunks + more
+
+            try:
+                self._apply_pending_deletes()
+                self.store.add_chunks(chunks)
+                logger.debug(f"Pipeline stored {len(chunks)} chunks")
+            except Exception as e:
+                logger.error(f"Failed to store chunks: {e}")
 
+    def _embed_queued_chunks(self, queue_copy: list[tuple]) -> list[CodeChunk]:
+        """
+        Generate embeddings for queued chunks and build CodeChunk objects.
+
+        Args:
+            queue_copy: Items of (text, metadata, rel_path, file_hash, language,
+                chunk_hash, vector)
+
+        Returns:
+            List of CodeChunk objects (empty if embedding failed)
+        """
         # Separate texts and metadata
         texts = [item[0] for item in queue_copy]
         metadatas = [item[1] for item in queue_copy]
         rel_paths = [item[2] for item in queue_copy]
         file_hashes = [item[3] for item in queue_copy]
         languages = [item[4] for item in queue_copy]
+        chunk_hashes = [item[5] for item in queue_copy]
 
-        # Generate embeddings in batch
+        # Generate embeddings in batch, skipping chunks with a reusable vector
         try:
-            embed_start = time.time()
-            embeddings = self.embeddings.embed_batch(texts, batch_size=self.embedding_batch_size)
-            embed_time = time.time() - embed_start
-            logger.debug(f"Generated {len(texts)} embeddings in {embed_time:.2f}s ({len(texts)/embed_time:.1f} chunks/s)")
+            embeddings = self._embed_missing(texts, [item[6] for item in queue_copy])
         except Exception as e:
             logger.error(f"Failed to generate embeddings for batch: {e}")
-            return 0
+            return []
 
-        # Create CodeChunk objects
+        # Create CodeChunk objects; fields come from our own chunkers and
+        # embedder, so per-field validation is skipped
         chunks = []
-        for i, (text, metadata, rel_path, file_hash, language, embedding) in enumerate(
-            zip(texts, metadatas, rel_paths, file_hashes, languages, embeddings)
+        for i, (text, metadata, rel_path, file_hash, language, chunk_hash, embedding) in enumerate(
+            zip(texts, metadatas, rel_paths, file_hashes, languages, chunk_hashes, embeddings)
         ):
-            chunk = CodeChunk(
+            chunk = CodeChunk.model_construct(
                 vector=embedding,
                 text=text,
                 path=rel_path,
@@ -445,19 +865,47 @@ class Indexer:
                 name=metadata.get("name"),
                 language=language,
                 file_hash=file_hash,
+                chunk_hash=chunk_hash,
                 branch=self.current_branch,
             )
             chunks.append(chunk)
 
-        # Store chunks
-        try:
-            self.store.add_chunks(chunks)
-            logger.debug(f"Flushed and stored {len(chunks)} chunks from embedding queue")
-        except Exception as e:
-            logger.error(f"Failed to store chunks: {e}")
-            return 0
+        return chunks
 
-        return len(chunks)
+    def _embed_missing(
+        self,
+        texts: list[str],
+        vectors: list[Optional[np.ndarray]]
+    ) -> list[np.ndarray]:
+        """
+        Fill in embeddings for texts that have no reusable vector.
+
+        Args:
+            texts: Chunk texts
+            vectors: Reusable vectors aligned with texts (None = must embed)
+
+        Returns:
+            Complete list of vectors aligned with texts
+        """
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if not missing:
+            logger.debug(f"Reused all {len(texts)} embeddings")
+            return list(vectors)
+
+        embed_start = time.time()
+        embedded = self.embeddings.embed_batch(
+            [texts[i] for i in missing], batch_size=self.embedding_batch_size, as_numpy=True
+        )
+        embed_time = time.time() - embed_start
+        logger.debug(
+            f"Generated {len(missing)} embeddings in {embed_time:.2f}s, "
+            f"reused {len(texts) - len(missing)}"
+        )
+
+        result = list(vectors)
+        for i, vector in zip(missing, embedded):
+            result[i] = vector
+        return result
 
     def _discover_files(self, root_path: Path) -> list[Path]:
         """
@@ -586,13 +1034,12 @@ class Indexer:
                 logger.debug("No deleted files to clean up")
                 return 0
 
-            # Delete chunks for each deleted file
-            total_deleted = 0
-            for deleted_file in deleted_files:
-                count = self.store.delete_by_path(deleted_file)
-                total_deleted += count
-                if count > 0:
-                    logger.info(f"Cleaned up {count} chunks for deleted file: {deleted_file}")
+            # Delete chunks for all deleted files in batched commits
+            total_deleted = self.store.delete_by_paths(sorted(deleted_files))
+            if total_deleted > 0:
+                logger.info(
+                    f"Cleaned up {total_deleted} chunks for {len(deleted_files)} deleted files"
+                )
 
             return total_deleted
 
@@ -600,38 +1047,45 @@ class Indexer:
             logger.error(f"Failed to cleanup deleted files: {e}")
             return 0
 
-    def _index_file(self, file_path: Path, base_path: Path) -> int:
+    def _index_file(self, file_path: Path, base_path: Path, reuse_vectors: bool = True) -> int:
         """
         Index a single file.
 
         Args:
             file_path: Path to the file
             base_path: Base path for computing relative paths
+            reuse_vectors: Reuse stored embeddings for chunks whose text is unchanged
 
         Returns:
             Number of chunks added
         """
-        # Read file content with graceful encoding error handling
+        # Read file content and hash in one pass, with graceful encoding error handling
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+            content, file_hash = _read_and_hash(str(file_path))
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}")
             return 0
 
-        # Skip empty files
+        # Get relative path
+        rel_path = str(file_path.relative_to(base_path))
+        batched = self.enable_batch_embedding and self._batch_mode
+
+        # Skip empty files, dropping the chunks of their old content
         if not content.strip():
             logger.debug(f"Skipping empty file: {file_path}")
+            if self.store.get_file_hash(rel_path) is not None:
+                if batched:
+                    self._defer_delete(rel_path)
+                else:
+                    self.store.delete_by_path(rel_path)
             return 0
 
-        # Compute file hash
-        file_hash = self.compute_file_hash(file_path)
-
-        # Get relative path
-        rel_path = str(file_path.relative_to(base_path))
-
-        # Delete old chunks for this file
-        self.store.delete_by_path(rel_path)
+        # Remember embeddings of the old chunks, then delete them
+        reusable = self.store.get_chunk_vectors(rel_path) if reuse_vectors else {}
+        if batched:
+            self._defer_delete(rel_path)
+        else:
+            self.store.delete_by_path(rel_path)
 
         # Detect language and select chunker (lazy-loaded)
         language = self.detect_language(file_path)
@@ -646,22 +1100,27 @@ class Indexer:
 
         # Use batch embedding only when processing multiple files in parallel
         # For single file or serial processing, embed immediately for backward compatibility
-        if self.enable_batch_embedding and hasattr(self, '_in_parallel_mode') and self._in_parallel_mode:
+        if batched:
             # Queue chunks for batch processing
             for text, metadata in chunks_data:
-                self._batch_embed_and_store(text, metadata, rel_path, file_hash, language)
+                chunk_hash = _hash_text(text)
+                self._batch_embed_and_store(
+                    text, metadata, rel_path, file_hash, language,
+                    chunk_hash, reusable.get(chunk_hash)
+                )
 
             logger.debug(f"Queued {len(chunks_data)} chunks from {file_path} for batch embedding")
             return len(chunks_data)
         else:
-            # Original immediate embedding approach
+            # Original immediate embedding approach, skipping unchanged chunks
             chunk_texts = [text for text, _ in chunks_data]
-            embeddings = self.embeddings.embed_batch(chunk_texts)
+            chunk_hashes = [_hash_text(text) for text in chunk_texts]
+            embeddings = self._embed_missing(chunk_texts, [reusable.get(h) for h in chunk_hashes])
 
-            # Create CodeChunk objects
+            # Create CodeChunk objects (trusted fields, validation skipped)
             chunks = []
-            for (text, metadata), embedding in zip(chunks_data, embeddings):
-                chunk = CodeChunk(
+            for (text, metadata), chunk_hash, embedding in zip(chunks_data, chunk_hashes, embeddings):
+                chunk = CodeChunk.model_construct(
                     vector=embedding,
                     text=text,
                     path=rel_path,
@@ -671,6 +1130,7 @@ class Indexer:
                     name=metadata.get("name"),
                     language=language,
                     file_hash=file_hash,
+                    chunk_hash=chunk_hash,
                     branch=self.current_branch,
                 )
                 chunks.append(chunk)
@@ -715,27 +1175,60 @@ class Indexer:
         ext = file_path.suffix.lower()
         return extension_map.get(ext, "unknown")
 
-    def compute_file_hash(self, file_path: Path) -> str:
+    def compute_file_hash(self, file_path: Path, algorithm: str = _FILE_HASH_ALGORITHM) -> str:
         """
-        Compute SHA256 hash of file content.
+        Compute a fast 64-bit content hash of a file (xxh3 or BLAKE2b).
 
         Args:
             file_path: Path to the file
+            algorithm: Hash algorithm tag ("xxh3" or "blake2b")
 
         Returns:
-            Hex digest of the hash
+            Hex digest of the hash, prefixed with the algorithm tag
         """
-        sha256 = hashlib.sha256()
+        hasher = _new_file_hasher(algorithm)
         try:
             with open(file_path, "rb") as f:
                 # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                for chunk in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    hasher.update(chunk)
+            return _file_digest(hasher, algorithm)
         except Exception as e:
             logger.error(f"Failed to compute hash for {file_path}: {e}")
             return ""
 
+    def file_unchanged(self, file_path: Path, stored_hash: Optional[str]) -> bool:
+        """
+        Check whether a file still matches its stored hash.
+
+        The file is re-hashed with the algorithm named in the stored hash, so
+        hashes written before xxhash was installed still match. Hashes from
+        an algorithm that is not available (xxh3 after xxhash was removed)
+        or without a tag (older indexes) count as changed, and a warning is
+        logged once per algorithm.
+
+        Args:
+            file_path: Path to the file
+            stored_hash: Hash stored with the file's chunks, or None if new
+
+        Returns:
+            True if the file can be skipped
+        """
+        if stored_hash is None:
+            return False
+
+        algorithm, _, _ = stored_hash.rpartition(":")
+        if algorithm not in _FILE_HASHERS:
+            if algorithm not in self._unavailable_hash_algorithms:
+                self._unavailable_hash_algorithms.add(algorithm)
+                logger.warning(
+                    f"Stored file hashes use {algorithm or 'an untagged format'}, which is not "
+                    f"available; affected files will be re-indexed with {_FILE_HASH_ALGORITHM}"
+                )
+            return False
+
+        return stored_hash == self.compute_file_hash(file_path, algorithm)
+
     def __repr__(self) -> str:
         """String representation."""
         return f"Indexer(store={self.store})"
@@ -125,7 +125,7 @@ def ctx_search(
         # Generate query embedding (needed for vector and hybrid modes)
         query_vector = None
         if search_mode in ["vector", "hybrid"]:
-            query_vector = get_embeddings().embed_batch([query])[0]
+            query_vector = get_embeddings().embed_text(query)
 
         # Get search parameters from config
         min_score = config.get("search", "min_score", default=0.3)
@@ -6,10 +6,13 @@ and indexing statistics.
 """
 
 import time
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
+import numpy as np
+from pydantic import BaseModel, Field, field_validator
 from lancedb.pydantic import LanceModel, Vector
 
+EMBEDDING_DIM = 384
+
 
 class CodeChunk(LanceModel):
     """
@@ -18,7 +21,10 @@ class CodeChunk(LanceModel):
     This model represents a semantically meaningful chunk of code/text
     that has been indexed for vector search.
     """
-    vector: Vector(384) = Field(description="Embedding vector from sentence-transformers")
+    vector: Optional[Vector(EMBEDDING_DIM)] = Field(
+        default=None,
+        description="Embedding vector from sentence-transformers (None on search results unless requested)",
+    )
     text: str = Field(description="The actual code/text content")
     path: str = Field(description="File path relative to project root")
     start_line: int = Field(description="Starting line number in original file", ge=1)
@@ -26,10 +32,21 @@ class CodeChunk(LanceModel):
     chunk_type: str = Field(description="Type: function, class, block, or paragraph")
     name: Optional[str] = Field(default=None, description="Function/class name if applicable")
     language: str = Field(description="Detected programming language")
-    file_hash: str = Field(description="SHA256 hash of source file for incremental indexing")
+    file_hash: str = Field(description="Content hash of source file for incremental indexing")
+    chunk_hash: Optional[str] = Field(default=None, description="Hash of chunk text for embedding reuse")
     indexed_at: float = Field(default_factory=time.time, description="Unix timestamp when indexed")
     branch: Optional[str] = Field(default=None, description="Git branch when indexed")
 
+    @field_validator("vector", mode="wrap")
+    @classmethod
+    def _keep_float32_array(cls, value: Any, handler: Any) -> Any:
+        """Keep float32 arrays packed instead of boxing every element."""
+        if isinstance(value, np.ndarray):
+            if value.shape != (EMBEDDING_DIM,):
+                raise ValueError(f"vector must have shape ({EMBEDDING_DIM},), got {value.shape}")
+            return value.astype(np.float32, copy=False)
+        return handler(value)
+
 
 class ChunkMetadata(BaseModel):
     """Metadata about a code chunk."""
@@ -6,9 +6,28 @@ Provides progress tracking with ETA calculation for indexing operations.
 
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Callable
 
 
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(total_secs: int) -> str:
+    """
+    Format whole seconds as "1h 15m", "2m 30s" or "45s".
+
+    Cached because throttled progress output formats the same few values
+    over and over.
+    """
+    hours, rem = divmod(total_secs, 3600)
+    minutes, secs = divmod(rem, 60)
+
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
 @dataclass
 class ProgressEvent:
     """
@@ -38,21 +57,35 @@ class ProgressReporter:
     - Tracks files processed and total count
     - Calculates files/second processing rate
     - Estimates time remaining (ETA)
-    - Emits events via callback for each file processed
+    - Emits events via callback, optionally throttled to a minimum interval
     """
 
-    def __init__(self, total_files: int, callback: Optional[Callable[[ProgressEvent], None]] = None):
+    def __init__(
+        self,
+        total_files: int,
+        callback: Optional[Callable[[ProgressEvent], None]] = None,
+        min_interval_s: float = 0.0,
+        copy_events: bool = True,
+    ):
         """
         Initialize progress reporter.
 
         Args:
             total_files: Total number of files to process
             callback: Optional callback function to receive ProgressEvents
+            min_interval_s: Minimum seconds between callback invocations
+                (0 = every update). The final file always triggers the callback.
+            copy_events: If False, one ProgressEvent is updated in place and
+                passed to every callback; callbacks that keep events must copy them.
         """
         self.total_files = total_files
         self.current_file = 0
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.callback = callback
+        self.min_interval_s = min_interval_s
+        self._last_emit: Optional[float] = None
+        self.copy_events = copy_events
+        self._event: Optional[ProgressEvent] = None
 
     def update(self, filename: str) -> ProgressEvent:
         """
@@ -65,7 +98,7 @@ class ProgressReporter:
             ProgressEvent with current statistics
         """
         self.current_file += 1
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
 
         # Calculate processing rate (avoid division by zero)
         files_per_second = self.current_file / elapsed if elapsed > 0 else 0
@@ -74,19 +107,38 @@ class ProgressReporter:
         remaining_files = self.total_files - self.current_file
         eta = remaining_files / files_per_second if files_per_second > 0 else None
 
-        # Create progress event
-        event = ProgressEvent(
-            current=self.current_file,
-            total=self.total_files,
-            filename=filename,
-            elapsed_seconds=elapsed,
-            eta_seconds=eta,
-            files_per_second=files_per_second
-        )
-
-        # Emit event via callback
+        if self.copy_events or self._event is None:
+            # Create progress event
+            event = ProgressEvent(
+                current=self.current_file,
+                total=self.total_files,
+                filename=filename,
+                elapsed_seconds=elapsed,
+                eta_seconds=eta,
+                files_per_second=files_per_second
+            )
+            if not self.copy_events:
+                self._event = event
+        else:
+            # Reuse the single event instead of allocating one per file
+            event = self._event
+            event.current = self.current_file
+            event.total = self.total_files
+            event.filename = filename
+            event.elapsed_seconds = elapsed
+            event.eta_seconds = eta
+            event.files_per_second = files_per_second
+
+        # Emit event via callback, at most once per min_interval_s
         if self.callback:
-            self.callback(event)
+            now = time.perf_counter()
+            if (
+                self._last_emit is None
+                or now - self._last_emit >= self.min_interval_s
+                or self.current_file >= self.total_files
+            ):
+                self._last_emit = now
+                self.callback(event)
 
         return event
 
@@ -104,20 +156,7 @@ class ProgressReporter:
         if seconds is None:
             return "unknown"
 
-        # Convert to integer seconds
-        total_secs = int(seconds)
-
-        # Calculate hours, minutes, seconds
-        minutes, secs = divmod(total_secs, 60)
-        hours, minutes = divmod(minutes, 60)
-
-        # Format based on magnitude
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        elif minutes > 0:
-            return f"{minutes}m {secs}s"
-        else:
-            return f"{secs}s"
+        return _format_whole_seconds(int(seconds))
 
     @staticmethod
     def format_duration(seconds: float) -> str:
@@ -133,14 +172,7 @@ class ProgressReporter:
         if seconds < 60:
             return f"{seconds:.1f}s"
 
-        total_secs = int(seconds)
-        minutes, secs = divmod(total_secs, 60)
-        hours, minutes = divmod(minutes, 60)
-
-        if hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m {secs}s"
+        return _format_whole_seconds(int(seconds))
 
     def get_summary(self) -> str:
         """
@@ -149,7 +181,7 @@ class ProgressReporter:
         Returns:
             Human-readable progress summary
         """
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         files_per_second = self.current_file / elapsed if elapsed > 0 else 0
 
         return (
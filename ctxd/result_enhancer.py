@@ -6,14 +6,63 @@ to improve search result quality.
 """
 
 import logging
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .models import SearchResult, CodeChunk
+import numpy as np
+
+from .models import SearchResult
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _line_bounds(path_str: str, mtime_ns: int) -> np.ndarray:
+    """
+    Index the byte offset where each line of a file starts.
+
+    The file is memory-mapped and scanned for newlines with NumPy, so no
+    Python string is built for the file. mtime_ns is part of the cache key
+    so edited files are re-indexed.
+
+    Args:
+        path_str: Absolute path to the file
+        mtime_ns: File modification time in nanoseconds
+
+    Returns:
+        Offsets where line i (1-indexed) spans bounds[i - 1]:bounds[i]
+    """
+    with open(path_str, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return np.zeros(1, dtype=np.int64)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            line_starts = np.flatnonzero(data == 0x0A) + 1
+            del data  # Release the buffer before the map closes
+
+    bounds = np.concatenate(([0], line_starts))
+    if bounds[-1] != size:
+        # Last line has no trailing newline
+        bounds = np.append(bounds, size)
+    return bounds
+
+
+def _read_line_range(path_str: str, bounds: np.ndarray, start_line: int, end_line: int) -> str:
+    """Read lines start_line..end_line (1-indexed, inclusive) of a file."""
+    if end_line < start_line:
+        return ''
+    start, end = int(bounds[start_line - 1]), int(bounds[end_line])
+    with open(path_str, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n')
+
+
 class ResultEnhancer:
     """
     Enhances search results with de-duplication, context expansion,
@@ -52,26 +101,32 @@ class ResultEnhancer:
         # De-duplicate within each file
         deduplicated = []
         for path, file_results in by_file.items():
+            if len(file_results) == 1:
+                deduplicated.extend(file_results)
+                continue
+
             # Sort by score (highest first)
             file_results.sort(key=lambda r: r.score, reverse=True)
 
-            kept = []
-            for result in file_results:
-                # Check if this result overlaps with any already kept
-                overlaps = False
-                for kept_result in kept:
-                    overlap = self._calculate_overlap(
-                        result.chunk.start_line, result.chunk.end_line,
-                        kept_result.chunk.start_line, kept_result.chunk.end_line
-                    )
-                    if overlap >= overlap_threshold:
-                        overlaps = True
-                        break
+            starts = np.fromiter((r.chunk.start_line for r in file_results), dtype=np.int64)
+            ends = np.fromiter((r.chunk.end_line for r in file_results), dtype=np.int64)
 
-                if not overlaps:
-                    kept.append(result)
+            # Hits in one file are usually distinct functions: if no two ranges
+            # touch (one sweep in start-line order), nothing can be dropped
+            if overlap_threshold > 0 and self._ranges_disjoint(starts, ends):
+                deduplicated.extend(file_results)
+                continue
 
-            deduplicated.extend(kept)
+            # All pairwise overlaps for this file in one vectorized pass
+            overlaps = self._overlap_matrix(starts, ends) >= overlap_threshold
+
+            # Keep a result unless it overlaps a higher-scoring result already kept
+            kept_idx: list[int] = []
+            for i in range(len(file_results)):
+                if not overlaps[i, kept_idx].any():
+                    kept_idx.append(i)
+
+            deduplicated.extend(file_results[i] for i in kept_idx)
 
         # Re-sort by score
         deduplicated.sort(key=lambda r: r.score, reverse=True)
@@ -104,42 +159,49 @@ class ResultEnhancer:
         if not results or not project_root:
             return results
 
+        # Hits usually cluster in a few files, so stat each path once
+        mtimes: dict[str, Optional[int]] = {}
+
         expanded = []
         for result in results:
             try:
                 # Construct full file path
-                file_path = project_root / result.chunk.path
+                file_path = str(project_root / result.chunk.path)
+
+                if file_path not in mtimes:
+                    try:
+                        mtimes[file_path] = os.stat(file_path).st_mtime_ns
+                    except FileNotFoundError:
+                        mtimes[file_path] = None
 
-                if not file_path.exists():
+                mtime_ns = mtimes[file_path]
+                if mtime_ns is None:
                     # Keep original if file not found
                     expanded.append(result)
                     continue
 
-                # Read the file
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
+                bounds = _line_bounds(file_path, mtime_ns)
+                num_lines = len(bounds) - 1
 
                 # Calculate expanded range
                 start_line = max(1, result.chunk.start_line - lines_before)
-                end_line = min(len(lines), result.chunk.end_line + lines_after)
-
-                # Extract expanded text (convert to 0-indexed)
-                expanded_text = ''.join(lines[start_line - 1:end_line])
-
-                # Create new chunk with expanded context
-                expanded_chunk = CodeChunk(
-                    text=expanded_text,
-                    path=result.chunk.path,
-                    start_line=start_line,
-                    end_line=end_line,
-                    language=result.chunk.language,
-                    chunk_type=result.chunk.chunk_type,
-                    name=result.chunk.name,
-                    vector=result.chunk.vector,  # 'vector' not 'embedding'
-                    file_hash=result.chunk.file_hash,
-                    indexed_at=result.chunk.indexed_at,
-                    branch=result.chunk.branch
-                )
+                end_line = min(num_lines, result.chunk.end_line + lines_after)
+
+                # Read only the expanded window from disk
+                expanded_text = _read_line_range(file_path, bounds, start_line, end_line)
+
+                if start_line > end_line:
+                    # File shrank since indexing; nothing to expand
+                    expanded.append(result)
+                    continue
+
+                # Copy the chunk with expanded context (vector may be omitted
+                # from search results, so don't re-validate it)
+                expanded_chunk = result.chunk.model_copy(update={
+                    "text": expanded_text,
+                    "start_line": start_line,
+                    "end_line": end_line,
+                })
 
                 expanded.append(SearchResult(chunk=expanded_chunk, score=result.score))
 
@@ -171,31 +233,69 @@ class ResultEnhancer:
         if not results or recency_weight == 0.0:
             return results
 
-        # Find min/max timestamps for normalization
-        timestamps = [r.chunk.indexed_at for r in results]
-        min_ts = min(timestamps)
-        max_ts = max(timestamps)
+        timestamps = np.fromiter((r.chunk.indexed_at for r in results), dtype=np.float64, count=len(results))
+        scores = np.fromiter((r.score for r in results), dtype=np.float64, count=len(results))
 
         # Avoid division by zero
-        ts_range = max_ts - min_ts
+        ts_range = timestamps.max() - timestamps.min()
         if ts_range == 0:
             return results
 
-        # Apply recency boost
-        reranked = []
-        for result in results:
-            # Normalize timestamp to 0-1 (1 = most recent)
-            normalized_recency = (result.chunk.indexed_at - min_ts) / ts_range
+        # Normalize timestamps to 0-1 (1 = most recent) and boost scores
+        # (cap at 1.0 to respect score constraints)
+        normalized_recency = (timestamps - timestamps.min()) / ts_range
+        boosted = np.minimum(1.0, scores + recency_weight * normalized_recency)
+
+        # Re-sort by boosted score; stable so ties keep their original order
+        order = np.argsort(-boosted, kind="stable")
 
-            # Boost score (cap at 1.0 to respect score constraints)
-            boosted_score = min(1.0, result.score + (recency_weight * normalized_recency))
+        return [SearchResult(chunk=results[i].chunk, score=float(boosted[i])) for i in order]
 
-            reranked.append(SearchResult(chunk=result.chunk, score=boosted_score))
+    @staticmethod
+    def _ranges_disjoint(starts: np.ndarray, ends: np.ndarray) -> bool:
+        """
+        Check whether no two line ranges share a line.
 
-        # Re-sort by boosted score
-        reranked.sort(key=lambda r: r.score, reverse=True)
+        Args:
+            starts: Start lines, shape (n,)
+            ends: End lines, shape (n,)
+
+        Returns:
+            True if every pair of ranges is disjoint
+        """
+        order = np.argsort(starts, kind="stable")
+        reach = np.maximum.accumulate(ends[order])
+        return bool(np.all(reach[:-1] < starts[order][1:]))
 
-        return reranked
+    @staticmethod
+    def _overlap_matrix(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Calculate percentage overlap between every pair of line ranges.
+
+        Vectorized equivalent of _calculate_overlap over all pairs.
+
+        Args:
+            starts: Start lines, shape (n,)
+            ends: End lines, shape (n,)
+
+        Returns:
+            Matrix of overlap percentages (0.0-1.0), shape (n, n)
+        """
+        overlap_lines = (
+            np.minimum(ends[:, None], ends[None, :])
+            - np.maximum(starts[:, None], starts[None, :])
+            + 1
+        )
+        lengths = ends - starts + 1
+        smaller_range = np.minimum(lengths[:, None], lengths[None, :])
+
+        valid = (overlap_lines > 0) & (smaller_range > 0)
+        return np.divide(
+            overlap_lines,
+            smaller_range,
+            out=np.zeros(overlap_lines.shape, dtype=np.float64),
+            where=valid,
+        )
 
     @staticmethod
     def _calculate_overlap(start1: int, end1: int, start2: int, end2: int) -> float:
@@ -6,16 +6,281 @@ Provides a clean interface over LanceDB for storing and searching code chunks.
 
 import hashlib
 import logging
+import math
+import posixpath
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 from functools import lru_cache
 import lancedb
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from lancedb.table import Table
 
+try:
+    from lancedb.rerankers import RRFReranker
+except ImportError:  # lancedb < 0.6 fuses hybrid results with its default reranker
+    RRFReranker = None
+
 from .models import CodeChunk, SearchResult, IndexStats
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of values per SQL IN (...) clause
+_IN_CLAUSE_BATCH_SIZE = 1000
+
+
+# Distance metric for vector search. Stored and query vectors are unit-length,
+# so dot product equals cosine similarity without per-candidate norms.
+_VECTOR_METRIC = "dot"
+
+# Scalar indexes built alongside the vector index so filter predicates are
+# resolved from an index instead of a column scan. BTREE suits high-cardinality
+# columns, BITMAP the low-cardinality ones.
+_SCALAR_INDEXES = {
+    "path": "BTREE",
+    "language": "BITMAP",
+    "chunk_type": "BITMAP",
+    "branch": "BITMAP",
+    "path_ext": "BITMAP",
+    "path_dir": "BITMAP",
+}
+
+# Physical row order of each write, so a branch's rows stay contiguous
+_CLUSTER_ORDER = [("branch", "ascending"), ("path", "ascending"), ("start_line", "ascending")]
+
+# Columns derived from ``path`` on insert (not part of CodeChunk) so extension
+# and top-level directory filters are equality lookups instead of string scans.
+# Tables created before they existed fall back to matching ``path``.
+_PATH_COLUMNS = ("path_ext", "path_dir")
+
+# With an ANN index, filters matching at least this fraction of rows are applied
+# after the index search (with over-fetch) instead of before it
+_POSTFILTER_MIN_SELECTIVITY = 0.1
+
+# Rows scored per block by exact/brute-force search; 4096 scores fit in L1 and
+# a block of 384-d float32 vectors (6 MB) streams through cache once
+_SCORE_BLOCK_ROWS = 4096
+
+# Low-cardinality string columns shared by many chunks; result rows reuse one
+# interned string per distinct value instead of a fresh copy per row
+_CATEGORICAL_FIELDS = ("path", "chunk_type", "language", "file_hash", "branch")
+
+# Reciprocal rank fusion constant for hybrid search: score = sum 1 / (k + rank)
+_RRF_K = 60
+
+# Supported storage types for the vector column of newly created tables
+_VECTOR_DTYPES = {"float32": pa.float32(), "float16": pa.float16()}
+
+# ANN index type per quantization scheme. "pq" compresses vectors into product
+# quantization codes; "int8" stores one scalar-quantized byte per dimension
+# (384 B instead of 1536 B) and keeps more recall than PQ.
+_VECTOR_INDEX_TYPES = {"pq": "IVF_PQ", "int8": "IVF_HNSW_SQ"}
+
+
+# Set bits per byte value, for Hamming distance on NumPy < 2.0
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _path_ext(path: str) -> str:
+    """Extension of the file name, e.g. '.py' ('' if none)."""
+    return posixpath.splitext(path)[1]
+
+
+def _path_dir(path: str) -> str:
+    """Top-level directory with trailing slash, e.g. 'src/' ('' at the root)."""
+    head, sep, _ = path.partition("/")
+    return head + sep if sep else ""
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize vectors along the last axis (zero vectors stay zero)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.clip(norms, 1e-12, None)
+
+
+def _binarize(vectors: np.ndarray) -> np.ndarray:
+    """Pack the sign of each dimension into bits (384 dims -> 48 bytes)."""
+    return np.packbits(vectors > 0, axis=-1)
+
+
+def _hamming_distances(bits: np.ndarray, query_bits: np.ndarray) -> np.ndarray:
+    """Count differing bits between each packed row and the packed query."""
+    xor = np.bitwise_xor(bits, query_bits)
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(xor).sum(axis=-1, dtype=np.uint32)
+    return _POPCOUNT[xor].sum(axis=-1, dtype=np.uint32)
+
+
+def _top_k_scores(
+    vectors: np.ndarray,
+    query_vector: np.ndarray,
+    k: int,
+    min_score: float = 0.0,
+    block_rows: int = _SCORE_BLOCK_ROWS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the ``k`` rows of ``vectors`` with the highest dot product.
+
+    Rows are scored in blocks so the score buffer stays cache-resident and
+    the matrix is streamed once; after each block only the running top-k
+    survives, so memory is O(block_rows + k) instead of O(N).
+
+    Args:
+        vectors: (N, d) candidate matrix
+        query_vector: (d,) query vector
+        k: Number of rows to keep
+        min_score: Drop rows scoring below this
+        block_rows: Rows scored per block
+
+    Returns:
+        (row indices, scores), best first
+    """
+    best_idx = np.empty(0, dtype=np.int64)
+    best_scores = np.empty(0, dtype=np.float32)
+    for start in range(0, len(vectors), block_rows):
+        block_scores = vectors[start:start + block_rows] @ query_vector
+        block_idx = np.arange(start, start + len(block_scores))
+        if min_score > 0:
+            passing = block_scores >= min_score
+            block_scores, block_idx = block_scores[passing], block_idx[passing]
+
+        scores = np.concatenate((best_scores, block_scores))
+        idx = np.concatenate((best_idx, block_idx))
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            scores, idx = scores[keep], idx[keep]
+        best_scores, best_idx = scores, idx
+
+    order = np.argsort(-best_scores, kind="stable")
+    return best_idx[order], best_scores[order]
+
+
+# Query-syntax characters of the tantivy FTS parser; code queries such as
+# "parse(config)" or "a::b" would otherwise fail to parse
+_FTS_SYNTAX = re.compile(r'[+\-!(){}\[\]^"~*?:\\/&|<>=]')
+
+
+@lru_cache(maxsize=1024)
+def _fts_query(text: str) -> str:
+    """Turn free text into a plain-terms FTS query, cached per distinct query."""
+    return " ".join(_FTS_SYNTAX.sub(" ", text).split())
+
+
+def _sql_quote(value: str) -> str:
+    """Quote a string literal for a LanceDB SQL predicate."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+@lru_cache(maxsize=256)
+def _build_filter(
+    file_filter: Optional[str],
+    branch_filter: Optional[str],
+    extensions: Optional[tuple[str, ...]],
+    directories: Optional[tuple[str, ...]],
+    chunk_types: Optional[tuple[str, ...]],
+    languages: Optional[tuple[str, ...]],
+    path_columns: bool = False,
+) -> Optional[str]:
+    """
+    Build the SQL WHERE predicate for a set of search filters.
+
+    Cached so repeated searches with the same filters reuse the predicate
+    string instead of rebuilding it per query.
+
+    Args:
+        file_filter: Substring or glob pattern matched against the path
+        branch_filter: Exact git branch
+        extensions: File extensions (e.g., (".py", ".js"))
+        directories: Directory prefixes (e.g., ("src/",))
+        chunk_types: Chunk types (e.g., ("function",))
+        languages: Languages (e.g., ("python",))
+        path_columns: Whether the table has the path_ext/path_dir columns
+
+    Returns:
+        Conditions combined with AND, or None if no filters are set
+    """
+    # Collect all filter conditions to combine them with AND
+    conditions = []
+
+    # Extension filter: equality on path_ext where the extension is a single
+    # suffix (".py"); compound ones (".d.ts") use one compiled suffix match
+    if extensions:
+        simple = [ext for ext in extensions if path_columns and _path_ext("f" + ext) == ext]
+        compound = [ext for ext in extensions if ext not in simple]
+        ext_conditions = []
+        if simple:
+            ext_conditions.append(f"path_ext IN ({', '.join(_sql_quote(ext) for ext in simple)})")
+        if compound:
+            suffixes = "|".join(re.escape(ext) for ext in compound)
+            ext_conditions.append(f"regexp_match(path, {_sql_quote(f'(?:{suffixes})$')})")
+        conditions.append(f"({' OR '.join(ext_conditions)})")
+
+    # Directory filter: equality on path_dir for top-level directories ("src/"),
+    # path LIKE 'src/app/%' for deeper ones
+    if directories:
+        top_level = [d for d in directories if path_columns and d and _path_dir(d) == d]
+        dir_conditions = [f"path LIKE {_sql_quote(d + '%')}" for d in directories if d not in top_level]
+        if top_level:
+            dir_conditions.insert(0, f"path_dir IN ({', '.join(_sql_quote(d) for d in top_level)})")
+        conditions.append(f"({' OR '.join(dir_conditions)})")
+
+    # Chunk type filter: IN clause
+    if chunk_types:
+        types_list = ", ".join(_sql_quote(t) for t in chunk_types)
+        conditions.append(f"chunk_type IN ({types_list})")
+
+    # Language filter: IN clause
+    if languages:
+        lang_list = ", ".join(_sql_quote(lang) for lang in languages)
+        conditions.append(f"language IN ({lang_list})")
+
+    # Substring match; glob wildcards map onto LIKE wildcards
+    if file_filter:
+        pattern = file_filter.replace("*", "%").replace("?", "_")
+        conditions.append(f"path LIKE {_sql_quote(f'%{pattern}%')}")
+
+    if branch_filter:
+        conditions.append(f"branch = {_sql_quote(branch_filter)}")
+
+    return " AND ".join(conditions) if conditions else None
+
+
+if RRFReranker is not None:
+    class _WeightedRRFReranker(RRFReranker):
+        """
+        Reciprocal rank fusion with a weight per result list.
+
+        A row scores ``2 * (1 - fts_weight) / (K + vector_rank) +
+        2 * fts_weight / (K + fts_rank)``. At fts_weight 0.5 this is plain
+        RRF, and ranking first in both lists scores 2 / (K + 1) for any weight.
+        """
+
+        def __init__(self, fts_weight: float, K: int = _RRF_K):
+            super().__init__(K=K)
+            self.fts_weight = fts_weight
+
+        def rerank_hybrid(self, query: str, vector_results: pa.Table, fts_results: pa.Table) -> pa.Table:
+            weights = (2.0 * (1.0 - self.fts_weight), 2.0 * self.fts_weight)
+            scores: dict[int, float] = defaultdict(float)
+            for results, weight in zip((vector_results, fts_results), weights):
+                if results:
+                    for rank, row_id in enumerate(results["_rowid"].to_pylist(), 1):
+                        scores[row_id] += weight / (rank + self.K)
+
+            combined = self.merge_results(vector_results, fts_results)
+            relevance = [scores[row_id] for row_id in combined["_rowid"].to_pylist()]
+            combined = combined.append_column("_relevance_score", pa.array(relevance, type=pa.float32()))
+            combined = combined.sort_by([("_relevance_score", "descending")])
+            if self.score == "relevance":
+                combined = self._keep_relevance_score(combined)
+            return combined
+
 
 class VectorStore:
     """
@@ -42,6 +307,10 @@ class VectorStore:
         self.table_name = table_name
         self._db: Optional[lancedb.DBConnection] = None
         self._table: Optional[Table] = None
+        # Guards lazy opening of the connection and table. Lance reads are
+        # snapshot-isolated, so one store serves concurrent searches and writes
+        # without a connection pool.
+        self._open_lock = threading.RLock()
 
         # Ensure parent directory exists (backward compatibility)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -51,10 +320,64 @@ class VectorStore:
             self.cache_enabled = config.get("cache_enabled", True) if isinstance(config, dict) else True
             self.cache_size = config.get("cache_size", 100) if isinstance(config, dict) else 100
             self.nprobes = config.get("nprobes", 20) if isinstance(config, dict) else 20
+            self.index_threshold = config.get("index_threshold", 50000) if isinstance(config, dict) else 50000
+            self.refine_factor = config.get("refine_factor", 4) if isinstance(config, dict) else 4
+            self.max_fragments = config.get("max_fragments", 64) if isinstance(config, dict) else 64
+            self.max_unindexed_rows = config.get("max_unindexed_rows", 5000) if isinstance(config, dict) else 5000
+            self.vector_dtype = config.get("vector_dtype", "float32") if isinstance(config, dict) else "float32"
+            self.quantization = config.get("quantization", "pq") if isinstance(config, dict) else "pq"
+            self.brute_force_threshold = config.get("brute_force_threshold", 10000) if isinstance(config, dict) else 10000
+            self.binary_oversample = config.get("binary_oversample", 0) if isinstance(config, dict) else 0
+            self.version_check_interval = config.get("version_check_interval", 1.0) if isinstance(config, dict) else 1.0
         else:
             self.cache_enabled = True
             self.cache_size = 100
             self.nprobes = 20
+            self.index_threshold = 50000
+            self.refine_factor = 4
+            self.max_fragments = 64
+            self.max_unindexed_rows = 5000
+            self.vector_dtype = "float32"
+            self.quantization = "pq"
+            self.brute_force_threshold = 10000
+            self.binary_oversample = 0
+            self.version_check_interval = 1.0
+
+        if self.vector_dtype not in _VECTOR_DTYPES:
+            raise ValueError(
+                f"Invalid vector_dtype: {self.vector_dtype}. Use one of {sorted(_VECTOR_DTYPES)}"
+            )
+        if self.quantization not in _VECTOR_INDEX_TYPES:
+            raise ValueError(
+                f"Invalid quantization: {self.quantization}. Use one of {sorted(_VECTOR_INDEX_TYPES)}"
+            )
+
+        # Whether an ANN vector index exists (None = not yet checked)
+        self._has_vector_index: Optional[bool] = None
+
+        # Whether the filter column indexes exist (None = not yet checked)
+        self._has_scalar_indexes: Optional[bool] = None
+
+        # Chunk counts per value of the filter columns, for selectivity
+        # estimates (None = not yet loaded; reset on every write)
+        self._filter_counts: Optional[dict[str, dict]] = None
+
+        # Whole table plus its vectors as one float32 matrix (and their sign
+        # bits if binary_oversample is set), for brute-force search of small
+        # unfiltered tables (None = not loaded; reset on writes)
+        self._flat_snapshot: Optional[tuple[pa.Table, np.ndarray, Optional[np.ndarray]]] = None
+        self._row_count: Optional[int] = None
+
+        # Table version the in-process caches were loaded from, and when it was
+        # last compared with the latest version written by any process
+        self._table_version: Optional[int] = None
+        self._version_checked_at = float("-inf")
+
+        # path -> file_hash for every indexed file (None = not yet loaded)
+        self._hash_cache: Optional[dict[str, str]] = None
+
+        # path -> [chunks, size_bytes, language, last_indexed] (None = not yet loaded)
+        self._file_stats: Optional[dict[str, list]] = None
 
         # Create LRU cache for queries (Phase 6)
         if self.cache_enabled:
@@ -64,44 +387,116 @@ class VectorStore:
     def db(self) -> lancedb.DBConnection:
         """Lazy-load the database connection."""
         if self._db is None:
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._db = lancedb.connect(str(self.db_path))
-            logger.info(f"Connected to LanceDB at {self.db_path}")
+            with self._open_lock:
+                if self._db is None:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._db = lancedb.connect(str(self.db_path))
+                    logger.info(f"Connected to LanceDB at {self.db_path}")
         return self._db
 
     @property
     def table(self) -> Table:
         """Get or create the code chunks table."""
         if self._table is None:
-            table_names = self.db.table_names()
-            if self.table_name in table_names:
-                self._table = self.db.open_table(self.table_name)
-                logger.debug(f"Opened existing table: {self.table_name}")
-            else:
-                # Create table with schema
-                # Handle race condition: multiple workers may try to create simultaneously
-                try:
-                    self._table = self.db.create_table(
-                        self.table_name,
-                        schema=CodeChunk,
-                        mode="create"
-                    )
-                    # Create FTS index for BM25 search
-                    try:
-                        self._table.create_fts_index("text", replace=True)
-                        logger.info(f"Created FTS index on 'text' column for {self.table_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to create FTS index: {e}")
-                    logger.info(f"Created new table: {self.table_name}")
-                except Exception as e:
-                    # Table was created by another worker, open it instead
-                    if "already exists" in str(e):
-                        logger.debug(f"Table {self.table_name} was created by another worker, opening it")
+            # One store is shared by concurrent searches; only one thread opens
+            with self._open_lock:
+                if self._table is None:
+                    table_names = self.db.table_names()
+                    if self.table_name in table_names:
                         self._table = self.db.open_table(self.table_name)
+                        logger.debug(f"Opened existing table: {self.table_name}")
                     else:
-                        raise
+                        # Create table with schema
+                        # Handle race condition: multiple workers may try to create simultaneously
+                        try:
+                            self._table = self.db.create_table(
+                                self.table_name,
+                                schema=self._table_schema(),
+                                mode="create"
+                            )
+                            # Create FTS index for BM25 search
+                            try:
+                                self._table.create_fts_index("text", replace=True)
+                                logger.info(f"Created FTS index on 'text' column for {self.table_name}")
+                            except Exception as e:
+                                logger.warning(f"Failed to create FTS index: {e}")
+                            logger.info(f"Created new table: {self.table_name}")
+                        except Exception as e:
+                            # Table was created by another worker, open it instead
+                            if "already exists" in str(e):
+                                logger.debug(f"Table {self.table_name} was created by another worker, opening it")
+                                self._table = self.db.open_table(self.table_name)
+                            else:
+                                raise
         return self._table
 
+    def _table_schema(self) -> pa.Schema:
+        """
+        Build the Arrow schema for a new table.
+
+        Follows CodeChunk, with the vector column stored as ``vector_dtype``.
+        float16 halves the bytes read per candidate during vector search;
+        vectors are converted on insert and scores stay in [0, 1]. The
+        derived path_ext/path_dir filter columns are appended.
+
+        Returns:
+            Arrow schema for the code chunks table
+        """
+        schema = CodeChunk.to_arrow_schema()
+        index = schema.get_field_index("vector")
+        field = schema.field(index)
+        vector_type = pa.list_(_VECTOR_DTYPES[self.vector_dtype], field.type.list_size)
+        schema = schema.set(index, field.with_type(vector_type))
+        for name in _PATH_COLUMNS:
+            schema = schema.append(pa.field(name, pa.string()))
+        return schema
+
+    def _sync_version(self, force: bool = False) -> None:
+        """
+        Pick up writes made to the table by other processes.
+
+        Checks out the latest table version, at most once per
+        ``version_check_interval`` seconds. If it is not the version the
+        in-process caches were loaded from (the CLI or watcher re-indexed
+        while this store was open), the caches are dropped and reloaded on
+        next use.
+
+        Args:
+            force: Check even within the interval; used before writes, whose
+                resulting version is recorded as current
+        """
+        now = time.monotonic()
+        if not force and now - self._version_checked_at < self.version_check_interval:
+            return
+        with self._open_lock:
+            self._version_checked_at = now
+            try:
+                self.table.checkout_latest()
+                version = self.table.version
+            except Exception as e:
+                logger.debug(f"Could not check table version: {e}")
+                return
+            if version != self._table_version:
+                if self._table_version is not None:
+                    logger.debug(f"Table {self.table_name} changed to version {version}, dropping caches")
+                self._table_version = version
+                self._drop_table_caches()
+
+    def _record_version(self) -> None:
+        """Mark the caches as current after a write made through this store."""
+        try:
+            self._table_version = self.table.version
+        except Exception:
+            self._table_version = None
+
+    def _drop_table_caches(self) -> None:
+        """Forget everything loaded from an older table version."""
+        self._has_vector_index = None
+        self._has_scalar_indexes = None
+        self._hash_cache = None
+        self._file_stats = None
+        self.clear_cache()
+
     def add_chunks(self, chunks: list[CodeChunk]) -> None:
         """
         Add code chunks to the store.
@@ -113,11 +508,30 @@ class VectorStore:
             return
 
         try:
-            # Convert to dict format for LanceDB
-            data = [chunk.model_dump() for chunk in chunks]
-            self.table.add(data)
+            # Drop caches of other processes' writes before updating them in place
+            self._sync_version(force=True)
+
+            # Cluster rows by branch, then file, so each branch occupies
+            # contiguous row ranges: branch filters read fewer pages and a
+            # branch delete can drop whole fragments instead of rewriting them
+            batch = self._chunks_to_arrow(chunks, self.table.schema)
+            self.table.add(batch.sort_by(_CLUSTER_ORDER))
             logger.info(f"Added {len(chunks)} chunks to {self.table_name}")
 
+            if self._hash_cache is not None:
+                for chunk in chunks:
+                    self._hash_cache[chunk.path] = chunk.file_hash
+            if self._file_stats is not None:
+                for chunk in chunks:
+                    self._count_chunk(
+                        self._file_stats, chunk.path, chunk.language, len(chunk.text), chunk.indexed_at
+                    )
+
+            # Build ANN and filter indexes once the corpus is large enough to benefit
+            self._maybe_build_vector_index()
+            self._maybe_build_scalar_indexes()
+            self._record_version()
+
             # Invalidate search cache since index has changed (Phase 6)
             self.clear_cache()
 
@@ -125,8 +539,149 @@ class VectorStore:
             logger.error(f"Failed to add chunks: {e}")
             raise
 
+    @staticmethod
+    def _chunks_to_arrow(chunks: list[CodeChunk], schema: pa.Schema) -> pa.Table:
+        """
+        Convert chunks to a columnar Arrow table matching the store schema.
+
+        Vectors are normalized as one float32 matrix and wrapped as a
+        fixed-size list column without a per-row Python round trip, so dot
+        product can be used at query time.
+
+        Args:
+            chunks: Chunks to convert
+            schema: Arrow schema of the target table
+
+        Returns:
+            Arrow table with one column per schema field
+        """
+        columns = []
+        for field in schema:
+            if field.name == "vector":
+                vectors = np.asarray([c.vector for c in chunks], dtype=np.float32)
+                # One shape check for the batch; chunks built with
+                # model_construct skip the per-chunk vector validation
+                if vectors.shape != (len(chunks), field.type.list_size):
+                    raise ValueError(
+                        f"Expected {field.type.list_size}-dim vectors, got shape {vectors.shape}"
+                    )
+                vectors = _normalize(vectors)
+                vectors = vectors.astype(field.type.value_type.to_pandas_dtype(), copy=False)
+                column = pa.FixedSizeListArray.from_arrays(
+                    pa.array(vectors.ravel()), vectors.shape[1]
+                ).cast(field.type)
+            elif field.name == "path_ext":
+                column = pa.array([_path_ext(c.path) for c in chunks], type=field.type)
+            elif field.name == "path_dir":
+                column = pa.array([_path_dir(c.path) for c in chunks], type=field.type)
+            else:
+                column = pa.array([getattr(c, field.name) for c in chunks], type=field.type)
+            columns.append(column)
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _maybe_build_vector_index(self) -> None:
+        """
+        Build an ANN index on the vector column once the table is large.
+
+        Below ``index_threshold`` rows a flat scan is fast enough and exact, so
+        no index is built. Above it, vectors are quantized into compact codes
+        (product or int8 scalar quantization, per ``quantization``) and only
+        ``nprobes`` partitions are searched. Candidates are re-scored against
+        the full-precision vectors, so quantization only affects recall.
+        """
+        if self._vector_index_ready():
+            return
+
+        num_rows = self.table.count_rows()
+        if num_rows < self.index_threshold:
+            return
+
+        index_type = _VECTOR_INDEX_TYPES[self.quantization]
+        index_args = {}
+        if index_type == "IVF_PQ":
+            dimension = self.table.schema.field("vector").type.list_size
+            index_args["num_sub_vectors"] = max(1, dimension // 16)
+        try:
+            self.table.create_index(
+                metric=_VECTOR_METRIC,
+                vector_column_name="vector",
+                num_partitions=max(1, int(math.sqrt(num_rows))),
+                index_type=index_type,
+                replace=True,
+                **index_args,
+            )
+            self._has_vector_index = True
+            logger.info(f"Built {index_type} vector index over {num_rows} chunks")
+        except Exception as e:
+            logger.warning(f"Failed to build vector index: {e}")
+
+    def _vector_index_ready(self) -> bool:
+        """
+        Whether the table has an ANN vector index.
+
+        Resolved from the table's index list on first use, so a store that
+        only searches an existing table (the MCP server, ``ctxd search``)
+        finds an index it did not build itself.
+        """
+        if self._has_vector_index is None:
+            try:
+                self._has_vector_index = any(
+                    "vector" in getattr(idx, "columns", [])
+                    for idx in self.table.list_indices()
+                )
+            except Exception:
+                self._has_vector_index = False
+        return self._has_vector_index
+
+    def _maybe_build_scalar_indexes(self) -> None:
+        """
+        Index the filter columns once the table is large.
+
+        Search filters are pushed down as WHERE predicates and pre-filter the
+        vector scan; with these indexes LanceDB resolves them without reading
+        the metadata columns of every row. Path deletes use the path index too.
+        """
+        if self._has_scalar_indexes is None:
+            try:
+                indexed = {col for idx in self.table.list_indices() for col in getattr(idx, "columns", [])}
+                self._has_scalar_indexes = all(col in indexed for col in self._scalar_index_columns())
+            except Exception:
+                self._has_scalar_indexes = False
+
+        if self._has_scalar_indexes or self.table.count_rows() < self.index_threshold:
+            return
+
+        # Only build what is missing: after a partial failure, the next add
+        # retries the failed columns without rebuilding the others
+        try:
+            indexed = {col for idx in self.table.list_indices() for col in getattr(idx, "columns", [])}
+        except Exception:
+            indexed = set()
+        missing = [column for column in self._scalar_index_columns() if column not in indexed]
+        built = []
+        for column in missing:
+            index_type = _SCALAR_INDEXES[column]
+            try:
+                self.table.create_scalar_index(column, index_type=index_type, replace=True)
+                built.append(column)
+            except Exception as e:
+                logger.warning(f"Failed to build {index_type} index on {column}: {e}")
+
+        if built:
+            logger.info(f"Built scalar indexes on {', '.join(built)}")
+        # Stays False after any failure, so the next add tries again
+        self._has_scalar_indexes = len(built) == len(missing)
+
+    def _scalar_index_columns(self) -> list[str]:
+        """Filter columns to index that exist in this table's schema."""
+        names = set(self.table.schema.names)
+        return [column for column in _SCALAR_INDEXES if column in names]
+
     def clear_cache(self) -> None:
-        """Clear the query cache (Phase 6)."""
+        """Clear the query cache (Phase 6), filter statistics and flat snapshot."""
+        self._filter_counts = None
+        self._flat_snapshot = None
+        self._row_count = None
         if self.cache_enabled and hasattr(self, '_cached_search'):
             try:
                 self._cached_search.cache_clear()
@@ -137,7 +692,7 @@ class VectorStore:
     def _generate_cache_key(
         self,
         query_text: Optional[str],
-        query_vector: Optional[list[float]],
+        query_vector: Optional[np.ndarray],
         limit: int,
         mode: str,
         **filters
@@ -147,7 +702,7 @@ class VectorStore:
 
         Args:
             query_text: Text query
-            query_vector: Vector query (only use first few values for key)
+            query_vector: Vector query (float32 array)
             limit: Result limit
             mode: Search mode
             **filters: Additional filter parameters
@@ -162,10 +717,9 @@ class VectorStore:
             f"text={query_text or ''}",
         ]
 
-        # Only include vector prefix for cache key (first 5 values)
-        if query_vector:
-            vector_prefix = str(query_vector[:5])
-            key_parts.append(f"vector_prefix={vector_prefix}")
+        # Include the full vector so queries sharing a prefix don't collide
+        if query_vector is not None:
+            key_parts.append(f"vector={query_vector.tobytes().hex()}")
 
         # Add all filters
         for key, value in sorted(filters.items()):
@@ -178,7 +732,7 @@ class VectorStore:
 
     def search(
         self,
-        query_vector: Optional[list[float]] = None,
+        query_vector: Optional[np.ndarray | list[float]] = None,
         limit: int = 10,
         file_filter: Optional[str] = None,
         branch_filter: Optional[str] = None,
@@ -193,34 +747,47 @@ class VectorStore:
         languages: Optional[list[str]] = None,
         # Phase 6: Cache control
         use_cache: bool = True,
+        include_vector: bool = False,
     ) -> list[SearchResult]:
         """
         Search for similar code chunks with multiple modes.
 
         Args:
-            query_vector: Query embedding vector for vector mode (backward compatible)
+            query_vector: Query embedding vector for vector mode (list or float32 array)
             limit: Maximum number of results
             file_filter: Optional glob pattern to filter files (backward compatible)
             branch_filter: Optional git branch filter (backward compatible)
             min_score: Minimum similarity score (0-1, backward compatible)
             query_text: Text query for hybrid/FTS mode (Phase 4)
             mode: Search mode - "vector", "fts", or "hybrid" (Phase 4, default: auto-detect)
-            fts_weight: Weight for BM25 in hybrid mode (Phase 4, 0.0-1.0, default: 0.5)
+            fts_weight: Weight of the BM25 ranking in hybrid fusion (Phase 4, 0.0-1.0,
+                default: 0.5 weighs keyword and vector rankings equally)
             extensions: Filter by file extensions (Phase 4, e.g., [".py", ".js"])
             directories: Filter by directory prefixes (Phase 4, e.g., ["src/", "lib/"])
             chunk_types: Filter by chunk type (Phase 4, e.g., ["function", "class"])
             languages: Filter by language (Phase 4, e.g., ["python", "javascript"])
             use_cache: Whether to use query cache (Phase 6, default: True)
+            include_vector: Return each chunk's embedding; otherwise the vector
+                column is not read and ``chunk.vector`` is None
 
         Returns:
             List of SearchResult objects ordered by relevance
         """
         try:
+            # Drop cached results and the flat snapshot if another process wrote
+            self._sync_version()
+
+            if query_vector is not None:
+                # Convert once; float32 arrays pass through without a copy
+                query_vector = np.ascontiguousarray(query_vector, dtype=np.float32)
+                if query_vector.size == 0:
+                    query_vector = None
+
             # Auto-detect mode if not specified
             if mode is None:
-                if query_text and query_vector:
+                if query_text and query_vector is not None:
                     mode = "hybrid"
-                elif query_vector:
+                elif query_vector is not None:
                     mode = "vector"
                 elif query_text:
                     mode = "fts"
@@ -240,13 +807,20 @@ class VectorStore:
                     file_filter=file_filter, branch_filter=branch_filter,
                     fts_weight=fts_weight, extensions=extensions,
                     directories=directories, chunk_types=chunk_types,
-                    languages=languages, min_score=min_score
+                    languages=languages, min_score=min_score,
+                    include_vector=include_vector
                 )
                 try:
+                    # Arguments must be hashable: vector as bytes, lists as tuples
                     results = self._cached_search(
-                        cache_key, query_text, query_vector, mode, limit, fts_weight,
-                        file_filter, branch_filter, extensions, directories,
-                        chunk_types, languages, min_score
+                        cache_key, query_text,
+                        query_vector.tobytes() if query_vector is not None else None,
+                        mode, limit, fts_weight, file_filter, branch_filter,
+                        tuple(extensions) if extensions else None,
+                        tuple(directories) if directories else None,
+                        tuple(chunk_types) if chunk_types else None,
+                        tuple(languages) if languages else None,
+                        min_score, include_vector
                     )
                     logger.debug(f"Search cache hit for key={cache_key[:8]}...")
                     return results
@@ -257,14 +831,17 @@ class VectorStore:
             # Execute search without cache
             if mode == "vector":
                 results = self._search_vector(query_vector, limit, file_filter, branch_filter,
-                                             extensions, directories, chunk_types, languages)
+                                             extensions, directories, chunk_types, languages,
+                                             min_score=min_score, include_vector=include_vector)
             elif mode == "fts":
                 results = self._search_fts(query_text, limit, file_filter, branch_filter,
-                                          extensions, directories, chunk_types, languages)
+                                          extensions, directories, chunk_types, languages,
+                                          min_score=min_score, include_vector=include_vector)
             elif mode == "hybrid":
                 results = self._search_hybrid(query_text, query_vector, limit, fts_weight,
                                              file_filter, branch_filter, extensions, directories,
-                                             chunk_types, languages)
+                                             chunk_types, languages, min_score=min_score,
+                                             include_vector=include_vector)
             else:
                 raise ValueError(f"Invalid search mode: {mode}. Use 'vector', 'fts', or 'hybrid'")
 
@@ -282,7 +859,7 @@ class VectorStore:
         self,
         cache_key: str,
         query_text: Optional[str],
-        query_vector: Optional[list[float]],
+        query_vector: Optional[bytes],
         mode: str,
         limit: int,
         fts_weight: float,
@@ -293,22 +870,29 @@ class VectorStore:
         chunk_types: Optional[tuple],
         languages: Optional[tuple],
         min_score: float,
+        include_vector: bool = False,
     ) -> list[SearchResult]:
         """
         Internal cached search implementation.
         This method is wrapped with lru_cache for performance.
         """
+        if query_vector is not None:
+            query_vector = np.frombuffer(query_vector, dtype=np.float32)
+
         # Route to appropriate search method
         if mode == "vector":
             results = self._search_vector(query_vector, limit, file_filter, branch_filter,
-                                         extensions, directories, chunk_types, languages)
+                                         extensions, directories, chunk_types, languages,
+                                         min_score=min_score, include_vector=include_vector)
         elif mode == "fts":
             results = self._search_fts(query_text, limit, file_filter, branch_filter,
-                                      extensions, directories, chunk_types, languages)
+                                      extensions, directories, chunk_types, languages,
+                                      min_score=min_score, include_vector=include_vector)
         elif mode == "hybrid":
             results = self._search_hybrid(query_text, query_vector, limit, fts_weight,
                                          file_filter, branch_filter, extensions, directories,
-                                         chunk_types, languages)
+                                         chunk_types, languages, min_score=min_score,
+                                         include_vector=include_vector)
         else:
             raise ValueError(f"Invalid search mode: {mode}")
 
@@ -317,22 +901,156 @@ class VectorStore:
 
     def _search_vector(
         self,
-        query_vector: list[float],
+        query_vector: np.ndarray,
         limit: int,
         file_filter: Optional[str],
         branch_filter: Optional[str],
         extensions: Optional[list[str]],
         directories: Optional[list[str]],
         chunk_types: Optional[list[str]],
-        languages: Optional[list[str]]
+        languages: Optional[list[str]],
+        min_score: float = 0.0,
+        include_vector: bool = False,
     ) -> list[SearchResult]:
-        """Perform pure vector similarity search."""
-        query = self.table.search(query_vector).limit(limit)
+        """
+        Perform pure vector similarity search.
+
+        Rows scoring below ``min_score`` are dropped on the Arrow side so
+        they are never converted to Python objects.
+        """
+        query_vector = _normalize(np.asarray(query_vector, dtype=np.float32))
+        indexed = self._vector_index_ready()
+        if not (indexed or file_filter or branch_filter or extensions
+                or directories or chunk_types or languages):
+            snapshot = self._load_flat_snapshot()
+            if snapshot is not None:
+                rows, vectors, bits = snapshot
+                fetch = limit * self.binary_oversample
+                if bits is not None and len(vectors) > fetch:
+                    # First pass on 48-byte sign codes; only the survivors are
+                    # scored exactly
+                    distances = _hamming_distances(bits, _binarize(query_vector))
+                    candidates = np.sort(np.argpartition(distances, fetch - 1)[:fetch])
+                    rows, vectors = rows.take(candidates), vectors[candidates]
+                results = self._rescore_exact(rows, query_vector, limit, min_score,
+                                              include_vector=include_vector, vectors=vectors)
+                return self._convert_results(results, score_type="distance")
+
+        query = self.table.search(query_vector).metric(_VECTOR_METRIC)
+        prefilter = True
+        if indexed:
+            # PQ distances are approximate: over-fetch, then re-score exactly
+            fetch = limit * self.refine_factor
+            if not (file_filter or extensions or directories):
+                # Broad equality filters: search the index unfiltered and drop
+                # non-matching candidates, over-fetching by 1 / selectivity
+                selectivity = self._estimate_selectivity(branch_filter, chunk_types, languages)
+                if selectivity >= _POSTFILTER_MIN_SELECTIVITY:
+                    prefilter = False
+                    fetch = math.ceil(fetch / selectivity)
+            query = query.nprobes(self.nprobes).limit(fetch)
+        else:
+            query = query.limit(limit)
+        # Exact re-scoring reads the candidate vectors, so keep them for it
+        query = self._select_columns(query, include_vector or indexed)
+        # Pre-filter so the vector scan only scores rows matching the metadata
         query = self._apply_filters(query, file_filter, branch_filter, extensions,
-                                    directories, chunk_types, languages)
-        results = query.to_list()
+                                    directories, chunk_types, languages, prefilter=prefilter)
+        if indexed:
+            results = self._rescore_exact(query.to_arrow(), query_vector, limit, min_score,
+                                          include_vector=include_vector)
+        elif min_score > 0:
+            # Dot distance is 1 - score and rows come back nearest first, so
+            # every row within 1 - min_score is a prefix found by binary search
+            candidates = query.to_arrow()
+            distances = candidates.column("_distance").to_numpy()
+            cutoff = int(np.searchsorted(distances, 1.0 - min_score, side="right"))
+            results = candidates.slice(0, cutoff).to_pylist()
+        else:
+            results = query.to_list()
         return self._convert_results(results, score_type="distance")
 
+    @staticmethod
+    def _rescore_exact(
+        candidates,
+        query_vector: np.ndarray,
+        limit: int,
+        min_score: float = 0.0,
+        include_vector: bool = True,
+        vectors: Optional[np.ndarray] = None,
+    ) -> list[dict]:
+        """
+        Re-rank ANN candidates by exact dot product and keep the top ``limit``.
+
+        Scores the candidates' vectors in blocks, keeping a running top-k
+        with ``argpartition``, so only the surviving rows are converted to
+        Python dicts.
+
+        Args:
+            candidates: Arrow table of candidate rows (including ``vector``)
+            query_vector: Normalized query vector
+            limit: Number of rows to keep
+            min_score: Drop candidates scoring below this before the top-k
+            include_vector: Keep the ``vector`` column in the returned rows
+            vectors: Candidate vectors already unpacked as a matrix, if known
+
+        Returns:
+            Rows ordered by exact score, with ``_distance`` set to 1 - dot
+        """
+        k = min(limit, candidates.num_rows)
+        if k <= 0:
+            return []
+
+        if vectors is None:
+            vectors = (
+                candidates.column("vector").combine_chunks().flatten()
+                .to_numpy(zero_copy_only=False)
+                .reshape(candidates.num_rows, -1)
+            )
+        top, scores = _top_k_scores(vectors, query_vector, k, min_score)
+        if len(top) == 0:
+            return []
+
+        top_rows = candidates.take(top)
+        if not include_vector:
+            top_rows = top_rows.drop_columns(["vector"])
+        rows = top_rows.to_pylist()
+        for row, score in zip(rows, scores):
+            row["_distance"] = float(1.0 - score)
+        return rows
+
+    def _load_flat_snapshot(self) -> Optional[tuple[pa.Table, np.ndarray, Optional[np.ndarray]]]:
+        """
+        Load a small table into memory for brute-force vector search.
+
+        Up to ``brute_force_threshold`` rows, one float32 matrix-vector product
+        over the cached vectors is faster than a LanceDB scan per query. With
+        ``binary_oversample`` set, vectors are also binarized to sign bits
+        (48 bytes each) for a Hamming-distance first pass that keeps
+        ``limit * binary_oversample`` candidates. The snapshot and the row
+        count deciding whether to take one are dropped by clear_cache on
+        every write, including writes by other processes (see _sync_version).
+
+        Returns:
+            (rows, float32 vector matrix, packed sign bits or None), or None
+            if the table is too large
+        """
+        if self._flat_snapshot is None:
+            if self._row_count is None:
+                self._row_count = self.table.count_rows()
+            if self._row_count > self.brute_force_threshold:
+                return None
+            rows = self.table.to_lance().to_table()
+            vectors = (
+                rows.column("vector").combine_chunks().flatten()
+                .to_numpy(zero_copy_only=False)
+                .astype(np.float32, copy=False)
+                .reshape(rows.num_rows, -1)
+            )
+            bits = _binarize(vectors) if self.binary_oversample > 0 else None
+            self._flat_snapshot = (rows, vectors, bits)
+        return self._flat_snapshot
+
     def _search_fts(
         self,
         query_text: str,
@@ -342,15 +1060,18 @@ class VectorStore:
         extensions: Optional[list[str]],
         directories: Optional[list[str]],
         chunk_types: Optional[list[str]],
-        languages: Optional[list[str]]
+        languages: Optional[list[str]],
+        min_score: float = 0.0,
+        include_vector: bool = False,
     ) -> list[SearchResult]:
         """Perform keyword-only BM25 search."""
         try:
             # Use fts_search method for full-text search
-            query = self.table.search(query_text, query_type="fts").limit(limit)
+            query = self.table.search(_fts_query(query_text), query_type="fts").limit(limit)
+            query = self._select_columns(query, include_vector)
             query = self._apply_filters(query, file_filter, branch_filter, extensions,
                                         directories, chunk_types, languages)
-            results = query.to_list()
+            results = self._mask_min_score(query.to_arrow(), "_score", min_score).to_pylist()
             return self._convert_results(results, score_type="fts")
         except (ValueError, AttributeError) as e:
             # Fall back to vector search if FTS is not available
@@ -361,7 +1082,7 @@ class VectorStore:
     def _search_hybrid(
         self,
         query_text: str,
-        query_vector: Optional[list[float]],
+        query_vector: Optional[np.ndarray],
         limit: int,
         fts_weight: float,
         file_filter: Optional[str],
@@ -369,26 +1090,105 @@ class VectorStore:
         extensions: Optional[list[str]],
         directories: Optional[list[str]],
         chunk_types: Optional[list[str]],
-        languages: Optional[list[str]]
+        languages: Optional[list[str]],
+        min_score: float = 0.0,
+        include_vector: bool = False,
     ) -> list[SearchResult]:
-        """Perform hybrid search combining vector and FTS."""
+        """
+        Perform hybrid search combining vector and FTS.
+
+        Both sub-searches run as one LanceDB hybrid query and are fused by
+        reciprocal rank, weighted by ``fts_weight``, so rows are read and
+        materialized once. Fused scores are scaled so that ranking first in
+        both lists scores 1.0.
+        """
         try:
-            # Use LanceDB's hybrid search with RRF reranking
-            query = self.table.search(query_text, query_type="hybrid").limit(limit)
+            if query_vector is not None:
+                # The table has no embedding function, so pass the query vector
+                query = (
+                    self.table.search(query_type="hybrid")
+                    .vector(_normalize(np.asarray(query_vector, dtype=np.float32)))
+                    .text(_fts_query(query_text))
+                )
+            else:
+                query = self.table.search(_fts_query(query_text), query_type="hybrid")
+            query = query.metric(_VECTOR_METRIC).limit(limit)
+            if RRFReranker is not None:
+                query = query.rerank(reranker=_WeightedRRFReranker(fts_weight))
+            elif fts_weight != 0.5:
+                logger.warning("fts_weight is ignored: this LanceDB version has no RRF reranker")
+            query = self._select_columns(query, include_vector)
             query = self._apply_filters(query, file_filter, branch_filter, extensions,
                                         directories, chunk_types, languages)
-            results = query.to_list()
+            rows = query.to_arrow()
+            score_column = "_relevance_score" if "_relevance_score" in rows.column_names else "_score"
+            if RRFReranker is not None and score_column == "_relevance_score":
+                fused = pc.multiply(rows.column(score_column), (_RRF_K + 1) / 2)
+                rows = rows.set_column(rows.schema.get_field_index(score_column), score_column, fused)
+            results = self._mask_min_score(rows, score_column, min_score).to_pylist()
             return self._convert_results(results, score_type="hybrid")
         except (ValueError, AttributeError) as e:
             # Fall back to vector search if hybrid is not available
             logger.warning(f"Hybrid search not available ({e}), falling back to vector search")
-            if query_vector:
+            if query_vector is not None:
                 return self._search_vector(query_vector, limit, file_filter, branch_filter,
-                                          extensions, directories, chunk_types, languages)
+                                          extensions, directories, chunk_types, languages,
+                                          min_score=min_score, include_vector=include_vector)
             else:
                 logger.error("Cannot perform hybrid search fallback: no query_vector provided")
                 return []
 
+    def _estimate_selectivity(
+        self,
+        branch_filter: Optional[str],
+        chunk_types: Optional[list[str]],
+        languages: Optional[list[str]],
+    ) -> float:
+        """
+        Estimate the fraction of rows matching equality filters.
+
+        Uses per-value chunk counts of the filter columns, loaded with one
+        scan and reset on every write, and assumes the columns are independent.
+
+        Returns:
+            Estimated selectivity (0.0-1.0); 1.0 without filters
+        """
+        filters = {"branch": [branch_filter] if branch_filter else None,
+                   "chunk_type": chunk_types, "language": languages}
+        if not any(filters.values()):
+            return 1.0
+
+        if self._filter_counts is None:
+            rows = self.table.to_lance().to_table(columns=list(filters))
+            self._filter_counts = {"_total": rows.num_rows}
+            for column in filters:
+                counts = pc.value_counts(rows.column(column)).to_pylist()
+                self._filter_counts[column] = {c["values"]: c["counts"] for c in counts}
+
+        total = self._filter_counts["_total"]
+        if total == 0:
+            return 0.0
+
+        selectivity = 1.0
+        for column, values in filters.items():
+            if values:
+                counts = self._filter_counts[column]
+                selectivity *= sum(counts.get(v, 0) for v in values) / total
+        return selectivity
+
+    def _select_columns(self, query_builder, include_vector: bool):
+        """
+        Skip reading the vector column unless it is needed.
+
+        Each 384-dim vector is 1.5 KB per result row, and callers rarely use it.
+        """
+        if include_vector:
+            return query_builder
+        return query_builder.select([
+            name for name in self.table.schema.names
+            if name != "vector" and name not in _PATH_COLUMNS
+        ])
+
     def _apply_filters(
         self,
         query_builder,
@@ -397,44 +1197,35 @@ class VectorStore:
         extensions: Optional[list[str]],
         directories: Optional[list[str]],
         chunk_types: Optional[list[str]],
-        languages: Optional[list[str]]
+        languages: Optional[list[str]],
+        prefilter: Optional[bool] = None,
     ):
-        """Apply SQL WHERE filters to query builder."""
-        # Collect all filter conditions to combine them with AND
-        conditions = []
-
-        # Extension filter: path LIKE '%.py' OR path LIKE '%.js'
-        if extensions:
-            ext_conditions = " OR ".join(f"path LIKE '%{ext}'" for ext in extensions)
-            conditions.append(f"({ext_conditions})")
-
-        # Directory filter: path LIKE 'src/%' OR path LIKE 'lib/%'
-        if directories:
-            dir_conditions = " OR ".join(f"path LIKE '{d}%'" for d in directories)
-            conditions.append(f"({dir_conditions})")
-
-        # Chunk type filter: IN clause
-        if chunk_types:
-            types_list = ", ".join(f"'{t}'" for t in chunk_types)
-            conditions.append(f"chunk_type IN ({types_list})")
-
-        # Language filter: IN clause
-        if languages:
-            lang_list = ", ".join(f"'{lang}'" for lang in languages)
-            conditions.append(f"language IN ({lang_list})")
-
-        # Keep existing filters
-        if file_filter:
-            conditions.append(f"path LIKE '%{file_filter}%'")
-
-        if branch_filter:
-            conditions.append(f"branch = '{branch_filter}'")
-
-        # Combine all conditions with AND
-        if conditions:
-            combined_filter = " AND ".join(conditions)
+        """
+        Apply SQL WHERE filters to query builder.
+
+        With ``prefilter=True`` (vector queries only) the predicate is evaluated
+        before the nearest-neighbour scan, so only matching rows are scored and
+        ``limit`` is filled from matching rows instead of being trimmed after.
+        ``prefilter=False`` filters the candidates the index returns; it must
+        be passed explicitly because LanceDB pre-filters by default. None keeps
+        the query type's default (FTS and hybrid queries).
+        """
+        combined_filter = _build_filter(
+            file_filter,
+            branch_filter,
+            tuple(extensions) if extensions else None,
+            tuple(directories) if directories else None,
+            tuple(chunk_types) if chunk_types else None,
+            tuple(languages) if languages else None,
+            path_columns=_PATH_COLUMNS[0] in self.table.schema.names,
+        )
+
+        if combined_filter:
             logger.debug(f"Applying combined filter: {combined_filter}")
-            query_builder = query_builder.where(combined_filter)
+            if prefilter is None:
+                query_builder = query_builder.where(combined_filter)
+            else:
+                query_builder = query_builder.where(combined_filter, prefilter=prefilter)
 
         return query_builder
 
@@ -444,26 +1235,45 @@ class VectorStore:
         for result in results:
             # Get score based on type
             if score_type == "distance":
-                # For L2 distance: similarity = 1 / (1 + distance)
+                # Dot distance is 1 - cosine similarity for unit vectors
                 distance = result.get("_distance", 0.0)
-                score = 1.0 / (1.0 + distance)
+                score = min(1.0, max(0.0, 1.0 - distance))
             elif score_type == "fts":
                 # FTS returns a score directly (higher is better)
                 score = result.get("_score", 0.0)
             elif score_type == "hybrid":
-                # Hybrid returns combined score
-                score = result.get("_score", 0.0)
+                # Hybrid returns the fused (reranker) score
+                score = min(1.0, result.get("_relevance_score", result.get("_score", 0.0)))
             else:
                 score = 0.0
 
-            # Remove internal fields before creating CodeChunk
+            # Remove internal and derived fields before creating CodeChunk
             result_data = {k: v for k, v in result.items()
-                          if not k.startswith("_")}
+                          if not k.startswith("_") and k not in _PATH_COLUMNS}
+            for field in _CATEGORICAL_FIELDS:
+                value = result_data.get(field)
+                if value is not None:
+                    result_data[field] = sys.intern(value)
             chunk = CodeChunk(**result_data)
             search_results.append(SearchResult(chunk=chunk, score=score))
 
         return search_results
 
+    @staticmethod
+    def _mask_min_score(rows: pa.Table, score_column: str, min_score: float) -> pa.Table:
+        """
+        Drop rows scoring below ``min_score`` with one columnar comparison.
+
+        Runs before rows are converted to dicts and SearchResult objects, so
+        rejected rows are never materialized in Python. A missing score
+        column counts as a score of 0, matching ``_convert_results``.
+        """
+        if min_score <= 0:
+            return rows
+        if score_column not in rows.column_names:
+            return rows.slice(0, 0)
+        return rows.filter(pc.fill_null(pc.greater_equal(rows.column(score_column), min_score), False))
+
     def _post_filter(self, results: list[SearchResult], min_score: float) -> list[SearchResult]:
         """Filter results by minimum score threshold."""
         return [r for r in results if r.score >= min_score]
@@ -478,25 +1288,98 @@ class VectorStore:
         Returns:
             Number of chunks deleted
         """
+        return self.delete_by_paths([path])
+
+    def delete_by_paths(self, paths: list[str]) -> int:
+        """
+        Delete all chunks for several file paths in as few commits as possible.
+
+        Paths are combined into ``path IN (...)`` predicates of up to 1000
+        values each, so N deleted files cost one table commit per batch
+        instead of one per file.
+
+        Args:
+            paths: File paths to delete chunks for
+
+        Returns:
+            Number of chunks deleted
+        """
+        paths = list(paths)
+        if not paths:
+            return 0
+
         try:
-            # Count chunks before deletion
+            self._sync_version(force=True)
             count_before = self.table.count_rows()
 
-            # Delete chunks matching the path
-            self.table.delete(f"path = '{path}'")
+            for i in range(0, len(paths), _IN_CLAUSE_BATCH_SIZE):
+                batch = paths[i:i + _IN_CLAUSE_BATCH_SIZE]
+                in_list = ", ".join(_sql_quote(p) for p in batch)
+                self.table.delete(f"path IN ({in_list})")
 
             count_after = self.table.count_rows()
             deleted = count_before - count_after
+            self._record_version()
+
+            for cache in (self._hash_cache, self._file_stats):
+                if cache is not None:
+                    for path in paths:
+                        cache.pop(path, None)
 
             if deleted > 0:
-                logger.info(f"Deleted {deleted} chunks for {path}")
+                logger.info(f"Deleted {deleted} chunks for {len(paths)} files")
+                self.clear_cache()
 
             return deleted
 
         except Exception as e:
-            logger.error(f"Failed to delete chunks for {path}: {e}")
+            logger.error(f"Failed to delete chunks for {len(paths)} files: {e}")
             raise
 
+    def compact_if_fragmented(self) -> bool:
+        """
+        Compact the table when writes have left it split into many fragments.
+
+        Every add or delete commits a new Lance version and usually a new
+        fragment; vector scans slow down as fragments pile up. Indexes are
+        also never extended on write, so once ``max_unindexed_rows`` rows sit
+        outside an index they are folded in with ``optimize()``, which
+        compacts at the same time.
+
+        Returns:
+            True if compaction or index optimization ran
+        """
+        try:
+            fragments = len(self.table.to_lance().get_fragments())
+            unindexed = self._unindexed_rows()
+            if fragments <= self.max_fragments and unindexed < self.max_unindexed_rows:
+                return False
+
+            self._sync_version(force=True)
+            if unindexed >= self.max_unindexed_rows:
+                self.table.optimize()
+                logger.info(
+                    f"Optimized {self.table_name} ({fragments} fragments, {unindexed} unindexed rows)"
+                )
+            else:
+                self.table.compact_files()
+                logger.info(f"Compacted {self.table_name} ({fragments} fragments)")
+            self._record_version()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to compact table: {e}")
+            return False
+
+    def _unindexed_rows(self) -> int:
+        """Largest number of rows any existing index does not cover yet."""
+        unindexed = 0
+        for index in self.table.list_indices():
+            stats = self.table.index_stats(index.name)
+            if stats is not None:
+                unindexed = max(unindexed, stats.num_unindexed_rows)
+        return unindexed
+
     def delete_by_branch(self, branch: str) -> int:
         """
         Delete all chunks for a specific git branch.
@@ -508,17 +1391,31 @@ class VectorStore:
             Number of chunks deleted
         """
         try:
-            # Count chunks before deletion
-            count_before = self.table.count_rows()
-
-            # Delete chunks matching the branch
-            self.table.delete(f"branch = '{branch}'")
-
-            count_after = self.table.count_rows()
-            deleted = count_before - count_after
-
-            if deleted > 0:
-                logger.info(f"Deleted {deleted} chunks for branch '{branch}'")
+            # One predicate for the whole branch, resolved from the branch index
+            # once it exists; nothing is committed when no rows match
+            predicate = f"branch = {_sql_quote(branch)}"
+            self._sync_version(force=True)
+            if self._file_stats is None:
+                deleted = self.table.count_rows(predicate)
+            else:
+                # Read the doomed rows' paths and sizes to update stats in place
+                rows = self.table.to_lance().to_table(columns=["path", "text"], filter=predicate)
+                deleted = rows.num_rows
+            if deleted == 0:
+                return 0
+
+            self.table.delete(predicate)
+            self._record_version()
+            self._hash_cache = None
+            if self._file_stats is not None:
+                for path, size in zip(
+                    rows.column("path").to_pylist(),
+                    pc.utf8_length(rows.column("text")).to_pylist(),
+                ):
+                    self._uncount_chunk(self._file_stats, path, size)
+
+            logger.info(f"Deleted {deleted} chunks for branch '{branch}'")
+            self.clear_cache()
 
             return deleted
 
@@ -530,17 +1427,16 @@ class VectorStore:
         """
         Get set of all file paths currently indexed.
 
+        Served from the per-file hash cache, so only the first call after
+        opening the store, a branch delete or another process's write scans
+        the table.
+
         Returns:
             Set of file paths
         """
         try:
-            # Get all unique file paths from the table
-            df = self.table.to_pandas()
-            if df.empty:
-                return set()
-
-            unique_paths = df["path"].unique()
-            return set(unique_paths)
+            self._sync_version()
+            return set(self._load_hash_cache())
 
         except Exception as e:
             logger.error(f"Failed to get indexed files: {e}")
@@ -557,15 +1453,11 @@ class VectorStore:
             Set of file paths for the specified branch
         """
         try:
-            # Query files for specific branch
-            df = self.table.to_pandas()
-            if df.empty:
-                return set()
-
-            # Filter by branch
-            branch_df = df[df["branch"] == branch]
-            unique_paths = branch_df["path"].unique()
-            return set(unique_paths)
+            # Query paths for specific branch, filtered in the scan
+            rows = self.table.to_lance().to_table(
+                columns=["path"], filter=f"branch = {_sql_quote(branch)}"
+            )
+            return set(pc.unique(rows.column("path")).to_pylist())
 
         except Exception as e:
             logger.error(f"Failed to get indexed files for branch {branch}: {e}")
@@ -575,6 +1467,11 @@ class VectorStore:
         """
         Get the stored file hash for a given path.
 
+        The first call loads the hash of every indexed file in one scan;
+        later lookups are served from memory and kept current by
+        add_chunks and the delete methods. Writes by other processes are
+        picked up through the table version (see _sync_version).
+
         Args:
             path: File path to look up
 
@@ -582,56 +1479,124 @@ class VectorStore:
             File hash if found, None otherwise
         """
         try:
-            results = (
-                self.table.search()
-                .where(f"path = '{path}'")
-                .limit(1)
-                .to_list()
-            )
-
-            if results:
-                return results[0].get("file_hash")
-
-            return None
+            self._sync_version()
+            return self._load_hash_cache().get(path)
 
         except Exception as e:
             logger.error(f"Failed to get file hash for {path}: {e}")
             return None
 
-    def get_stats(self) -> IndexStats:
+    def _load_hash_cache(self) -> dict[str, str]:
+        """Load path -> file_hash for every indexed file on first use."""
+        if self._hash_cache is None:
+            rows = self.table.to_lance().to_table(columns=["path", "file_hash"])
+            self._hash_cache = dict(zip(
+                rows.column("path").to_pylist(), rows.column("file_hash").to_pylist()
+            ))
+        return self._hash_cache
+
+    def get_chunk_vectors(self, path: str) -> dict[str, np.ndarray]:
         """
-        Get statistics about the indexed content.
+        Get stored embeddings for a file's chunks, keyed by chunk text hash.
+
+        Used on re-index to skip embedding chunks whose text has not changed.
+
+        Args:
+            path: File path to look up
 
         Returns:
-            IndexStats object with counts and metadata
+            Mapping of chunk_hash to float32 vector (empty if none stored)
         """
         try:
-            total_chunks = self.table.count_rows()
+            rows = self.table.to_lance().to_table(
+                columns=["chunk_hash", "vector"],
+                filter=f"path = {_sql_quote(path)} AND chunk_hash IS NOT NULL",
+            )
+            if rows.num_rows == 0:
+                return {}
+            # Unpack the vector column as one matrix rather than boxing each float
+            vectors = rows.column("vector").combine_chunks()
+            matrix = vectors.flatten().to_numpy(zero_copy_only=False).astype(np.float32, copy=False)
+            matrix = matrix.reshape(rows.num_rows, vectors.type.list_size)
+            return dict(zip(rows.column("chunk_hash").to_pylist(), matrix))
 
-            if total_chunks == 0:
-                return IndexStats()
+        except Exception as e:
+            logger.debug(f"No reusable vectors for {path}: {e}")
+            return {}
+
+    @staticmethod
+    def _count_chunk(
+        file_stats: dict[str, list], path: str, language: str, size: int, indexed_at: float
+    ) -> None:
+        """Add one chunk to the per-file stats."""
+        entry = file_stats.get(path)
+        if entry is None:
+            file_stats[path] = [1, size, language, indexed_at]
+        else:
+            entry[0] += 1
+            entry[1] += size
+            entry[3] = max(entry[3], indexed_at)
+
+    @staticmethod
+    def _uncount_chunk(file_stats: dict[str, list], path: str, size: int) -> None:
+        """Remove one deleted chunk from the per-file stats."""
+        entry = file_stats.get(path)
+        if entry is None:
+            return
+        entry[0] -= 1
+        entry[1] -= size
+        if entry[0] <= 0:
+            del file_stats[path]
+
+    def _load_file_stats(self) -> dict[str, list]:
+        """Scan the table once, without vectors, into per-file stats."""
+        rows = self.table.to_lance().to_table(columns=["path", "language", "text", "indexed_at"])
+        file_stats: dict[str, list] = {}
+        for path, language, size, indexed_at in zip(
+            rows.column("path").to_pylist(),
+            rows.column("language").to_pylist(),
+            pc.utf8_length(rows.column("text")).to_pylist(),
+            rows.column("indexed_at").to_pylist(),
+        ):
+            self._count_chunk(file_stats, path, language, size, indexed_at)
+        return file_stats
 
-            # Get all chunks to compute stats
-            all_chunks = self.table.to_pandas()
+    def get_stats(self) -> IndexStats:
+        """
+        Get statistics about the indexed content.
 
-            # Count unique files
-            total_files = all_chunks["path"].nunique()
+        Per-file counts are loaded with one scan on first use and then
+        kept current by add_chunks and the delete methods, so repeated
+        calls do not re-read the table. They are reloaded when another
+        process has written a newer table version.
 
-            # Estimate total size (sum of text lengths)
-            total_size_bytes = all_chunks["text"].str.len().sum()
+        Returns:
+            IndexStats object with counts and metadata
+        """
+        try:
+            self._sync_version()
+            if self._file_stats is None:
+                self._file_stats = self._load_file_stats()
 
-            # Count by language
-            languages = all_chunks["language"].value_counts().to_dict()
+            if not self._file_stats:
+                return IndexStats()
 
-            # Get last indexed time
-            last_indexed = all_chunks["indexed_at"].max()
+            total_chunks = 0
+            total_size_bytes = 0
+            languages: dict[str, int] = {}
+            last_indexed = 0.0
+            for chunks, size, language, indexed_at in self._file_stats.values():
+                total_chunks += chunks
+                total_size_bytes += size
+                languages[language] = languages.get(language, 0) + chunks
+                last_indexed = max(last_indexed, indexed_at)
 
             return IndexStats(
-                total_files=total_files,
+                total_files=len(self._file_stats),
                 total_chunks=total_chunks,
-                total_size_bytes=int(total_size_bytes),
+                total_size_bytes=total_size_bytes,
                 languages=languages,
-                last_indexed=float(last_indexed),
+                last_indexed=last_indexed,
             )
 
         except Exception as e:
@@ -643,6 +1608,9 @@ class VectorStore:
         try:
             self.db.drop_table(self.table_name)
             self._table = None  # Reset table reference
+            self._table_version = None
+            self._drop_table_caches()
+            self.clear_cache()
             logger.info(f"Cleared all data from {self.table_name}")
         except Exception as e:
             logger.error(f"Failed to clear store: {e}")
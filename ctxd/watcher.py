@@ -112,19 +112,25 @@ class CodeChangeHandler(FileSystemEventHandler):
 
         logger.info(f"Processing {len(self._pending_changes)} pending changes")
 
+        # Remove all deleted files from the index in one batched delete
+        deleted = [path for path, event_type in self._pending_changes.items() if event_type == "deleted"]
+        if deleted:
+            try:
+                self.indexer.store.delete_by_paths(deleted)
+                logger.info(f"Removed {len(deleted)} deleted files from index")
+            except Exception as e:
+                logger.error(f"Failed to remove {len(deleted)} deleted files from index: {e}")
+
         for path, event_type in list(self._pending_changes.items()):
+            if event_type == "deleted":
+                continue
             try:
-                if event_type == "deleted":
-                    # Remove from index
-                    self.indexer.store.delete_by_path(path)
-                    logger.info(f"Removed deleted file from index: {path}")
-                else:
-                    # Re-index the file (modified or created)
-                    file_path = Path(path)
-                    if file_path.exists():
-                        base_path = file_path.parent
-                        self.indexer._index_file(file_path, base_path=base_path)
-                        logger.info(f"Re-indexed {event_type} file: {path}")
+                # Re-index the file (modified or created)
+                file_path = Path(path)
+                if file_path.exists():
+                    base_path = file_path.parent
+                    self.indexer._index_file(file_path, base_path=base_path)
+                    logger.info(f"Re-indexed {event_type} file: {path}")
             except Exception as e:
                 logger.error(f"Failed to process change for {path}: {e}")
 
@@ -9,26 +9,17 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from ctxd.chunkers import TreeSitterChunker
 from ctxd.config import Config
 from ctxd.embeddings import EmbeddingModel
 from ctxd.store import VectorStore
 from ctxd.indexer import Indexer
+from ctxd.models import CodeChunk
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    # Cleanup
-    if temp_path.exists():
-        shutil.rmtree(temp_path)
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-
-@pytest.fixture
-def sample_python_file(temp_dir):
-    """Create a sample Python file with functions and classes."""
-    python_code = '''"""Sample Python module for testing."""
+SAMPLE_PYTHON_CODE = '''"""Sample Python module for testing."""
 
 def hello_world():
     """Print hello world."""
@@ -54,15 +45,8 @@ def complex_function(x, y, z):
         return result * 2
     return result
 '''
-    file_path = temp_dir / "sample.py"
-    file_path.write_text(python_code)
-    return file_path
 
-
-@pytest.fixture
-def sample_markdown_file(temp_dir):
-    """Create a sample Markdown file."""
-    markdown_content = '''# Sample Document
+SAMPLE_MARKDOWN = '''# Sample Document
 
 This is a sample markdown document for testing.
 
@@ -79,8 +63,31 @@ This is the second section.
 
 Some nested content here.
 '''
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing."""
+    temp_path = Path(tempfile.mkdtemp())
+    yield temp_path
+    # Cleanup
+    if temp_path.exists():
+        shutil.rmtree(temp_path)
+
+
+@pytest.fixture
+def sample_python_file(temp_dir):
+    """Create a sample Python file with functions and classes."""
+    file_path = temp_dir / "sample.py"
+    file_path.write_text(SAMPLE_PYTHON_CODE)
+    return file_path
+
+
+@pytest.fixture
+def sample_markdown_file(temp_dir):
+    """Create a sample Markdown file."""
     file_path = temp_dir / "README.md"
-    file_path.write_text(markdown_content)
+    file_path.write_text(SAMPLE_MARKDOWN)
     return file_path
 
 
@@ -108,11 +115,10 @@ build/
     return file_path
 
 
-@pytest.fixture
-def sample_codebase(temp_dir, sample_python_file, sample_markdown_file):
-    """Create a small sample codebase with multiple files."""
+def _write_codebase_dirs(root: Path) -> None:
+    """Write the src/ and tests/ part of the sample codebase under root."""
     # Create subdirectory structure
-    src_dir = temp_dir / "src"
+    src_dir = root / "src"
     src_dir.mkdir()
 
     # Add more Python files
@@ -134,7 +140,7 @@ if __name__ == "__main__":
 ''')
 
     # Create a tests directory (should be indexed too)
-    tests_dir = temp_dir / "tests"
+    tests_dir = root / "tests"
     tests_dir.mkdir()
     (tests_dir / "test_utils.py").write_text('''
 def test_utility():
@@ -142,22 +148,74 @@ def test_utility():
     assert True
 ''')
 
+
+@pytest.fixture
+def sample_codebase(temp_dir, sample_python_file, sample_markdown_file):
+    """Create a small sample codebase with multiple files."""
+    _write_codebase_dirs(temp_dir)
     return temp_dir
 
 
+@pytest.fixture(scope="module")
+def module_codebase(tmp_path_factory):
+    """Create the sample codebase once per test module; tests must undo any changes."""
+    root = tmp_path_factory.mktemp("codebase")
+    (root / "sample.py").write_text(SAMPLE_PYTHON_CODE)
+    (root / "README.md").write_text(SAMPLE_MARKDOWN)
+    _write_codebase_dirs(root)
+    return root
+
+
 @pytest.fixture
 def config(temp_dir):
     """Create a test configuration."""
     return Config(project_root=temp_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def embedding_model():
-    """Create an embedding model for testing."""
+    """Create an embedding model shared by the whole test session."""
+    # Loading transformer weights takes seconds, so load them once.
     # Use a smaller model for faster tests
     return EmbeddingModel(model_name="all-MiniLM-L6-v2")
 
 
+@pytest.fixture(scope="session")
+def js_chunker():
+    """JavaScript chunker shared by the whole test session."""
+    return TreeSitterChunker("javascript")
+
+
+@pytest.fixture(scope="session")
+def ts_chunker():
+    """TypeScript chunker shared by the whole test session."""
+    return TreeSitterChunker("typescript")
+
+
+@pytest.fixture(scope="session")
+def sample_js_source():
+    """Contents of fixtures/sample.js, read once per session."""
+    return (FIXTURES_DIR / "sample.js").read_text()
+
+
+@pytest.fixture(scope="session")
+def sample_ts_source():
+    """Contents of fixtures/sample.ts, read once per session."""
+    return (FIXTURES_DIR / "sample.ts").read_text()
+
+
+@pytest.fixture(scope="session")
+def sample_md_source():
+    """Contents of fixtures/sample.md, read once per session."""
+    return (FIXTURES_DIR / "sample.md").read_text()
+
+
+@pytest.fixture(scope="session")
+def sample_go_source():
+    """Contents of fixtures/sample.go, read once per session."""
+    return (FIXTURES_DIR / "sample.go").read_text()
+
+
 @pytest.fixture
 def vector_store(temp_dir):
     """Create a vector store for testing."""
@@ -165,6 +223,25 @@ def vector_store(temp_dir):
     return VectorStore(db_path)
 
 
+@pytest.fixture
+def make_chunk():
+    """Factory for CodeChunks; every field has a default that keywords override."""
+    def _make_chunk(**fields):
+        defaults = dict(
+            vector=[0.1] * 384,
+            text="content",
+            path="test.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+        )
+        return CodeChunk(**{**defaults, **fields})
+    return _make_chunk
+
+
 @pytest.fixture
 def indexer(vector_store, embedding_model, config):
     """Create an indexer for testing."""
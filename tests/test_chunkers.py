@@ -4,8 +4,10 @@ Unit tests for chunking strategies.
 Tests TreeSitterChunker (Python, JavaScript, TypeScript, Go), MarkdownChunker, and FallbackChunker.
 """
 
+import threading
+
 import pytest
-from pathlib import Path
+from unittest.mock import PropertyMock, patch
 from ctxd.chunkers import TreeSitterChunker, MarkdownChunker, FallbackChunker
 
 
@@ -131,6 +133,25 @@ def documented_function():
         # Should still return a chunk (fallback to whole file)
         assert len(chunks) == 1
 
+    def test_empty_content_skips_parser(self):
+        """Test that blank input returns no chunks without touching a parser."""
+        chunker = TreeSitterChunker("python")
+        with patch.object(TreeSitterChunker, "parser", new_callable=PropertyMock) as parser:
+            assert chunker.chunk("", "empty.py") == []
+            assert chunker.chunk("  \n\t\n", "blank.py") == []
+        parser.assert_not_called()
+
+    def test_parser_reused_per_thread(self):
+        """Test that each thread gets its own parser, reused across parses."""
+        chunker = TreeSitterChunker("python")
+        assert chunker.parser is chunker.parser
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(chunker.parser))
+        thread.start()
+        thread.join()
+        assert other[0] is not chunker.parser
+
 
 class TestMarkdownChunker:
     """Tests for MarkdownChunker."""
@@ -175,6 +196,20 @@ Section 2 content."""
         assert chunks[2][1]["name"] == "Subsection 1.1"
         assert chunks[3][1]["name"] == "Section 2"
 
+    def test_markdown_preamble_and_line_numbers(self):
+        """Text before the first header is its own section; line ranges are exact."""
+        chunker = MarkdownChunker()
+        content = "Preamble\n#hashtag, not a header\n# First\nbody\n####### too deep\n## Second\n"
+
+        chunks = chunker.chunk(content, "test.md")
+
+        assert [(c[1]["name"], c[1]["start_line"], c[1]["end_line"]) for c in chunks] == [
+            (None, 1, 2),
+            ("First", 3, 5),
+            ("Second", 6, 7),
+        ]
+        assert chunks[1][0] == "# First\nbody\n####### too deep"
+
     def test_markdown_without_headers(self):
         """Markdown without headers should be single chunk."""
         chunker = MarkdownChunker()
@@ -345,15 +380,11 @@ Content here."""
         assert chunks[1][1]["name"] == "Another Real Header"
         assert "#hashtag" in chunks[0][0]
 
-    def test_markdown_fixture_file(self):
+    def test_markdown_fixture_file(self, sample_md_source):
         """Test chunking the comprehensive fixture file."""
         chunker = MarkdownChunker()
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.md"
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
 
-        chunks = chunker.chunk(content, "sample.md")
+        chunks = chunker.chunk(sample_md_source, "sample.md")
 
         # Verify we get expected number of chunks (all headers in the fixture)
         assert len(chunks) > 5  # The fixture has many headers
@@ -776,19 +807,11 @@ import "fmt"
         # Should still return a chunk (fallback to whole file)
         assert len(chunks) == 1
 
-    def test_go_fixture_file(self):
+    def test_go_fixture_file(self, sample_go_source):
         """Test comprehensive Go fixture file."""
-        import os
         chunker = TreeSitterChunker("go")
 
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.go"
-        if not fixture_path.exists():
-            pytest.skip("Fixture file not found")
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
-
-        chunks = chunker.chunk(content, "sample.go")
+        chunks = chunker.chunk(sample_go_source, "sample.go")
 
         # The fixture should have many chunks (functions, methods, types)
         assert len(chunks) >= 10
@@ -862,30 +885,28 @@ type ArithmeticOperator interface {
 class TestJavaScriptChunking:
     """Tests for JavaScript language chunking with TreeSitterChunker."""
 
-    def test_javascript_function_declaration(self):
+    def test_javascript_function_declaration(self, js_chunker):
         """JavaScript function declarations are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 function add(a, b) {
     return a + b;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "add"
         assert chunks[0][1]["chunk_type"] == "function"
         assert "function add(a, b)" in chunks[0][0]
 
-    def test_javascript_arrow_function(self):
+    def test_javascript_arrow_function(self, js_chunker):
         """JavaScript arrow functions assigned to variables are chunked."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 const multiply = (x, y) => {
     return x * y;
 };
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "multiply"
@@ -893,19 +914,17 @@ const multiply = (x, y) => {
         # Note: variable_declarator doesn't include the "const" keyword
         assert "multiply = (x, y) =>" in chunks[0][0]
 
-    def test_javascript_arrow_function_single_expression(self):
+    def test_javascript_arrow_function_single_expression(self, js_chunker):
         """Single-expression arrow functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
         content = """const square = n => n * n;"""
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "square"
         assert chunks[0][1]["chunk_type"] == "function"
 
-    def test_javascript_class_declaration(self):
+    def test_javascript_class_declaration(self, js_chunker):
         """JavaScript ES6 classes are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 class Calculator {
     constructor(value = 0) {
@@ -922,7 +941,7 @@ class Calculator {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         # Should have class and methods
         assert len(chunks) >= 1
@@ -932,9 +951,8 @@ class Calculator {
         assert len(class_chunks) >= 1
         assert class_chunks[0][1]["name"] == "Calculator"
 
-    def test_javascript_export_function(self):
+    def test_javascript_export_function(self, js_chunker):
         """JavaScript export statements with functions are chunked."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 export function divide(a, b) {
     if (b === 0) {
@@ -943,16 +961,15 @@ export function divide(a, b) {
     return a / b;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         assert len(chunks) >= 1
         # Should find the divide function
         names = [c[1]["name"] for c in chunks]
         assert "divide" in names
 
-    def test_javascript_multiple_functions(self):
+    def test_javascript_multiple_functions(self, js_chunker):
         """Multiple JavaScript functions are chunked separately."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 function add(a, b) {
     return a + b;
@@ -964,7 +981,7 @@ function subtract(a, b) {
     return a - b;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         assert len(chunks) == 3
         names = [c[1]["name"] for c in chunks]
@@ -972,9 +989,8 @@ function subtract(a, b) {
         assert "multiply" in names
         assert "subtract" in names
 
-    def test_javascript_method_definition(self):
+    def test_javascript_method_definition(self, js_chunker):
         """JavaScript class methods are chunked."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 class Calculator {
     add(n) {
@@ -982,55 +998,42 @@ class Calculator {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         # Should have class and/or method
         assert len(chunks) >= 1
         names = [c[1]["name"] for c in chunks]
         assert "Calculator" in names or "add" in names
 
-    def test_javascript_empty_file(self):
+    def test_javascript_empty_file(self, js_chunker):
         """Empty JavaScript file returns no chunks."""
-        chunker = TreeSitterChunker("javascript")
-        chunks = chunker.chunk("", "test.js")
+        chunks = js_chunker.chunk("", "test.js")
         assert len(chunks) == 0
 
-    def test_javascript_no_definitions(self):
+    def test_javascript_no_definitions(self, js_chunker):
         """JavaScript with only variable declarations returns single chunk."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 const x = 5;
 let y = 10;
 var z = 15;
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         # No functions or classes, should return whole file as single chunk
         assert len(chunks) == 1
         assert chunks[0][1]["chunk_type"] == "block"
 
-    def test_javascript_parse_error_fallback(self):
+    def test_javascript_parse_error_fallback(self, js_chunker):
         """Invalid JavaScript syntax falls back to single chunk."""
-        chunker = TreeSitterChunker("javascript")
         content = "function invalid syntax here {"
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         # Should still return a chunk (fallback to whole file)
         assert len(chunks) == 1
 
-    def test_javascript_fixture_file(self):
+    def test_javascript_fixture_file(self, js_chunker, sample_js_source):
         """Test comprehensive JavaScript fixture file."""
-        import os
-        chunker = TreeSitterChunker("javascript")
-
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.js"
-        if not fixture_path.exists():
-            pytest.skip("Fixture file not found")
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
-
-        chunks = chunker.chunk(content, "sample.js")
+        chunks = js_chunker.chunk(sample_js_source, "sample.js")
 
         # Should have multiple chunks
         assert len(chunks) > 3
@@ -1052,9 +1055,8 @@ var z = 15;
 class TestTypeScriptChunking:
     """Tests for TypeScript language chunking with TreeSitterChunker."""
 
-    def test_typescript_function_declaration(self):
+    def test_typescript_function_declaration(self, ts_chunker):
         """TypeScript function declarations are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 function createUser(name: string, email: string): User {
     return {
@@ -1064,31 +1066,29 @@ function createUser(name: string, email: string): User {
     };
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "createUser"
         assert chunks[0][1]["chunk_type"] == "function"
         assert "function createUser" in chunks[0][0]
 
-    def test_typescript_arrow_function(self):
+    def test_typescript_arrow_function(self, ts_chunker):
         """TypeScript arrow functions with type annotations are chunked."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 const validateEmail = (email: string): boolean => {
     return email.includes('@');
 };
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "validateEmail"
         assert chunks[0][1]["chunk_type"] == "function"
         assert "(email: string): boolean" in chunks[0][0]
 
-    def test_typescript_interface_declaration(self):
+    def test_typescript_interface_declaration(self, ts_chunker):
         """TypeScript interfaces are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 interface User {
     id: number;
@@ -1096,29 +1096,27 @@ interface User {
     email: string;
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "User"
         assert chunks[0][1]["chunk_type"] == "interface"
         assert "interface User" in chunks[0][0]
 
-    def test_typescript_type_alias(self):
+    def test_typescript_type_alias(self, ts_chunker):
         """TypeScript type aliases are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 type UserID = string | number;
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "UserID"
         assert chunks[0][1]["chunk_type"] == "type"
         assert "type UserID" in chunks[0][0]
 
-    def test_typescript_generic_type(self):
+    def test_typescript_generic_type(self, ts_chunker):
         """TypeScript generic types are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 type Result<T> = {
     success: boolean;
@@ -1126,16 +1124,15 @@ type Result<T> = {
     error?: string;
 };
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "Result"
         assert chunks[0][1]["chunk_type"] == "type"
         assert "type Result<T>" in chunks[0][0]
 
-    def test_typescript_class_with_types(self):
+    def test_typescript_class_with_types(self, ts_chunker):
         """TypeScript classes with type annotations are chunked."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 class UserService {
     private users: User[] = [];
@@ -1149,7 +1146,7 @@ class UserService {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should have class and methods
         assert len(chunks) >= 1
@@ -1158,9 +1155,8 @@ class UserService {
         names = [c[1]["name"] for c in chunks]
         assert "UserService" in names
 
-    def test_typescript_generic_function(self):
+    def test_typescript_generic_function(self, ts_chunker):
         """TypeScript generic functions are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 function wrapResult<T>(data: T): Result<T> {
     return {
@@ -1169,16 +1165,15 @@ function wrapResult<T>(data: T): Result<T> {
     };
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "wrapResult"
         assert chunks[0][1]["chunk_type"] == "function"
         assert "function wrapResult<T>" in chunks[0][0]
 
-    def test_typescript_mixed_definitions(self):
+    def test_typescript_mixed_definitions(self, ts_chunker):
         """Mixed TypeScript definitions are all chunked."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 interface User {
     id: number;
@@ -1195,7 +1190,7 @@ class UserService {
     private users: User[] = [];
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should have interface, type, function, class
         assert len(chunks) >= 4
@@ -1217,34 +1212,22 @@ class UserService {
         assert len(function_chunks) >= 1
         assert len(class_chunks) >= 1
 
-    def test_typescript_empty_file(self):
+    def test_typescript_empty_file(self, ts_chunker):
         """Empty TypeScript file returns no chunks."""
-        chunker = TreeSitterChunker("typescript")
-        chunks = chunker.chunk("", "test.ts")
+        chunks = ts_chunker.chunk("", "test.ts")
         assert len(chunks) == 0
 
-    def test_typescript_parse_error_fallback(self):
+    def test_typescript_parse_error_fallback(self, ts_chunker):
         """Invalid TypeScript syntax falls back to single chunk."""
-        chunker = TreeSitterChunker("typescript")
         content = "function invalid syntax here {"
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should still return a chunk (fallback to whole file)
         assert len(chunks) == 1
 
-    def test_typescript_fixture_file(self):
+    def test_typescript_fixture_file(self, ts_chunker, sample_ts_source):
         """Test comprehensive TypeScript fixture file."""
-        import os
-        chunker = TreeSitterChunker("typescript")
-
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.ts"
-        if not fixture_path.exists():
-            pytest.skip("Fixture file not found")
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
-
-        chunks = chunker.chunk(content, "sample.ts")
+        chunks = ts_chunker.chunk(sample_ts_source, "sample.ts")
 
         # Should have multiple chunks (interfaces, types, functions, class)
         assert len(chunks) > 5
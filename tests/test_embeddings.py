@@ -4,6 +4,7 @@ Unit tests for the embeddings module.
 Tests the EmbeddingModel wrapper around sentence-transformers.
 """
 
+import numpy as np
 import pytest
 from ctxd.embeddings import EmbeddingModel
 
@@ -18,6 +19,13 @@ def test_embedding_model_lazy_loading():
     assert model._model is not None  # Now loaded
 
 
+def test_model_uses_fast_tokenizer():
+    """Test that the loaded model tokenizes with the Rust fast tokenizer."""
+    model = EmbeddingModel()
+
+    assert model.model.tokenizer.is_fast
+
+
 def test_embed_text_single():
     """Test embedding a single text."""
     model = EmbeddingModel()
@@ -59,6 +67,17 @@ def test_embed_batch():
     assert all(isinstance(x, float) for emb in embeddings for x in emb)
 
 
+def test_embed_batch_as_numpy():
+    """Test batch embeddings can be returned as one float32 matrix."""
+    model = EmbeddingModel()
+
+    embeddings = model.embed_batch(["First sentence", "Second sentence"], as_numpy=True)
+
+    assert embeddings.shape == (2, 384)
+    assert embeddings.dtype == np.float32
+    assert np.allclose(embeddings[0], model.embed_batch(["First sentence"])[0], atol=1e-6)
+
+
 def test_embed_batch_empty():
     """Test that empty batch returns empty list."""
     model = EmbeddingModel()
@@ -100,6 +119,39 @@ def test_similar_texts_have_high_similarity():
     assert similarity > 0.7
 
 
+def test_embed_text_is_cached():
+    """Test that repeated texts are served from the query cache."""
+    model = EmbeddingModel()
+
+    emb1 = model.embed_text("utility function")
+    emb2 = model.embed_text("utility function")
+
+    assert emb1 == emb2
+    assert emb1 is not emb2  # Callers get independent copies
+    assert model._cached_embed.cache_info().hits == 1
+
+    # Cached as a compact, read-only float32 array
+    cached = model._cached_embed("utility function")
+    assert cached.dtype == np.float32
+    assert not cached.flags.writeable
+
+    model.clear_cache()
+    assert model._cached_embed.cache_info().currsize == 0
+
+
+def test_precision_auto_selection():
+    """Test that half precision is only chosen automatically on CUDA."""
+    model = EmbeddingModel()
+    assert model.resolve_precision("cuda") == "float16"
+    assert model.resolve_precision("cpu") == "float32"
+
+    model = EmbeddingModel(precision="bfloat16")
+    assert model.resolve_precision("cpu") == "bfloat16"
+
+    with pytest.raises(ValueError, match="Unsupported precision"):
+        EmbeddingModel(precision="int4")
+
+
 def test_model_repr():
     """Test the string representation."""
     model = EmbeddingModel()
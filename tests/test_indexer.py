@@ -4,8 +4,10 @@ Unit tests for the indexer.
 Tests file discovery, language detection, hashing, and indexing logic.
 """
 
+import queue
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 
 def test_detect_language(indexer):
@@ -23,9 +25,10 @@ def test_compute_file_hash(indexer, sample_python_file):
     """Test computing file hash."""
     hash1 = indexer.compute_file_hash(sample_python_file)
 
-    assert hash1 is not None
-    assert len(hash1) == 64  # SHA256 hex digest length
     assert isinstance(hash1, str)
+    algorithm, _, digest = hash1.partition(":")
+    assert algorithm in ("xxh3", "blake2b")
+    assert len(digest) == 16  # 64-bit hex digest length
 
     # Hash should be consistent
     hash2 = indexer.compute_file_hash(sample_python_file)
@@ -40,6 +43,37 @@ def test_compute_file_hash_different_files(indexer, sample_python_file, sample_m
     assert hash1 != hash2
 
 
+def test_file_unchanged_uses_stored_hash_algorithm(indexer, sample_python_file):
+    """Test stored hashes are checked with the algorithm they were made with."""
+    blake2b_hash = indexer.compute_file_hash(sample_python_file, "blake2b")
+    assert blake2b_hash.startswith("blake2b:")
+
+    assert indexer.file_unchanged(sample_python_file, blake2b_hash)
+    assert indexer.file_unchanged(sample_python_file, indexer.compute_file_hash(sample_python_file))
+    assert not indexer.file_unchanged(sample_python_file, "blake2b:0000000000000000")
+    assert not indexer.file_unchanged(sample_python_file, None)
+
+    # Unknown or untagged hashes cannot be checked and count as changed
+    assert not indexer.file_unchanged(sample_python_file, "md5:" + blake2b_hash.split(":")[1])
+    assert not indexer.file_unchanged(sample_python_file, blake2b_hash.split(":")[1])
+
+
+def test_read_and_hash_matches_compute_file_hash(indexer, sample_python_file, temp_dir):
+    """Test the mmap-backed reader returns the same content and hash."""
+    from ctxd.indexer import _read_and_hash
+
+    content, file_hash = _read_and_hash(str(sample_python_file))
+    assert content == sample_python_file.read_text()
+    assert file_hash == indexer.compute_file_hash(sample_python_file)
+
+    # Empty files cannot be mmapped and are handled separately
+    empty_file = temp_dir / "empty.py"
+    empty_file.write_text("")
+    content, file_hash = _read_and_hash(str(empty_file))
+    assert content == ""
+    assert file_hash == indexer.compute_file_hash(empty_file)
+
+
 def test_should_index_file_text_file(indexer, sample_python_file):
     """Test that text files are indexable."""
     assert indexer.should_index_file(sample_python_file) is True
@@ -56,9 +90,9 @@ def test_should_index_file_large_file(indexer, temp_dir):
     assert indexer.should_index_file(large_file) is False
 
 
-def test_discover_files(indexer, sample_codebase):
+def test_discover_files(indexer, module_codebase):
     """Test file discovery in a codebase."""
-    files = list(indexer._discover_files(sample_codebase))
+    files = list(indexer._discover_files(module_codebase))
 
     # Should find Python files
     py_files = [f for f in files if f.suffix == ".py"]
@@ -136,23 +170,158 @@ def test_force_reindex_processes_all_files(indexer, sample_python_file, temp_dir
     assert stats.total_chunks > 0
 
 
-def test_index_directory(indexer, sample_codebase):
+def test_reindex_reuses_unchanged_chunk_embeddings(indexer, temp_dir, monkeypatch):
+    """Only chunks whose text changed are re-embedded on re-index."""
+    source = temp_dir / "funcs.py"
+    source.write_text("def a():\n    return 1\n\n\ndef b():\n    return 2\n")
+    indexer.index_path(source, force=False)
+
+    embedded_texts = []
+    original_embed_batch = indexer.embeddings.embed_batch
+
+    def counting_embed_batch(texts, *args, **kwargs):
+        embedded_texts.extend(texts)
+        return original_embed_batch(texts, *args, **kwargs)
+
+    monkeypatch.setattr(indexer.embeddings, "embed_batch", counting_embed_batch)
+
+    source.write_text("def a():\n    return 1\n\n\ndef b():\n    return 3\n")
+    indexer.index_path(source, force=False)
+
+    assert len(embedded_texts) == 1
+    assert "return 3" in embedded_texts[0]
+    assert indexer.store.get_stats().total_chunks == 2
+
+
+def test_index_directory(indexer, module_codebase):
     """Test indexing an entire directory."""
-    stats = indexer.index_path(sample_codebase, force=False)
+    stats = indexer.index_path(module_codebase, force=False)
 
     assert stats.total_files > 0
     assert stats.total_chunks > 0
     assert "python" in stats.languages
 
 
-def test_index_with_progress_callback(indexer, sample_codebase):
+def test_chunk_file_in_worker(indexer, sample_python_file):
+    """Test the process-pool worker returns the file hash and plain chunk data."""
+    from ctxd.indexer import _chunk_file_in_worker
+
+    file_hash, chunks_data = _chunk_file_in_worker(str(sample_python_file), "python", 50, 500, 50)
+
+    assert file_hash == indexer.compute_file_hash(sample_python_file)
+    assert len(chunks_data) > 0
+    assert all(isinstance(text, str) and "start_line" in meta for text, meta in chunks_data)
+
+
+def test_index_directory_with_process_pool(indexer, module_codebase):
+    """Test indexing a directory with chunking in worker processes."""
+    indexer.process_pool_enabled = True
+    indexer.max_workers = 2
+
+    stats = indexer.index_path(module_codebase, force=False)
+
+    assert stats.total_files > 0
+    assert stats.total_chunks > 0
+    assert "python" in stats.languages
+
+
+@pytest.mark.parametrize("process_pool", [False, True])
+def test_emptied_file_chunks_removed(indexer, temp_dir, process_pool):
+    """Test a file emptied between runs loses its old chunks."""
+    indexer.process_pool_enabled = process_pool
+    indexer.max_workers = 2
+    (temp_dir / "keep.py").write_text("def keep():\n    pass\n")
+    emptied = temp_dir / "emptied.py"
+    emptied.write_text("def old():\n    pass\n")
+
+    indexer.index_path(temp_dir, force=False)
+    assert indexer.store.get_file_hash("emptied.py") is not None
+
+    emptied.write_text("")
+    indexer.index_path(temp_dir, force=False)
+
+    assert indexer.store.get_file_hash("emptied.py") is None
+    assert indexer.store.get_indexed_files() == {"keep.py"}
+
+
+def test_parallel_indexing_drains_pipeline(indexer, module_codebase):
+    """Test that the embed/write pipeline is drained and stopped after indexing."""
+    indexer.embedding_batch_size = 2  # Force several batches through the pipeline
+
+    stats = indexer.index_path(module_codebase, force=False)
+
+    assert stats.total_chunks > 0
+    assert indexer._pipeline_active is False
+    assert indexer._pipeline_threads == []
+    assert indexer._embedding_queue == []
+
+
+def test_serial_indexing_batches_writes(indexer, module_codebase):
+    """Test serial indexing stores chunks in batches, not one write per file."""
+    indexer.parallel_enabled = False
+    indexer.embedding_batch_size = 10_000
+
+    with patch.object(indexer.store, "add_chunks", wraps=indexer.store.add_chunks) as add_chunks:
+        stats = indexer.index_path(module_codebase, force=True)
+
+    assert stats.total_files > 1
+    assert add_chunks.call_count == 1
+    assert indexer._batch_mode is False
+
+
+def test_indexed_chunks_keep_packed_vectors(indexer, module_codebase):
+    """Test chunks built by the indexer carry float32 arrays straight to the store."""
+    import numpy as np
+
+    with patch.object(indexer.store, "add_chunks", wraps=indexer.store.add_chunks) as add_chunks:
+        indexer.index_path(module_codebase, force=True)
+
+    chunks = [chunk for call in add_chunks.call_args_list for chunk in call.args[0]]
+    assert chunks
+    assert all(isinstance(c.vector, np.ndarray) and c.vector.dtype == np.float32 for c in chunks)
+    assert all(c.indexed_at > 0 for c in chunks)
+
+
+def test_new_files_are_not_prehashed(indexer, temp_dir):
+    """Only files with a stored hash are hashed to check for changes."""
+    source = temp_dir / "new.py"
+    source.write_text("def a():\n    return 1\n")
+
+    with patch.object(indexer, "compute_file_hash", wraps=indexer.compute_file_hash) as compute:
+        stats = indexer.index_path(source, force=False)
+        assert compute.call_count == 0
+        assert stats.total_files == 1
+
+        # Unchanged on the second run: hashed once and skipped
+        with patch.object(indexer, "_index_file") as index_file:
+            indexer.index_path(source, force=False)
+        assert compute.call_count == 1
+        index_file.assert_not_called()
+
+
+def test_write_stage_coalesces_waiting_batches(indexer):
+    """Test the writer merges batches already queued into one store write."""
+    def run_writer(batches, max_write_batch):
+        indexer.max_write_batch = max_write_batch
+        indexer._write_stage_queue = queue.Queue()
+        for batch in batches:
+            indexer._write_stage_queue.put(batch)
+        with patch.object(indexer.store, "add_chunks") as add_chunks:
+            indexer._write_stage()
+        return [c.args[0] for c in add_chunks.call_args_list]
+
+    assert run_writer([["a"], ["b", "c"], None], max_write_batch=10) == [["a", "b", "c"]]
+    assert run_writer([["a"], ["b", "c"], None], max_write_batch=1) == [["a"], ["b", "c"]]
+
+
+def test_index_with_progress_callback(indexer, module_codebase):
     """Test that progress callback is called during indexing."""
     progress_calls = []
 
     def progress_callback(current, total, filename):
         progress_calls.append((current, total, filename))
 
-    indexer.index_path(sample_codebase, force=False, progress_callback=progress_callback)
+    indexer.index_path(module_codebase, force=False, progress_callback=progress_callback)
 
     # Progress callback should have been called
     assert len(progress_calls) > 0
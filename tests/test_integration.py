@@ -6,17 +6,16 @@ Tests the full workflow from indexing to searching.
 
 import pytest
 from pathlib import Path
-from ctxd import Config, EmbeddingModel, VectorStore, Indexer
+from ctxd import Config, VectorStore, Indexer
 
 
-def test_full_index_and_search_workflow(sample_codebase):
+def test_full_index_and_search_workflow(sample_codebase, embedding_model):
     """Test the complete workflow: index → search → get results."""
     # Setup
     config = Config(project_root=sample_codebase)
     db_path = sample_codebase / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     # Index the codebase
     stats = indexer.index_path(sample_codebase, force=False)
@@ -27,7 +26,7 @@ def test_full_index_and_search_workflow(sample_codebase):
 
     # Perform a search
     query = "utility function"
-    query_vector = embeddings.embed_text(query)
+    query_vector = embedding_model.embed_text(query)
     results = store.search(query_vector, limit=10)
 
     assert len(results) > 0
@@ -41,14 +40,13 @@ def test_full_index_and_search_workflow(sample_codebase):
         assert 0.0 <= result.score <= 1.0
 
 
-def test_incremental_reindex(sample_codebase):
+def test_incremental_reindex(sample_codebase, embedding_model):
     """Test incremental re-indexing after file changes."""
     # Setup
     config = Config(project_root=sample_codebase)
     db_path = sample_codebase / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     # Initial index
     stats1 = indexer.index_path(sample_codebase, force=False)
@@ -67,28 +65,27 @@ def test_incremental_reindex(sample_codebase):
 
     # Search for the new function
     query = "new utility"
-    query_vector = embeddings.embed_text(query)
+    query_vector = embedding_model.embed_text(query)
     results = store.search(query_vector, limit=5)
 
     # Should find the new function
     assert any("new_utility" in r.chunk.text for r in results)
 
 
-def test_search_relevance(sample_codebase):
+def test_search_relevance(sample_codebase, embedding_model):
     """Test that search returns relevant results."""
     # Setup
     config = Config(project_root=sample_codebase)
     db_path = sample_codebase / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     # Index
     indexer.index_path(sample_codebase, force=False)
 
     # Search for main function
     query = "main entry point function"
-    query_vector = embeddings.embed_text(query)
+    query_vector = embedding_model.embed_text(query)
     results = store.search(query_vector, limit=5)
 
     assert len(results) > 0
@@ -98,14 +95,13 @@ def test_search_relevance(sample_codebase):
     assert "main" in top_result.chunk.text.lower() or "main" in (top_result.chunk.name or "").lower()
 
 
-def test_multiple_languages_indexed(sample_codebase):
+def test_multiple_languages_indexed(sample_codebase, embedding_model):
     """Test that multiple languages are correctly indexed."""
     # Setup
     config = Config(project_root=sample_codebase)
     db_path = sample_codebase / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     # Add a JavaScript file
     (sample_codebase / "app.js").write_text('''
@@ -125,7 +121,7 @@ function greet(name) {
     assert "javascript" in stats.languages
 
 
-def test_gitignore_respected_in_workflow(temp_dir):
+def test_gitignore_respected_in_workflow(temp_dir, embedding_model):
     """Test that .gitignore patterns are respected in full workflow."""
     # Create .gitignore
     (temp_dir / ".gitignore").write_text("*.pyc\n__pycache__/\n")
@@ -139,14 +135,13 @@ def test_gitignore_respected_in_workflow(temp_dir):
     config = Config(project_root=temp_dir)
     db_path = temp_dir / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     stats = indexer.index_path(temp_dir, force=False)
 
     # Should have indexed main.py but not __pycache__
     query = "hello"
-    query_vector = embeddings.embed_text(query)
+    query_vector = embedding_model.embed_text(query)
     results = store.search(query_vector, limit=10)
 
     file_paths = [r.chunk.path for r in results]
@@ -155,14 +150,13 @@ def test_gitignore_respected_in_workflow(temp_dir):
     assert not any(".pyc" in p for p in file_paths)
 
 
-def test_stats_accuracy(sample_codebase):
+def test_stats_accuracy(sample_codebase, embedding_model):
     """Test that index statistics are accurate."""
     # Setup
     config = Config(project_root=sample_codebase)
     db_path = sample_codebase / ".ctxd" / "data.lance"
     store = VectorStore(db_path)
-    embeddings = EmbeddingModel()
-    indexer = Indexer(store, embeddings, config)
+    indexer = Indexer(store, embedding_model, config)
 
     # Index
     indexer.index_path(sample_codebase, force=False)
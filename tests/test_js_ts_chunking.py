@@ -10,31 +10,115 @@ These tests cover:
 - Edge cases
 """
 
+from collections import Counter, defaultdict
+
 import pytest
-from pathlib import Path
 from ctxd.chunkers import TreeSitterChunker
 
 
-class TestJavaScriptChunking:
-    """Tests for JavaScript code chunking."""
-
-    def test_javascript_function_declaration(self):
-        """JavaScript function declarations are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
+# (language, content, expected name or None to skip, expected chunk_type, substring or None)
+SINGLE_CHUNK_CASES = [
+    pytest.param("javascript", """
 function myFunction(param) {
     return param + 1;
 }
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "myFunction"
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "function myFunction" in chunks[0][0]
+""", "myFunction", "function", "function myFunction", id="javascript_function_declaration"),
+    # tree-sitter extracts only the declarator part of an arrow function, not the full statement
+    pytest.param("javascript", """
+const greet = (name) => {
+    return `Hello, ${name}!`;
+};
+""", "greet", "function", "greet", id="javascript_arrow_function"),
+    pytest.param("javascript", """
+const square = (n) => n * n;
+""", "square", "function", None, id="javascript_arrow_function_implicit_return"),
+    pytest.param("javascript", """
+async function fetchData(url) {
+    const response = await fetch(url);
+    const data = await response.json();
+    return data;
+}
+""", "fetchData", "function", "async function", id="javascript_async_function"),
+    pytest.param("javascript", """
+const fetchUser = async (userId) => {
+    const response = await fetch(`/api/users/${userId}`);
+    return response.json();
+};
+""", "fetchUser", "function", None, id="javascript_async_arrow_function"),
+    # Generator function name may be extracted from the generator_function node
+    pytest.param("javascript", """
+function* numberGenerator() {
+    yield 1;
+    yield 2;
+    yield 3;
+}
+""", None, "function", "yield", id="javascript_generator_function"),
+    # Type annotations should be included in the chunk
+    pytest.param("typescript", """
+function greet(name: string): string {
+    return `Hello, ${name}!`;
+}
+""", "greet", "function", "string", id="typescript_function_declaration"),
+    pytest.param("typescript", """
+interface User {
+    id: number;
+    name: string;
+    email: string;
+}
+""", "User", "interface", "interface User", id="typescript_interface_declaration"),
+    pytest.param("typescript", """
+type Status = 'pending' | 'active' | 'inactive';
+""", "Status", "type", "type Status", id="typescript_type_alias"),
+    pytest.param("typescript", """
+function identity<T>(value: T): T {
+    return value;
+}
+""", "identity", "function", "<T>", id="typescript_generic_function"),
+    pytest.param("typescript", """
+const filterUsers = (users: User[], minAge: number): User[] => {
+    return users.filter(user => user.age >= minAge);
+};
+""", "filterUsers", "function", "User[]", id="typescript_arrow_function_with_types"),
+    pytest.param("typescript", """
+type ApiResponse<T> = {
+    data: T;
+    status: number;
+    message: string;
+};
+""", "ApiResponse", "type", None, id="typescript_complex_type_alias"),
+]
+
+
+def _summarize(chunks):
+    """Count chunks and collect names per chunk_type in a single pass."""
+    counts = Counter()
+    names_by_type = defaultdict(set)
+    for _, metadata in chunks:
+        counts[metadata["chunk_type"]] += 1
+        names_by_type[metadata["chunk_type"]].add(metadata["name"])
+    return counts, names_by_type
+
 
-    def test_javascript_multiple_functions(self):
+@pytest.mark.parametrize("lang,content,name,ctype,needle", SINGLE_CHUNK_CASES)
+def test_single_declaration(js_chunker, ts_chunker, lang, content, name, ctype, needle):
+    """A single JS/TS declaration produces one chunk with the right name and type."""
+    chunker = {"javascript": js_chunker, "typescript": ts_chunker}[lang]
+    path = "test.js" if lang == "javascript" else "test.ts"
+
+    chunks = chunker.chunk(content, path)
+    assert len(chunks) == 1
+    if name is not None:
+        assert chunks[0][1]["name"] == name
+    assert chunks[0][1]["chunk_type"] == ctype
+    if needle is not None:
+        assert needle in chunks[0][0]
+
+
+class TestJavaScriptChunking:
+    """Tests for JavaScript code chunking."""
+
+    def test_javascript_multiple_functions(self, js_chunker):
         """Multiple JavaScript functions are chunked separately."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 function add(a, b) {
     return a + b;
@@ -48,46 +132,17 @@ function multiply(a, b) {
     return a * b;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         assert len(chunks) == 3
 
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "add" in names
-        assert "subtract" in names
-        assert "multiply" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {"add", "subtract", "multiply"} <= names
 
         for chunk in chunks:
             assert chunk[1]["chunk_type"] == "function"
 
-    def test_javascript_arrow_function(self):
-        """Arrow functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
-const greet = (name) => {
-    return `Hello, ${name}!`;
-};
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "greet"
-        assert chunks[0][1]["chunk_type"] == "function"
-        # Note: tree-sitter extracts only the declarator part, not the full statement
-        assert "greet" in chunks[0][0]
-
-    def test_javascript_arrow_function_implicit_return(self):
-        """Arrow functions with implicit return are chunked."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
-const square = (n) => n * n;
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "square"
-        assert chunks[0][1]["chunk_type"] == "function"
-
-    def test_javascript_class_declaration(self):
+    def test_javascript_class_declaration(self, js_chunker):
         """JavaScript classes are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 class Calculator {
     constructor() {
@@ -104,55 +159,22 @@ class Calculator {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
 
         # Should have class and methods
         assert len(chunks) >= 1
 
+        counts, names_by_type = _summarize(chunks)
+
         # Check for class chunk
-        class_chunks = [c for c in chunks if c[1]["chunk_type"] == "class"]
-        assert len(class_chunks) == 1
-        assert class_chunks[0][1]["name"] == "Calculator"
+        assert counts["class"] == 1
+        assert names_by_type["class"] == {"Calculator"}
 
         # Check for method chunks
-        method_chunks = [c for c in chunks if c[1]["chunk_type"] == "function"]
-        method_names = [m[1]["name"] for m in method_chunks]
-        assert "add" in method_names
-        assert "getResult" in method_names
+        assert {"add", "getResult"} <= names_by_type["function"]
 
-    def test_javascript_async_function(self):
-        """Async functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
-async function fetchData(url) {
-    const response = await fetch(url);
-    const data = await response.json();
-    return data;
-}
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "fetchData"
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "async function" in chunks[0][0]
-
-    def test_javascript_async_arrow_function(self):
-        """Async arrow functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
-const fetchUser = async (userId) => {
-    const response = await fetch(`/api/users/${userId}`);
-    return response.json();
-};
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "fetchUser"
-        assert chunks[0][1]["chunk_type"] == "function"
-
-    def test_javascript_exported_function(self):
+    def test_javascript_exported_function(self, js_chunker):
         """Exported functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 export function exportedFunction() {
     return "I am exported";
@@ -162,92 +184,66 @@ export const exportedArrow = () => {
     return "Arrow function export";
 };
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         assert len(chunks) == 2
 
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "exportedFunction" in names
-        assert "exportedArrow" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {"exportedFunction", "exportedArrow"} <= names
 
-    def test_javascript_generator_function(self):
-        """Generator functions are chunked correctly."""
-        chunker = TreeSitterChunker("javascript")
-        content = """
-function* numberGenerator() {
-    yield 1;
-    yield 2;
-    yield 3;
-}
-"""
-        chunks = chunker.chunk(content, "test.js")
-        assert len(chunks) == 1
-        # Generator function name may be extracted from the generator_function node
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "yield" in chunks[0][0]
-
-    def test_javascript_empty_file(self):
+    def test_javascript_empty_file(self, js_chunker):
         """Empty JavaScript files return no chunks."""
-        chunker = TreeSitterChunker("javascript")
-        chunks = chunker.chunk("", "test.js")
+        chunks = js_chunker.chunk("", "test.js")
         assert len(chunks) == 0
 
-    def test_javascript_only_comments(self):
+    def test_javascript_only_comments(self, js_chunker):
         """Files with only comments return single chunk."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 // This is a comment
 /* This is a multi-line
    comment */
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         # No definitions, should return whole file as one chunk
         assert len(chunks) == 1
         assert chunks[0][1]["chunk_type"] == "block"
         assert chunks[0][1]["name"] is None
 
-    def test_javascript_parse_error_fallback(self):
+    def test_javascript_parse_error_fallback(self, js_chunker):
         """JavaScript parse errors fall back to single chunk."""
-        chunker = TreeSitterChunker("javascript")
         # Invalid JavaScript syntax
         code = "function invalid { syntax here"
-        chunks = chunker.chunk(code, "test.js")
+        chunks = js_chunker.chunk(code, "test.js")
 
         # Should still return a chunk (fallback)
         assert len(chunks) == 1
         assert chunks[0][1]["chunk_type"] == "block"
 
-    def test_javascript_fixture_file(self):
+    def test_javascript_fixture_file(self, js_chunker, sample_js_source):
         """Test chunking the sample.js fixture file."""
-        chunker = TreeSitterChunker("javascript")
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.js"
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
-
-        chunks = chunker.chunk(content, "sample.js")
+        chunks = js_chunker.chunk(sample_js_source, "sample.js")
 
         # Should find multiple functions and classes
         assert len(chunks) > 5
 
         # Check for specific functions
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "calculateSum" in names
-        assert "multiply" in names
-        assert "greet" in names
-        assert "square" in names
-        assert "Calculator" in names
-        assert "MathUtils" in names
-        assert "fetchData" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {
+            "calculateSum",
+            "multiply",
+            "greet",
+            "square",
+            "Calculator",
+            "MathUtils",
+            "fetchData",
+        } <= names
 
         # Verify chunk types
-        function_chunks = [c for c in chunks if c[1]["chunk_type"] == "function"]
-        class_chunks = [c for c in chunks if c[1]["chunk_type"] == "class"]
-        assert len(function_chunks) > 0
-        assert len(class_chunks) > 0
+        counts, _ = _summarize(chunks)
+        assert counts["function"] > 0
+        assert counts["class"] > 0
 
-    def test_javascript_line_numbers(self):
+    def test_javascript_line_numbers(self, js_chunker):
         """Line numbers in JavaScript chunks are correct."""
-        chunker = TreeSitterChunker("javascript")
         content = """// Line 1
 // Line 2
 function firstFunction() {
@@ -259,7 +255,7 @@ function secondFunction() {
     return 2;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         assert len(chunks) == 2
 
         # First function should start around line 3
@@ -274,39 +270,8 @@ function secondFunction() {
 class TestTypeScriptChunking:
     """Tests for TypeScript code chunking."""
 
-    def test_typescript_function_declaration(self):
-        """TypeScript function declarations are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-function greet(name: string): string {
-    return `Hello, ${name}!`;
-}
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "greet"
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "string" in chunks[0][0]  # Type annotation should be included
-
-    def test_typescript_interface_declaration(self):
-        """TypeScript interfaces are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-interface User {
-    id: number;
-    name: string;
-    email: string;
-}
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "User"
-        assert chunks[0][1]["chunk_type"] == "interface"
-        assert "interface User" in chunks[0][0]
-
-    def test_typescript_generic_interface(self):
+    def test_typescript_generic_interface(self, ts_chunker):
         """Generic TypeScript interfaces are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 interface Repository<T> {
     findById(id: number): T | null;
@@ -314,42 +279,14 @@ interface Repository<T> {
     save(item: T): void;
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
         assert len(chunks) == 1
         assert chunks[0][1]["name"] == "Repository"
         assert chunks[0][1]["chunk_type"] == "interface"
         assert "<T>" in chunks[0][0]
 
-    def test_typescript_type_alias(self):
-        """TypeScript type aliases are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-type Status = 'pending' | 'active' | 'inactive';
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "Status"
-        assert chunks[0][1]["chunk_type"] == "type"
-        assert "type Status" in chunks[0][0]
-
-    def test_typescript_complex_type_alias(self):
-        """Complex TypeScript type aliases are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-type ApiResponse<T> = {
-    data: T;
-    status: number;
-    message: string;
-};
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "ApiResponse"
-        assert chunks[0][1]["chunk_type"] == "type"
-
-    def test_typescript_class_with_types(self):
+    def test_typescript_class_with_types(self, ts_chunker):
         """TypeScript classes with type annotations are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 class UserService {
     private users: User[] = [];
@@ -364,20 +301,18 @@ class UserService {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should have class and methods
         assert len(chunks) >= 1
 
         # Check for methods - class may be chunked with methods
         method_chunks = [c for c in chunks if c[1]["chunk_type"] == "function"]
-        method_names = [m[1]["name"] for m in method_chunks]
-        assert "fetchUsers" in method_names
-        assert "findUserById" in method_names
+        method_names = {m[1]["name"] for m in method_chunks}
+        assert {"fetchUsers", "findUserById"} <= method_names
 
-    def test_typescript_generic_class(self):
+    def test_typescript_generic_class(self, ts_chunker):
         """Generic TypeScript classes are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 class DataStore<T> {
     private items: T[] = [];
@@ -391,7 +326,7 @@ class DataStore<T> {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should have class and/or methods - check that generics are preserved
         assert len(chunks) >= 1
@@ -399,37 +334,8 @@ class DataStore<T> {
         has_generic = any("<T>" in chunk[0] or "T[]" in chunk[0] for chunk in chunks)
         assert has_generic, "Generic type parameter should be preserved in chunks"
 
-    def test_typescript_generic_function(self):
-        """Generic TypeScript functions are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-function identity<T>(value: T): T {
-    return value;
-}
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "identity"
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "<T>" in chunks[0][0]
-
-    def test_typescript_arrow_function_with_types(self):
-        """TypeScript arrow functions with type annotations are chunked."""
-        chunker = TreeSitterChunker("typescript")
-        content = """
-const filterUsers = (users: User[], minAge: number): User[] => {
-    return users.filter(user => user.age >= minAge);
-};
-"""
-        chunks = chunker.chunk(content, "test.ts")
-        assert len(chunks) == 1
-        assert chunks[0][1]["name"] == "filterUsers"
-        assert chunks[0][1]["chunk_type"] == "function"
-        assert "User[]" in chunks[0][0]
-
-    def test_typescript_multiple_interfaces_and_types(self):
+    def test_typescript_multiple_interfaces_and_types(self, ts_chunker):
         """Multiple TypeScript interfaces and types are chunked separately."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 interface User {
     id: number;
@@ -445,76 +351,61 @@ interface Product {
 
 type ProductId = string;
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
         assert len(chunks) == 4
 
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "User" in names
-        assert "UserId" in names
-        assert "Product" in names
-        assert "ProductId" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {"User", "UserId", "Product", "ProductId"} <= names
 
         # Check chunk types
-        interface_chunks = [c for c in chunks if c[1]["chunk_type"] == "interface"]
-        type_chunks = [c for c in chunks if c[1]["chunk_type"] == "type"]
-        assert len(interface_chunks) == 2
-        assert len(type_chunks) == 2
+        counts, _ = _summarize(chunks)
+        assert counts["interface"] == 2
+        assert counts["type"] == 2
 
-    def test_typescript_empty_file(self):
+    def test_typescript_empty_file(self, ts_chunker):
         """Empty TypeScript files return no chunks."""
-        chunker = TreeSitterChunker("typescript")
-        chunks = chunker.chunk("", "test.ts")
+        chunks = ts_chunker.chunk("", "test.ts")
         assert len(chunks) == 0
 
-    def test_typescript_parse_error_fallback(self):
+    def test_typescript_parse_error_fallback(self, ts_chunker):
         """TypeScript parse errors fall back to single chunk."""
-        chunker = TreeSitterChunker("typescript")
         # Invalid TypeScript syntax
         code = "interface Invalid { missing brace"
-        chunks = chunker.chunk(code, "test.ts")
+        chunks = ts_chunker.chunk(code, "test.ts")
 
         # Should still return a chunk (fallback)
         assert len(chunks) == 1
         assert chunks[0][1]["chunk_type"] == "block"
 
-    def test_typescript_fixture_file(self):
+    def test_typescript_fixture_file(self, ts_chunker, sample_ts_source):
         """Test chunking the sample.ts fixture file."""
-        chunker = TreeSitterChunker("typescript")
-        fixture_path = Path(__file__).parent / "fixtures" / "sample.ts"
-
-        with open(fixture_path, "r") as f:
-            content = f.read()
-
-        chunks = chunker.chunk(content, "sample.ts")
+        chunks = ts_chunker.chunk(sample_ts_source, "sample.ts")
 
         # Should find many interfaces, types, functions, and classes
         assert len(chunks) > 10
 
         # Check for specific items
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "User" in names
-        assert "Repository" in names
-        assert "Status" in names
-        assert "ApiResponse" in names
-        assert "createUser" in names
-        assert "identity" in names
-        assert "UserService" in names
-        assert "DataStore" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {
+            "User",
+            "Repository",
+            "Status",
+            "ApiResponse",
+            "createUser",
+            "identity",
+            "UserService",
+            "DataStore",
+        } <= names
 
         # Verify chunk types
-        interface_chunks = [c for c in chunks if c[1]["chunk_type"] == "interface"]
-        type_chunks = [c for c in chunks if c[1]["chunk_type"] == "type"]
-        function_chunks = [c for c in chunks if c[1]["chunk_type"] == "function"]
-        class_chunks = [c for c in chunks if c[1]["chunk_type"] == "class"]
+        counts, _ = _summarize(chunks)
+        assert counts["interface"] > 0
+        assert counts["type"] > 0
+        assert counts["function"] > 0
+        assert counts["class"] > 0
 
-        assert len(interface_chunks) > 0
-        assert len(type_chunks) > 0
-        assert len(function_chunks) > 0
-        assert len(class_chunks) > 0
-
-    def test_typescript_abstract_class(self):
+    def test_typescript_abstract_class(self, ts_chunker):
         """TypeScript abstract classes are chunked correctly."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 abstract class Animal {
     constructor(protected name: string) {}
@@ -526,7 +417,7 @@ abstract class Animal {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should have class and methods
         class_chunks = [c for c in chunks if c[1]["chunk_type"] == "class"]
@@ -534,9 +425,8 @@ abstract class Animal {
         assert class_chunks[0][1]["name"] == "Animal"
         assert "abstract class" in class_chunks[0][0]
 
-    def test_typescript_enum(self):
+    def test_typescript_enum(self, ts_chunker):
         """TypeScript enums are handled."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 enum Color {
     Red = 'RED',
@@ -548,15 +438,13 @@ function getColor(): Color {
     return Color.Red;
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
 
         # Should at least find the function
         # Enum handling depends on tree-sitter grammar
-        function_chunks = [c for c in chunks if c[1]["chunk_type"] == "function"]
-        assert len(function_chunks) >= 1
-
-        names = [chunk[1]["name"] for chunk in function_chunks]
-        assert "getColor" in names
+        counts, names_by_type = _summarize(chunks)
+        assert counts["function"] >= 1
+        assert "getColor" in names_by_type["function"]
 
 
 class TestEdgeCases:
@@ -567,9 +455,8 @@ class TestEdgeCases:
         with pytest.raises(ValueError, match="Unsupported language"):
             TreeSitterChunker("ruby")
 
-    def test_javascript_with_jsdoc(self):
+    def test_javascript_with_jsdoc(self, js_chunker):
         """JSDoc comments are included with functions."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 /**
  * Multiply two numbers together.
@@ -582,14 +469,13 @@ function multiply(x, y) {
     return result;
 }
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         assert len(chunks) == 1
         # JSDoc should be part of the function text
         assert chunks[0][1]["name"] == "multiply"
 
-    def test_typescript_exported_types(self):
+    def test_typescript_exported_types(self, ts_chunker):
         """TypeScript export statements with types."""
-        chunker = TreeSitterChunker("typescript")
         content = """
 export interface User {
     id: number;
@@ -604,17 +490,14 @@ export class UserService {
     }
 }
 """
-        chunks = chunker.chunk(content, "test.ts")
+        chunks = ts_chunker.chunk(content, "test.ts")
         assert len(chunks) >= 3
 
-        names = [chunk[1]["name"] for chunk in chunks]
-        assert "User" in names
-        assert "UserId" in names
-        assert "UserService" in names
+        names = {chunk[1]["name"] for chunk in chunks}
+        assert {"User", "UserId", "UserService"} <= names
 
-    def test_nested_arrow_functions(self):
+    def test_nested_arrow_functions(self, js_chunker):
         """Nested arrow functions (only outer should be chunked)."""
-        chunker = TreeSitterChunker("javascript")
         content = """
 const outer = () => {
     const inner = () => {
@@ -623,7 +506,7 @@ const outer = () => {
     return inner();
 };
 """
-        chunks = chunker.chunk(content, "test.js")
+        chunks = js_chunker.chunk(content, "test.js")
         # Should only chunk the outer function
         assert len(chunks) >= 1
         assert chunks[0][1]["name"] == "outer"
@@ -78,6 +78,31 @@ class TestProgressReporter:
         assert events[0].current == 1
         assert events[4].current == 5
 
+    def test_progress_callback_throttled(self):
+        """Callbacks are throttled by min_interval_s, but the final file always emits."""
+        events = []
+        reporter = ProgressReporter(total_files=50, callback=events.append, min_interval_s=60)
+
+        for i in range(50):
+            event = reporter.update(f"file{i}.py")
+
+        # First update emits, the rest are throttled until the last file
+        assert [e.current for e in events] == [1, 50]
+        assert event.current == 50
+
+    def test_progress_event_reused_without_copy(self):
+        """With copy_events=False one event object is updated in place."""
+        seen = []
+        reporter = ProgressReporter(total_files=3, callback=lambda e: seen.append((e, e.current)),
+                                    copy_events=False)
+
+        for i in range(3):
+            reporter.update(f"file{i}.py")
+
+        assert [current for _, current in seen] == [1, 2, 3]
+        assert seen[0][0] is seen[2][0]
+        assert seen[2][0].filename == "file2.py"
+
     def test_format_eta_seconds(self):
         """Format ETA correctly for seconds only."""
         eta_str = ProgressReporter.format_eta(45)
@@ -146,11 +171,11 @@ class TestProgressReporter:
         reporter = ProgressReporter(total_files=100)
 
         # Process files with controlled timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         for i in range(10):
             reporter.update(f"file{i}.py")
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         event = reporter.update("file10.py")
 
         # Files per second should be approximately 11 / elapsed
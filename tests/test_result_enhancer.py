@@ -4,6 +4,9 @@ Unit tests for the result enhancer.
 Tests de-duplication, context expansion, and recency ranking.
 """
 
+import os
+
+import numpy as np
 import pytest
 from pathlib import Path
 from ctxd.models import CodeChunk, SearchResult
@@ -78,6 +81,26 @@ def test_calculate_overlap_complete(enhancer):
     assert overlap == 1.0  # Smaller range (5-10) is 100% contained
 
 
+def test_overlap_matrix_matches_scalar(enhancer):
+    """Test the vectorized overlap matrix agrees with _calculate_overlap."""
+    ranges = [(1, 10), (5, 15), (1, 20), (30, 40), (12, 12)]
+    starts = np.array([s for s, _ in ranges])
+    ends = np.array([e for _, e in ranges])
+
+    matrix = enhancer._overlap_matrix(starts, ends)
+
+    for i, (s1, e1) in enumerate(ranges):
+        for j, (s2, e2) in enumerate(ranges):
+            assert matrix[i, j] == pytest.approx(enhancer._calculate_overlap(s1, e1, s2, e2))
+
+
+def test_ranges_disjoint(enhancer):
+    """Test the start-line sweep detects touching and nested ranges."""
+    assert enhancer._ranges_disjoint(np.array([20, 1, 10]), np.array([25, 5, 15]))
+    assert not enhancer._ranges_disjoint(np.array([10, 1]), np.array([15, 10]))
+    assert not enhancer._ranges_disjoint(np.array([1, 5, 30]), np.array([40, 6, 35]))
+
+
 def test_deduplicate_no_overlaps(enhancer, sample_results):
     """Test de-duplication with no overlapping chunks."""
     # Results are far apart (lines 1-2 and 10-11)
@@ -281,6 +304,41 @@ def test_expand_context_at_file_boundaries(enhancer, temp_dir):
     assert expanded[0].chunk.end_line == 2
 
 
+def test_expand_context_rereads_modified_file(enhancer, temp_dir):
+    """Test cached file lines are invalidated when the file changes."""
+    test_file = temp_dir / "test.py"
+    test_file.write_text("old 1\nold 2\nold 3")
+
+    results = [
+        SearchResult(
+            chunk=CodeChunk(
+                vector=[0.1] * 384,
+                text="old 2",
+                path="test.py",
+                start_line=2,
+                end_line=2,
+                chunk_type="block",
+                name=None,
+                language="python",
+                file_hash="hash1",
+            ),
+            score=0.9
+        ),
+    ]
+
+    expanded = enhancer.expand_context(results, lines_before=1, lines_after=1, project_root=temp_dir)
+    assert "old 1" in expanded[0].chunk.text
+
+    # Rewrite with a distinct mtime so the cache key changes
+    test_file.write_text("new 1\nnew 2\nnew 3")
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    expanded = enhancer.expand_context(results, lines_before=1, lines_after=1, project_root=temp_dir)
+    assert "new 1" in expanded[0].chunk.text
+    assert "old 1" not in expanded[0].chunk.text
+
+
 def test_rerank_by_recency(enhancer):
     """Test recency-based re-ranking."""
     results = [
@@ -97,6 +97,138 @@ def test_delete_by_path(vector_store):
     assert "file2.py" in file_paths
 
 
+def test_delete_by_paths(vector_store):
+    """Test deleting chunks for several file paths at once."""
+    chunks = [
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=f"{name} content",
+            path=name,
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash",
+        )
+        for name in ["file1.py", "file2.py", "it's.py"]
+    ]
+
+    vector_store.add_chunks(chunks)
+
+    deleted = vector_store.delete_by_paths(["file1.py", "it's.py"])
+    assert deleted == 2
+    assert vector_store.get_indexed_files() == {"file2.py"}
+
+    # Empty input is a no-op
+    assert vector_store.delete_by_paths([]) == 0
+
+
+def test_compact_if_fragmented(vector_store):
+    """Test compaction runs only once the fragment count passes the limit."""
+    for i in range(3):
+        vector_store.add_chunks([
+            CodeChunk(
+                vector=[0.1] * 384,
+                text=f"content {i}",
+                path=f"file{i}.py",
+                start_line=1,
+                end_line=1,
+                chunk_type="block",
+                name=None,
+                language="python",
+                file_hash="hash",
+            )
+        ])
+
+    assert vector_store.compact_if_fragmented() is False
+
+    vector_store.max_fragments = 1
+    assert vector_store.compact_if_fragmented() is True
+    assert vector_store.get_indexed_files() == {"file0.py", "file1.py", "file2.py"}
+
+
+def test_float16_vector_storage(temp_dir):
+    """Test vectors stored as float16 still search with scores in [0, 1]."""
+    import pyarrow as pa
+
+    store = VectorStore(temp_dir / "fp16.lance", config={"vector_dtype": "float16"})
+    store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text="def hello(): pass",
+            path="test.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="function",
+            name="hello",
+            language="python",
+            file_hash="hash1",
+        )
+    ])
+
+    assert store.table.schema.field("vector").type.value_type == pa.float16()
+
+    results = store.search([0.1] * 384, limit=1, mode="vector")
+    assert len(results) == 1
+    assert 0.99 < results[0].score <= 1.0
+
+
+def test_invalid_quantization(temp_dir):
+    """Test unsupported quantization schemes are rejected."""
+    assert VectorStore(temp_dir / "q.lance", config={"quantization": "int8"}).quantization == "int8"
+    with pytest.raises(ValueError, match="quantization"):
+        VectorStore(temp_dir / "bad.lance", config={"quantization": "int4"})
+
+
+def test_table_opened_once_across_threads(temp_dir):
+    """Test concurrent first use of a shared store creates a single table."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = VectorStore(temp_dir / "shared.lance")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tables = list(pool.map(lambda _: store.table, range(8)))
+
+    assert all(table is tables[0] for table in tables)
+
+
+def test_get_chunk_vectors_returns_packed_float32(vector_store):
+    """Test stored vectors come back as float32 arrays that CodeChunk accepts as-is."""
+    import numpy as np
+
+    vector = np.zeros(384, dtype=np.float32)
+    vector[0] = 1.0
+    chunk = CodeChunk(
+        vector=vector,
+        text="def hello(): pass",
+        path="test.py",
+        start_line=1,
+        end_line=1,
+        chunk_type="function",
+        name="hello",
+        language="python",
+        file_hash="hash1",
+        chunk_hash="chunk1",
+    )
+    assert isinstance(chunk.vector, np.ndarray)
+    vector_store.add_chunks([chunk])
+
+    reusable = vector_store.get_chunk_vectors("test.py")
+
+    assert list(reusable) == ["chunk1"]
+    assert reusable["chunk1"].dtype == np.float32
+    assert np.array_equal(reusable["chunk1"], vector)
+
+    with pytest.raises(ValueError):
+        CodeChunk(**{**chunk.model_dump(), "vector": np.zeros(3, dtype=np.float32)})
+
+
+def test_invalid_vector_dtype(temp_dir):
+    """Test unsupported vector storage types are rejected."""
+    with pytest.raises(ValueError, match="vector_dtype"):
+        VectorStore(temp_dir / "bad.lance", config={"vector_dtype": "int4"})
+
+
 def test_get_file_hash(vector_store):
     """Test retrieving stored file hash."""
     chunk = CodeChunk(
@@ -123,6 +255,36 @@ def test_get_file_hash_nonexistent(vector_store):
     assert stored_hash is None
 
 
+def test_get_file_hash_cache_tracks_writes(vector_store, make_chunk):
+    """Test cached file hashes follow later adds and deletes."""
+    vector_store.add_chunks([make_chunk(path="a.py", file_hash="hash1")])
+    assert vector_store.get_file_hash("a.py") == "hash1"
+
+    vector_store.delete_by_path("a.py")
+    vector_store.add_chunks([make_chunk(path="a.py", file_hash="hash2"), make_chunk(path="b.py", file_hash="hash3")])
+    assert vector_store.get_file_hash("a.py") == "hash2"
+    assert vector_store.get_file_hash("b.py") == "hash3"
+
+    vector_store.delete_by_paths(["b.py"])
+    assert vector_store.get_file_hash("b.py") is None
+
+
+def test_get_file_hash_follows_other_writers(temp_dir, make_chunk):
+    """Cached file hashes are dropped when another store writes the table."""
+    db_path = temp_dir / "shared.lance"
+    writer = VectorStore(db_path)
+    writer.add_chunks([make_chunk(path="a.py", file_hash="hash1")])
+    reader = VectorStore(db_path, config={"version_check_interval": 0})
+    assert reader.get_file_hash("a.py") == "hash1"
+    assert reader.get_indexed_files() == {"a.py"}
+
+    writer.delete_by_path("a.py")
+    writer.add_chunks([make_chunk(path="a.py", file_hash="hash2"), make_chunk(path="b.py", file_hash="hash3")])
+
+    assert reader.get_file_hash("a.py") == "hash2"
+    assert reader.get_indexed_files() == {"a.py", "b.py"}
+
+
 def test_get_stats_empty(vector_store):
     """Test stats on empty database."""
     stats = vector_store.get_stats()
@@ -180,6 +342,74 @@ def test_get_stats_with_data(vector_store):
     assert "javascript" in stats.languages
 
 
+def test_get_stats_tracks_writes(vector_store, make_chunk):
+    """Test stats loaded once stay current across adds and deletes."""
+    vector_store.add_chunks([make_chunk(path="a.py", text="abc")])
+    assert vector_store.get_stats().total_chunks == 1
+
+    vector_store.add_chunks([
+        make_chunk(path="a.py", text="de"),
+        make_chunk(path="b.js", language="javascript", text="f"),
+    ])
+    stats = vector_store.get_stats()
+    assert stats.total_files == 2
+    assert stats.total_chunks == 3
+    assert stats.total_size_bytes == 6
+    assert stats.languages == {"python": 2, "javascript": 1}
+
+    vector_store.delete_by_path("a.py")
+    stats = vector_store.get_stats()
+    assert stats.total_files == 1
+    assert stats.languages == {"javascript": 1}
+
+
+def test_get_stats_follows_other_writers(temp_dir, make_chunk):
+    """Loaded stats are reloaded after another store writes the table."""
+    db_path = temp_dir / "shared.lance"
+    writer = VectorStore(db_path)
+    writer.add_chunks([make_chunk(path="a.py")])
+    reader = VectorStore(db_path, config={"version_check_interval": 0})
+    assert reader.get_stats().total_files == 1
+
+    writer.add_chunks([make_chunk(path="b.py"), make_chunk(path="c.py")])
+    writer.delete_by_path("a.py")
+
+    stats = reader.get_stats()
+    assert stats.total_files == 2
+    assert stats.total_chunks == 2
+
+
+def test_get_stats_tracks_branch_deletes(vector_store, monkeypatch):
+    """Test a branch delete updates loaded stats instead of forcing a rescan."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=text,
+            path=path,
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash",
+            branch=branch,
+        )
+        for path, text, branch in [("a.py", "abc", "main"), ("a.py", "de", "feature"), ("b.py", "f", "feature")]
+    ])
+    assert vector_store.get_stats().total_chunks == 3
+
+    def fail_rescan():
+        raise AssertionError("stats were rescanned")
+
+    monkeypatch.setattr(vector_store, "_load_file_stats", fail_rescan)
+    assert vector_store.delete_by_branch("feature") == 2
+
+    stats = vector_store.get_stats()
+    assert stats.total_files == 1
+    assert stats.total_chunks == 1
+    assert stats.total_size_bytes == 3
+
+
 def test_search_with_file_filter(vector_store):
     """Test searching with file pattern filter."""
     chunks = [
@@ -217,6 +447,115 @@ def test_search_with_file_filter(vector_store):
     assert all(".py" in r.chunk.path for r in results)
 
 
+def test_build_filter_is_cached_and_translates_globs():
+    """Test filter predicates are built once per filter set."""
+    from ctxd.store import _build_filter
+
+    _build_filter.cache_clear()
+    first = _build_filter("src/*.py", "main", None, None, ("function",), None)
+    second = _build_filter("src/*.py", "main", None, None, ("function",), None)
+
+    assert first is second
+    assert _build_filter.cache_info().hits == 1
+    assert "path LIKE '%src/%.py%'" in first
+    assert "branch = 'main'" in first
+    assert "chunk_type IN ('function')" in first
+    assert _build_filter(None, None, None, None, None, None) is None
+
+
+def test_build_filter_uses_path_columns():
+    """Test simple extensions and top-level directories become equality filters."""
+    from ctxd.store import _build_filter
+
+    predicate = _build_filter(None, None, (".py", ".d.ts"), ("src/", "lib/core/"), None, None,
+                              path_columns=True)
+
+    assert "path_ext IN ('.py')" in predicate
+    assert r"regexp_match(path, '(?:\.d\.ts)$')" in predicate
+    assert "path_dir IN ('src/')" in predicate
+    assert "path LIKE 'lib/core/%'" in predicate
+
+
+def test_path_columns_derived_on_insert(vector_store):
+    """Test path_ext/path_dir are stored but kept out of results."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=text,
+            path=path,
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+        )
+        for path, text in [("src/app/main.py", "a"), ("setup.py", "b"), ("src/ui.ts", "c")]
+    ])
+
+    rows = vector_store.table.to_lance().to_table(columns=["path", "path_ext", "path_dir"]).to_pylist()
+    assert {(r["path"], r["path_ext"], r["path_dir"]) for r in rows} == {
+        ("src/app/main.py", ".py", "src/"),
+        ("setup.py", ".py", ""),
+        ("src/ui.ts", ".ts", "src/"),
+    }
+
+    results = vector_store.search([0.1] * 384, limit=10, mode="vector",
+                                  extensions=[".py"], directories=["src/"])
+    assert [r.chunk.path for r in results] == ["src/app/main.py"]
+
+
+def test_fts_query_strips_query_syntax():
+    """Test FTS query text is reduced to plain terms and cached."""
+    from ctxd.store import _fts_query
+
+    assert _fts_query("parse(config) a::b") == "parse config a b"
+    assert _fts_query("authenticate") == "authenticate"
+    assert _fts_query("user_name.field") == "user_name.field"
+    assert _fts_query("parse(config) a::b") is _fts_query("parse(config) a::b")
+
+
+def test_build_filter_matches_extensions_with_one_regex():
+    """Test extensions compile to a single escaped suffix pattern."""
+    from ctxd.store import _build_filter
+
+    predicate = _build_filter(None, None, (".py", ".d.ts"), ("src/",), None, None)
+
+    assert predicate.count("regexp_match") == 1
+    assert r"regexp_match(path, '(?:\.py|\.d\.ts)$')" in predicate
+    assert "path LIKE 'src/%'" in predicate
+
+
+def test_repeated_vector_search_hits_cache(vector_store):
+    """Test identical vector queries are served from the search cache."""
+    import numpy as np
+
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text="content",
+            path="test.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+        )
+    ])
+
+    first = vector_store.search([0.1] * 384, limit=5, extensions=[".py"])
+    second = vector_store.search(np.full(384, 0.1, dtype=np.float32), limit=5, extensions=[".py"])
+
+    assert second is first
+    assert vector_store._cached_search.cache_info().hits == 1
+
+    # A vector sharing a prefix is a different query
+    other = [0.1] * 5 + [0.2] * 379
+    vector_store.search(other, limit=5, extensions=[".py"])
+    assert vector_store._cached_search.cache_info().misses == 2
+
+
 def test_search_with_min_score(vector_store):
     """Test search with minimum score threshold."""
     chunks = [
@@ -236,7 +575,7 @@ def test_search_with_min_score(vector_store):
     vector_store.add_chunks(chunks)
 
     # Search with very high min_score (should filter out results)
-    query_vector = [0.5] * 384  # Very different vector
+    query_vector = [0.1, -0.1] * 192  # Orthogonal to the stored vector
     results = vector_store.search(query_vector, limit=10, min_score=0.99)
 
     # Should get few or no results due to high threshold
@@ -324,6 +663,53 @@ def test_delete_by_branch(vector_store):
     assert stats.total_chunks == 1
 
 
+def test_delete_by_branch_without_matches_skips_commit(vector_store):
+    """Deleting a branch with no chunks does not write a new table version."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text="main content",
+            path="file.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+            branch="main",
+        )
+    ])
+    version = vector_store.table.version
+
+    assert vector_store.delete_by_branch("it's-missing") == 0
+    assert vector_store.table.version == version
+    assert vector_store.get_stats().total_chunks == 1
+
+
+def test_add_chunks_clusters_rows_by_branch(vector_store):
+    """Rows of one write are stored grouped by branch, then path."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=f"{branch} {path}",
+            path=path,
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+            branch=branch,
+        )
+        for branch, path in [("main", "b.py"), ("feature", "a.py"), ("main", "a.py"), ("feature", "b.py")]
+    ])
+
+    rows = vector_store.table.to_lance().to_table(columns=["branch", "path"]).to_pylist()
+    assert [(r["branch"], r["path"]) for r in rows] == [
+        ("feature", "a.py"), ("feature", "b.py"), ("main", "a.py"), ("main", "b.py"),
+    ]
+
+
 def test_get_indexed_files(vector_store):
     """Retrieve set of indexed file paths (Phase 3)."""
     # Add chunks for multiple files
@@ -373,6 +759,10 @@ def test_get_indexed_files(vector_store):
     assert "file2.py" in files
     assert len(files) == 2
 
+    # Later calls are answered from the hash cache and follow deletes
+    vector_store.delete_by_path("file2.py")
+    assert vector_store.get_indexed_files() == {"file1.py"}
+
 
 def test_get_indexed_files_empty(vector_store):
     """Return empty set when no files indexed (Phase 3)."""
@@ -624,6 +1014,60 @@ def test_search_hybrid_mode(vector_store):
     assert len(results) > 0
 
 
+def test_hybrid_search_scales_fused_scores(vector_store):
+    """A chunk ranked first by both vector and keyword search scores 1.0."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text="def authenticate_user(username, password):",
+            path="auth.py",
+            start_line=1,
+            end_line=5,
+            chunk_type="function",
+            name="authenticate_user",
+            language="python",
+            file_hash="hash1",
+        )
+    ])
+
+    results = vector_store.search(
+        query_text="authenticate_user",
+        query_vector=[0.1] * 384,
+        limit=10,
+        mode="hybrid",
+        min_score=0.3,
+    )
+
+    assert len(results) == 1
+    assert results[0].score == pytest.approx(1.0)
+
+
+def test_hybrid_search_applies_fts_weight(vector_store, make_chunk):
+    """fts_weight shifts the fused ranking between vector and keyword matches."""
+    query_vector = [1.0] + [0.0] * 383
+    vector_store.add_chunks([
+        make_chunk(path="semantic.py", vector=query_vector, text="def check_login(name, secret):"),
+        make_chunk(
+            path="keyword.py",
+            vector=[0.0, 1.0] + [0.0] * 382,
+            text="def authenticate_user(username, password):",
+        ),
+    ])
+
+    def top_path(fts_weight):
+        results = vector_store.search(
+            query_text="authenticate_user",
+            query_vector=query_vector,
+            limit=10,
+            mode="hybrid",
+            fts_weight=fts_weight,
+        )
+        return results[0].chunk.path
+
+    assert top_path(0.0) == "semantic.py"
+    assert top_path(0.9) == "keyword.py"
+
+
 def test_search_with_extension_filter(vector_store):
     """Test filtering by file extensions (Phase 4)."""
     chunks = [
@@ -888,3 +1332,515 @@ def test_search_with_multiple_filters(vector_store):
     # Should only get Python functions from src/
     assert len(results) == 1
     assert results[0].chunk.name == "py_func"
+
+
+def test_vector_index_not_built_below_threshold(vector_store):
+    """Small tables are searched with an exact flat scan, not an IVF-PQ index."""
+    chunk = CodeChunk(
+        vector=[0.1] * 384,
+        text="content",
+        path="test.py",
+        start_line=1,
+        end_line=1,
+        chunk_type="block",
+        name=None,
+        language="python",
+        file_hash="hash1",
+    )
+
+    vector_store.add_chunks([chunk])
+
+    assert vector_store.index_threshold == 50000
+    assert vector_store._has_vector_index is False
+
+
+def _indexed_store(db_path):
+    """Write enough random chunks to db_path to build an ANN vector index."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    store = VectorStore(db_path, config={"index_threshold": 256})
+    store.add_chunks([
+        CodeChunk(
+            vector=vector,
+            text=f"chunk {i}",
+            path=f"file{i}.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+        )
+        for i, vector in enumerate(rng.standard_normal((512, 384)).astype(np.float32))
+    ])
+    assert store._has_vector_index is True
+    return store
+
+
+def test_vector_index_found_by_reader(temp_dir):
+    """A store that never writes resolves the existing vector index on first search."""
+    _indexed_store(temp_dir / "indexed.lance")
+
+    reader = VectorStore(temp_dir / "indexed.lance")
+    assert reader._has_vector_index is None
+
+    reader.search([0.1] * 384, limit=3, mode="vector")
+
+    assert reader._has_vector_index is True
+
+
+def test_compact_folds_new_rows_into_index(temp_dir, make_chunk):
+    """Rows added after the vector index is built are indexed once enough pile up."""
+    store = _indexed_store(temp_dir / "indexed.lance")
+    store.add_chunks([make_chunk(path=f"new{i}.py") for i in range(8)])
+    assert store._unindexed_rows() == 8
+
+    store.max_unindexed_rows = 16
+    assert store.compact_if_fragmented() is False
+
+    store.max_unindexed_rows = 8
+    assert store.compact_if_fragmented() is True
+    assert store._unindexed_rows() == 0
+    assert store._has_vector_index is True
+
+
+def test_reader_rescores_indexed_candidates(temp_dir, monkeypatch):
+    """A second store on an indexed table over-fetches and re-ranks exactly."""
+    import numpy as np
+
+    writer = _indexed_store(temp_dir / "indexed.lance")
+    query = writer.table.to_lance().to_table(columns=["vector"]).column("vector")[7].as_py()
+
+    reader = VectorStore(temp_dir / "indexed.lance")
+    calls = []
+
+    def spy(candidates, query_vector, limit, *args, **kwargs):
+        calls.append((candidates.num_rows, limit))
+        return VectorStore._rescore_exact(candidates, query_vector, limit, *args, **kwargs)
+
+    monkeypatch.setattr(reader, "_rescore_exact", spy)
+    results = reader.search(np.asarray(query, dtype=np.float32), limit=3, mode="vector", use_cache=False)
+
+    assert len(calls) == 1
+    num_candidates, limit = calls[0]
+    assert limit == 3
+    assert 3 < num_candidates <= 3 * reader.refine_factor
+    assert results[0].chunk.path == "file7.py"
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_scalar_indexes_built_above_threshold(vector_store):
+    """Filter columns are indexed once the table passes index_threshold."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=f"content {i}",
+            path=f"src/file{i}.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="function",
+            name=None,
+            language="python",
+            file_hash="hash1",
+            branch="main",
+        )
+        for i in range(3)
+    ])
+    assert vector_store._has_scalar_indexes is False
+
+    vector_store.index_threshold = 1
+    vector_store._maybe_build_scalar_indexes()
+
+    assert vector_store._has_scalar_indexes is True
+    indexed = {col for idx in vector_store.table.list_indices() for col in idx.columns}
+    assert {"path", "language", "chunk_type", "branch"} <= indexed
+
+    results = vector_store.search([0.1] * 384, limit=10, languages=["python"], branch_filter="main")
+    assert len(results) == 3
+
+
+def test_failed_scalar_index_is_retried(vector_store, make_chunk, monkeypatch):
+    """A column whose index fails to build is retried later; built ones are kept."""
+    vector_store.add_chunks([make_chunk(path=f"src/file{i}.py") for i in range(3)])
+    vector_store.index_threshold = 1
+    table = vector_store.table
+    create_scalar_index = table.create_scalar_index
+    attempts = []
+
+    def flaky_create(column, **kwargs):
+        attempts.append(column)
+        if column == "language" and attempts.count("language") == 1:
+            raise OSError("transient failure")
+        return create_scalar_index(column, **kwargs)
+
+    monkeypatch.setattr(table, "create_scalar_index", flaky_create)
+
+    vector_store._maybe_build_scalar_indexes()
+    assert vector_store._has_scalar_indexes is False
+
+    attempts.clear()
+    vector_store._maybe_build_scalar_indexes()
+    assert attempts == ["language"]
+    assert vector_store._has_scalar_indexes is True
+
+
+def test_estimate_selectivity(vector_store, make_chunk):
+    """Selectivity estimates come from per-value counts and reset on writes."""
+    vector_store.add_chunks([
+        make_chunk(path="file0", language="python", chunk_type="function"),
+        make_chunk(path="file1", language="python", chunk_type="class"),
+        make_chunk(path="file2", language="python", chunk_type="function"),
+        make_chunk(path="file3", language="javascript", chunk_type="function"),
+    ])
+
+    assert vector_store._estimate_selectivity(None, None, None) == 1.0
+    assert vector_store._estimate_selectivity(None, None, ["python"]) == pytest.approx(0.75)
+    assert vector_store._estimate_selectivity(None, ["class"], ["javascript"]) == pytest.approx(0.25 * 0.25)
+    assert vector_store._estimate_selectivity("main", None, None) == 0.0
+
+    vector_store.add_chunks([make_chunk(path="file4", language="go", chunk_type="function")])
+    assert vector_store._filter_counts is None
+    assert vector_store._estimate_selectivity(None, None, ["go"]) == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize("selectivity, prefilter", [(0.5, False), (0.01, True)])
+def test_indexed_search_filter_plan(vector_store, make_chunk, monkeypatch, selectivity, prefilter):
+    """Broad filters on an indexed table post-filter the ANN candidates; narrow ones pre-filter."""
+    from ctxd.store import _POSTFILTER_MIN_SELECTIVITY
+
+    assert (selectivity >= _POSTFILTER_MIN_SELECTIVITY) is not prefilter
+    vector_store.add_chunks([make_chunk(path=f"file{i}.py") for i in range(3)])
+    monkeypatch.setattr(vector_store, "_vector_index_ready", lambda: True)
+    monkeypatch.setattr(vector_store, "_estimate_selectivity", lambda *args: selectivity)
+
+    where_calls = []
+    table = vector_store.table
+    search = table.search
+
+    def recording_search(*args, **kwargs):
+        query = search(*args, **kwargs)
+        where = query.where
+
+        def recording_where(predicate, **where_kwargs):
+            where_calls.append(where_kwargs)
+            return where(predicate, **where_kwargs)
+
+        query.where = recording_where
+        return query
+
+    monkeypatch.setattr(table, "search", recording_search)
+    results = vector_store.search([0.1] * 384, limit=2, mode="vector", languages=["python"], use_cache=False)
+
+    assert where_calls == [{"prefilter": prefilter}]
+    assert len(results) == 2
+
+
+def test_vectors_normalized_at_ingest(vector_store):
+    """Stored vectors are unit-length so dot product equals cosine similarity."""
+    chunk = CodeChunk(
+        vector=[0.5] * 384,
+        text="content",
+        path="test.py",
+        start_line=1,
+        end_line=1,
+        chunk_type="block",
+        name=None,
+        language="python",
+        file_hash="hash1",
+    )
+
+    vector_store.add_chunks([chunk])
+
+    # Same direction, different magnitude: cosine similarity of 1
+    results = vector_store.search([0.1] * 384, limit=1, mode="vector", include_vector=True)
+    assert len(results) == 1
+    assert results[0].score > 0.99
+    assert abs(sum(x * x for x in results[0].chunk.vector) - 1.0) < 1e-3
+
+
+def test_search_omits_vectors_by_default(vector_store):
+    """Search results skip the vector payload unless it is requested."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1] * 384,
+            text="def hello(): pass",
+            path="test.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="function",
+            name="hello",
+            language="python",
+            file_hash="hash1",
+        )
+    ])
+
+    results = vector_store.search([0.1] * 384, limit=1, mode="vector")
+    assert results[0].chunk.vector is None
+    assert results[0].chunk.path == "test.py"
+    assert results[0].chunk.name == "hello"
+
+    results = vector_store.search([0.1] * 384, limit=1, mode="vector", include_vector=True)
+    assert len(results[0].chunk.vector) == 384
+
+
+def test_search_results_share_categorical_strings(vector_store):
+    """Results from one file reuse a single string object per categorical value."""
+    vector_store.add_chunks([
+        CodeChunk(
+            vector=[0.1 * (i + 1)] * 384,
+            text=f"chunk {i}",
+            path="src/shared.py",
+            start_line=i + 1,
+            end_line=i + 1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+            branch="main",
+        )
+        for i in range(2)
+    ])
+
+    results = vector_store.search([0.1] * 384, limit=2, mode="vector", languages=["python"])
+
+    assert len(results) == 2
+    first, second = results[0].chunk, results[1].chunk
+    assert first.path is second.path
+    assert first.language is second.language
+    assert first.branch is second.branch
+
+
+def test_small_table_searched_by_brute_force(vector_store, make_chunk):
+    """Unfiltered searches on small tables score an in-memory matrix, refreshed on writes."""
+    vector_store.add_chunks([make_chunk(path="file0.py", vector=[1.0] + [0.0] * 383)])
+    results = vector_store.search([1.0] + [0.0] * 383, limit=5, mode="vector", use_cache=False)
+    assert [r.chunk.path for r in results] == ["file0.py"]
+    assert vector_store._flat_snapshot is not None
+
+    vector_store.add_chunks([make_chunk(path="file1.py", vector=[0.0, 1.0] + [0.0] * 382)])
+    assert vector_store._flat_snapshot is None
+
+    results = vector_store.search([0.0, 1.0] + [0.0] * 382, limit=5, mode="vector", use_cache=False)
+    assert [r.chunk.path for r in results] == ["file1.py", "file0.py"]
+    assert results[0].score == pytest.approx(1.0)
+    assert results[1].score == pytest.approx(0.0)
+
+
+def test_flat_snapshot_follows_other_writers(temp_dir, make_chunk):
+    """A searching store drops its snapshot and cached results after another store writes."""
+    db_path = temp_dir / "shared.lance"
+    writer = VectorStore(db_path)
+    writer.add_chunks([make_chunk(path="old.py")])
+    reader = VectorStore(db_path, config={"version_check_interval": 0})
+    assert [r.chunk.path for r in reader.search([0.1] * 384, limit=5, mode="vector")] == ["old.py"]
+    assert reader._flat_snapshot is not None
+
+    writer.delete_by_path("old.py")
+    writer.add_chunks([make_chunk(path="new.py")])
+
+    results = reader.search([0.1] * 384, limit=5, mode="vector")
+    assert [r.chunk.path for r in results] == ["new.py"]
+
+
+def test_chunks_to_arrow_builds_columnar_table(vector_store):
+    """Chunks are converted to typed Arrow columns with normalized vectors."""
+    import numpy as np
+
+    chunks = [
+        CodeChunk(
+            vector=[float(i + 1)] * 384,
+            text=f"chunk {i}",
+            path=f"file{i}.py",
+            start_line=1,
+            end_line=2,
+            chunk_type="block",
+            name=None if i else "first",
+            language="python",
+            file_hash=f"hash{i}",
+        )
+        for i in range(3)
+    ]
+    schema = vector_store.table.schema
+
+    table = VectorStore._chunks_to_arrow(chunks, schema)
+
+    assert table.schema == schema
+    assert table.num_rows == 3
+    assert table.column("path").to_pylist() == ["file0.py", "file1.py", "file2.py"]
+    assert table.column("name").to_pylist() == ["first", None, None]
+    vectors = table.column("vector").combine_chunks().flatten().to_numpy().reshape(3, -1)
+    assert vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+
+
+def test_chunks_to_arrow_checks_vector_shape_once(vector_store):
+    """Unvalidated chunks with the wrong dimension are rejected for the whole batch."""
+    import numpy as np
+
+    chunk = CodeChunk.model_construct(
+        vector=np.ones(3, dtype=np.float32),
+        text="bad",
+        path="bad.py",
+        start_line=1,
+        end_line=1,
+        chunk_type="block",
+        name=None,
+        language="python",
+        file_hash="hash1",
+    )
+
+    with pytest.raises(ValueError, match="384-dim"):
+        VectorStore._chunks_to_arrow([chunk], vector_store.table.schema)
+
+
+def test_rescore_exact_orders_candidates_by_dot_product():
+    """ANN candidates are re-ranked by exact score and trimmed to the limit."""
+    import numpy as np
+    import pyarrow as pa
+
+    vectors = [[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]]
+    candidates = pa.table({
+        "vector": pa.array(vectors, type=pa.list_(pa.float32(), 2)),
+        "path": ["a.py", "b.py", "c.py"],
+        "_distance": [0.9, 0.1, 0.5],  # Approximate (wrong) PQ distances
+    })
+
+    rows = VectorStore._rescore_exact(candidates, np.array([0.0, 1.0], dtype=np.float32), limit=2)
+
+    assert [row["path"] for row in rows] == ["b.py", "c.py"]
+    assert rows[0]["_distance"] == pytest.approx(0.0)
+    assert rows[1]["_distance"] == pytest.approx(0.2)
+
+
+def test_rescore_exact_drops_candidates_below_min_score():
+    """Candidates under min_score are dropped before rows are materialized."""
+    import numpy as np
+    import pyarrow as pa
+
+    vectors = [[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]]
+    candidates = pa.table({
+        "vector": pa.array(vectors, type=pa.list_(pa.float32(), 2)),
+        "path": ["a.py", "b.py", "c.py"],
+        "_distance": [0.9, 0.1, 0.5],
+    })
+
+    rows = VectorStore._rescore_exact(
+        candidates, np.array([0.0, 1.0], dtype=np.float32), limit=3, min_score=0.7
+    )
+
+    assert [row["path"] for row in rows] == ["b.py", "c.py"]
+
+
+def test_mask_min_score_filters_columnar_rows():
+    """Rows under min_score are dropped from the Arrow table before conversion."""
+    import pyarrow as pa
+
+    rows = pa.table({"path": ["a.py", "b.py", "c.py"], "_score": [0.9, 0.2, None]})
+
+    assert VectorStore._mask_min_score(rows, "_score", 0.5).column("path").to_pylist() == ["a.py"]
+    assert VectorStore._mask_min_score(rows, "_score", 0.0).num_rows == 3
+    assert VectorStore._mask_min_score(rows, "_relevance", 0.5).num_rows == 0
+
+
+def test_top_k_scores_blocked_matches_full_sort():
+    """Block-wise top-k agrees with scoring every row at once."""
+    import numpy as np
+    from ctxd.store import _top_k_scores
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((1000, 16)).astype(np.float32)
+    query = rng.standard_normal(16).astype(np.float32)
+    expected = np.argsort(-(vectors @ query))[:10]
+
+    idx, scores = _top_k_scores(vectors, query, 10, block_rows=64)
+
+    assert list(idx) == list(expected)
+    assert np.allclose(scores, (vectors @ query)[expected])
+
+    idx, scores = _top_k_scores(vectors, query, 10, min_score=1e9, block_rows=64)
+    assert len(idx) == 0
+
+
+def test_hamming_distances_on_sign_bits():
+    """Sign-bit codes are 1/8 byte per dimension and Hamming counts sign flips."""
+    import numpy as np
+    from ctxd.store import _binarize, _hamming_distances
+
+    vectors = np.array([[0.5] * 384, [-0.5] * 384, [0.5] * 192 + [-0.5] * 192], dtype=np.float32)
+    bits = _binarize(vectors)
+
+    assert bits.shape == (3, 48)
+    assert list(_hamming_distances(bits, _binarize(vectors[0]))) == [0, 384, 192]
+
+
+def test_binary_first_pass_keeps_best_match(temp_dir):
+    """With binary_oversample, brute-force search re-ranks Hamming candidates exactly."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((50, 384)).astype(np.float32)
+    store = VectorStore(temp_dir / "binary.lance", config={"binary_oversample": 2})
+    store.add_chunks([
+        CodeChunk(
+            vector=vector,
+            text=f"chunk {i}",
+            path=f"file{i}.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash="hash1",
+        )
+        for i, vector in enumerate(vectors)
+    ])
+
+    results = store.search(vectors[7].tolist(), limit=3, mode="vector")
+
+    assert store._flat_snapshot[2] is not None
+    assert len(results) == 3
+    assert results[0].chunk.path == "file7.py"
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_vector_search_prefilters_before_limit(vector_store):
+    """Filters are applied before the top-k cut, so limit is filled from matches."""
+    chunks = [
+        CodeChunk(
+            vector=[0.1] * 384,
+            text=f"python code {i}",
+            path=f"file{i}.py",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="python",
+            file_hash=f"hash{i}",
+        )
+        for i in range(5)
+    ]
+    chunks.append(
+        CodeChunk(
+            vector=[0.1, 0.0] * 192,  # Less similar to the query than every python chunk
+            text="javascript code",
+            path="file.js",
+            start_line=1,
+            end_line=1,
+            chunk_type="block",
+            name=None,
+            language="javascript",
+            file_hash="hash_js",
+        )
+    )
+    vector_store.add_chunks(chunks)
+
+    results = vector_store.search(
+        query_vector=[0.1] * 384,
+        limit=1,
+        languages=["javascript"],
+        mode="vector",
+    )
+
+    assert len(results) == 1
+    assert results[0].chunk.language == "javascript"